@@ -0,0 +1,8 @@
+"""Performance benchmarks for thomas_utils (not installed with the package).
+
+- corpus: deterministic synthetic PDF / PPTX generator
+- stub_llm: offline OpenAI-compatible endpoint for the LLM paths
+- run: times every engine and CLI path and checks a JSON baseline
+  (python -m benchmarks)
+- bench_tables: PPTX table renderer micro-benchmark
+"""
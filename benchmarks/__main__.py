@@ -0,0 +1,8 @@
+"""Allow running the suite as python -m benchmarks ..."""
+
+import sys
+
+from benchmarks.run import main
+
+if __name__ == "__main__":
+    sys.exit(main())
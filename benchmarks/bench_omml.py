@@ -0,0 +1,152 @@
+"""Benchmark: built-in OMML -> LaTeX on an equation-heavy deck.
+
+Usage:
+    python benchmarks/bench_omml.py [--slides 200] [--per-slide 4] [--repeat 3]
+
+Builds a deck whose text boxes carry equations drawn from a small pool
+(fractions, radicals, sums, integrals, matrices, accents, scripts, limits),
+so most equations repeat, as in real lecture decks. Times translating every
+m:oMath with and without the memo, then whole-deck conversion with both
+PPTX engines, reporting best wall time and peak traced allocations.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+_NS = (
+    'xmlns:a14="http://schemas.microsoft.com/office/drawing/2010/main" '
+    'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math"'
+)
+
+
+def _r(text: str) -> str:
+    return f"<m:r><m:t>{text}</m:t></m:r>"
+
+
+# 강의 자료에 흔한 수식 모음 (슬라이드마다 돌려 가며 반복)
+_POOL = [
+    "<m:f><m:num>" + _r("a+b") + "</m:num><m:den>" + _r("2") + "</m:den></m:f>",
+    "<m:rad><m:deg>" + _r("3") + "</m:deg><m:e>" + _r("x") + "</m:e></m:rad>",
+    '<m:nary><m:naryPr><m:chr m:val="∑"/></m:naryPr><m:sub>'
+    + _r("i=1")
+    + "</m:sub><m:sup>"
+    + _r("n")
+    + "</m:sup><m:e><m:sSup><m:e>"
+    + _r("i")
+    + "</m:e><m:sup>"
+    + _r("2")
+    + "</m:sup></m:sSup></m:e></m:nary>",
+    "<m:nary><m:sub>"
+    + _r("0")
+    + "</m:sub><m:sup>"
+    + _r("∞")
+    + "</m:sup><m:e><m:sSup><m:e>"
+    + _r("e")
+    + "</m:e><m:sup>"
+    + _r("-x")
+    + "</m:sup></m:sSup>"
+    + _r("dx")
+    + "</m:e></m:nary>",
+    "<m:d><m:e><m:m>"
+    + "".join("<m:mr>" + "".join(f"<m:e>{_r(v)}</m:e>" for v in row) + "</m:mr>" for row in ("ab", "cd"))
+    + "</m:m></m:e></m:d>",
+    '<m:acc><m:accPr><m:chr m:val="⃗"/></m:accPr><m:e>' + _r("v") + "</m:e></m:acc>" + _r("=") + _r("α"),
+    "<m:sSubSup><m:e>" + _r("x") + "</m:e><m:sub>" + _r("i") + "</m:sub><m:sup>" + _r("2") + "</m:sup></m:sSubSup>",
+    "<m:func><m:fName><m:limLow><m:e>"
+    + _r("lim")
+    + "</m:e><m:lim>"
+    + _r("n→∞")
+    + "</m:lim></m:limLow></m:fName><m:e><m:f><m:num>"
+    + _r("1")
+    + "</m:num><m:den>"
+    + _r("n")
+    + "</m:den></m:f></m:e></m:func>",
+]
+
+
+def _make_deck(path: Path, n_slides: int, per_slide: int) -> None:
+    from lxml import etree
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    k = 0
+    for s in range(n_slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Equations {s}"
+        for e in range(per_slide):
+            tf = slide.shapes.add_textbox(Inches(0.5), Inches(1.5 + e), Inches(9), Inches(0.8)).text_frame
+            tf.text = f"Equation {e}"
+            xml = f"<a14:m {_NS}><m:oMathPara><m:oMath>{_POOL[k % len(_POOL)]}</m:oMath></m:oMathPara></a14:m>"
+            tf.paragraphs[0]._p.append(etree.fromstring(xml))
+            k += 1
+    prs.save(str(path))
+
+
+def _measure(fn, items, repeat: int, setup=None):
+    """(best wall seconds over repeat runs, peak traced bytes of one extra run)."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    if setup:
+        setup()
+    # tracemalloc은 실행을 크게 느리게 하므로 시간 측정과 분리
+    tracemalloc.start()
+    for item in items:
+        fn(item)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=200)
+    parser.add_argument("--per-slide", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from pptx import Presentation
+
+    from thomas_utils.converters import omml
+    from thomas_utils.converters.pptx_fast_impl import convert as convert_fast
+    from thomas_utils.converters.pptx_impl import convert as convert_pptx
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "equations.pptx"
+        _make_deck(deck, args.slides, args.per_slide)
+        prs = Presentation(str(deck))
+        omaths = [m for slide in prs.slides for m in slide._element.iter(omml._M + "oMath")]
+
+        clear = omml._convert_xml.cache_clear
+        translate = {
+            "memoized": _measure(omml.to_latex, omaths, args.repeat, setup=clear),
+            "uncached": _measure(lambda m: omml._children(m).strip(), omaths, args.repeat),
+        }
+        decks = {
+            "python-pptx": _measure(convert_pptx, [deck], args.repeat, setup=clear),
+            "fast": _measure(convert_fast, [deck], args.repeat, setup=clear),
+        }
+
+    print(f"{len(omaths)} equations on {args.slides} slides ({len(_POOL)} distinct)")
+    for name, (secs, peak) in translate.items():
+        print(f"  {name:11s} {secs * 1000:8.1f} ms  {len(omaths) / secs:8.0f} eq/s  peak {peak / 1024:8.0f} KiB")
+    print(f"  memo speedup: {translate['uncached'][0] / translate['memoized'][0]:.1f}x")
+    for name, (secs, peak) in decks.items():
+        print(f"  deck {name:11s} {secs * 1000:8.1f} ms  {args.slides / secs:8.0f} slides/s  peak {peak / 1024:8.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
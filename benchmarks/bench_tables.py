@@ -0,0 +1,98 @@
+"""Benchmark: native PPTX table renderer vs. the previous pandas/tabulate path.
+
+Usage:
+    python benchmarks/bench_tables.py [--tables 300] [--rows 12] [--cols 6] [--repeat 3]
+
+Builds a deck with many tables, then times rendering every table with
+pptx_impl._table_to_markdown and (if pandas and tabulate are installed) with
+pandas.DataFrame.to_markdown, reporting best wall time and peak traced allocations.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _make_deck(path: Path, n_tables: int, rows: int, cols: int) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for t in range(n_tables):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        table = slide.shapes.add_table(rows, cols, Inches(0.5), Inches(0.5), Inches(9), Inches(6)).table
+        for r in range(rows):
+            for c in range(cols):
+                table.cell(r, c).text = f"t{t} r{r} c{c} 값"
+    prs.save(str(path))
+
+
+def _pandas_render(table) -> str:
+    import pandas as pd
+
+    rows = [[(cell.text or "").replace("|", "\\|").replace("\n", " ").strip() for cell in row.cells] for row in table.rows]
+    return pd.DataFrame(rows).to_markdown(index=False, tablefmt="github")
+
+
+def _measure(fn, tables, repeat: int):
+    """(best wall seconds over repeat runs, peak traced bytes of one extra run)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for table in tables:
+            fn(table)
+        best = min(best, time.perf_counter() - start)
+    # tracemalloc은 실행을 크게 느리게 하므로 시간 측정과 분리
+    tracemalloc.start()
+    for table in tables:
+        fn(table)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=12)
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from pptx import Presentation
+
+    from thomas_utils.converters.pptx_impl import _table_to_markdown
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "tables.pptx"
+        _make_deck(deck, args.tables, args.rows, args.cols)
+        prs = Presentation(str(deck))
+        tables = [s.shapes[0].table for s in prs.slides]
+
+        results = {"native": _measure(_table_to_markdown, tables, args.repeat)}
+        try:
+            import_start = time.perf_counter()
+            import pandas  # noqa: F401
+            import tabulate  # noqa: F401
+
+            import_s = time.perf_counter() - import_start
+            results["pandas"] = _measure(_pandas_render, tables, args.repeat)
+        except ImportError:
+            import_s = None
+
+    print(f"{args.tables} tables x {args.rows}x{args.cols} cells")
+    for name, (secs, peak) in results.items():
+        print(f"  {name:7s} {secs * 1000:8.1f} ms  {args.tables / secs:8.0f} tables/s  peak {peak / 1024:8.0f} KiB")
+    if import_s is not None:
+        print(f"  pandas+tabulate import: {import_s * 1000:.0f} ms (first use only)")
+        print(f"  speedup: {results['pandas'][0] / results['native'][0]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Deterministic synthetic PDF / PPTX corpora for the benchmarks.
+
+Every document is generated from a fixed seed, so the same parameters always
+produce byte-identical files (zip timestamps and PDF ids are pinned). Pages and
+slides rotate through the content kinds the converters handle differently:
+prose, dense ruled tables, code blocks, equations and large raster images.
+Generated files are reused from the corpus directory when they already exist.
+"""
+
+import random
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Union
+
+SEED = 20240601
+
+# 페이지/슬라이드마다 순환하는 내용 종류
+KINDS = ("prose", "table", "code", "equation", "image")
+
+_WORDS = (
+    "convert markdown slide page table layout engine render cache worker stream "
+    "chunk token vector image header footer column paragraph equation matrix"
+).split()
+# PPTX에만 사용 (PDF 기본 글꼴에는 한글 글리프가 없음)
+_WORDS_KO = _WORDS + "변환 문서 표 코드 수식 슬라이드 이미지".split()
+
+_CODE = [
+    "import os",
+    "from pathlib import Path",
+    "def walk(root):",
+    "    for p in Path(root).rglob('*.pdf'):",
+    "        yield p.stat().st_size",
+    "class Cache:",
+    "    def get(self, key):",
+    "        return self._items.get(key)",
+]
+
+_EQUATIONS = [
+    "f(x) = sum_{i=0}^{n} a_i x^i",
+    "E = m c^2",
+    "x = (-b +- sqrt(b^2 - 4ac)) / 2a",
+    "int_0^1 x^2 dx = 1/3",
+]
+
+# PDF 페이지 크기 (A4, pt) 와 대형 이미지 크기 (px)
+_PAGE_W, _PAGE_H = 595, 842
+_IMAGE_W, _IMAGE_H = 1600, 1200
+
+
+def _sentence(rng: random.Random, n: int = 14, words=_WORDS) -> str:
+    return " ".join(rng.choice(words) for _ in range(n)).capitalize() + "."
+
+
+def _image_png(rng: random.Random) -> bytes:
+    """Large, poorly compressible RGB PNG (seeded random noise)."""
+    import pymupdf
+
+    noise = rng.randbytes(_IMAGE_W * _IMAGE_H * 3)
+    pix = pymupdf.Pixmap(pymupdf.csRGB, _IMAGE_W, _IMAGE_H, noise, False)
+    return pix.tobytes("png")
+
+
+def make_pdf(path: Union[str, Path], pages: int = 100, seed: int = SEED) -> Path:
+    """Write a `pages`-page PDF cycling through KINDS; returns the path."""
+    import pymupdf
+
+    path = Path(path)
+    rng = random.Random(seed)
+    image = _image_png(rng)
+    image_xref = 0
+    doc = pymupdf.open()
+    for n in range(pages):
+        page = doc.new_page(width=_PAGE_W, height=_PAGE_H)
+        kind = KINDS[n % len(KINDS)]
+        page.insert_text((50, 60), f"Section {n + 1}: {kind}", fontsize=18, fontname="hebo")
+        y = 100
+        if kind == "table":
+            rows, cols = 14, 6
+            cw, rh = (_PAGE_W - 100) / cols, 22
+            for r in range(rows + 1):
+                page.draw_line((50, y + r * rh), (50 + cols * cw, y + r * rh))
+            for c in range(cols + 1):
+                page.draw_line((50 + c * cw, y), (50 + c * cw, y + rows * rh))
+            for r in range(rows):
+                for c in range(cols):
+                    text = f"H{c}" if r == 0 else f"{rng.randint(0, 99999)}"
+                    page.insert_text((54 + c * cw, y + r * rh + 15), text, fontsize=9)
+            y += rows * rh + 20
+        elif kind == "code":
+            for line in _CODE * 3:
+                page.insert_text((60, y), line, fontsize=9, fontname="cour")
+                y += 13
+        elif kind == "equation":
+            for eq in _EQUATIONS:
+                page.insert_text((120, y), eq, fontsize=12, fontname="tiit")
+                y += 30
+        elif kind == "image":
+            rect = pymupdf.Rect(50, y, _PAGE_W - 50, y + 340)
+            image_xref = page.insert_image(rect, stream=image if not image_xref else None, xref=image_xref)
+            y += 360
+        while y < _PAGE_H - 80:
+            page.insert_textbox(pymupdf.Rect(50, y, _PAGE_W - 50, y + 44), _sentence(rng, 24), fontsize=10)
+            y += 48
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc.set_metadata({"producer": "thomas_utils benchmarks", "creationDate": "", "modDate": ""})
+    doc.save(str(path), garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return path
+
+
+_MATH_XML = (
+    '<a14:m xmlns:a14="http://schemas.microsoft.com/office/drawing/2010/main" '
+    'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math">'
+    "<m:oMathPara><m:oMath>"
+    "<m:r><m:t>E</m:t></m:r><m:r><m:t>=</m:t></m:r><m:r><m:t>m</m:t></m:r>"
+    "<m:sSup><m:e><m:r><m:t>c</m:t></m:r></m:e><m:sup><m:r><m:t>2</m:t></m:r></m:sup></m:sSup>"
+    "</m:oMath></m:oMathPara></a14:m>"
+)
+
+_MC_URI = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+
+def _pin_zip(path: Path) -> None:
+    """Rewrite a zip with fixed entry timestamps so identical content gives identical bytes."""
+    with zipfile.ZipFile(path) as zf:
+        entries = [(info, zf.read(info)) for info in zf.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for info, data in entries:
+            pinned = zipfile.ZipInfo(info.filename, date_time=(1980, 1, 1, 0, 0, 0))
+            pinned.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(pinned, data)
+
+
+def make_pptx(path: Union[str, Path], slides: int = 60, seed: int = SEED) -> Path:
+    """Write a `slides`-slide deck cycling through KINDS; returns the path."""
+    import datetime
+    import io
+
+    from lxml import etree
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
+    path = Path(path)
+    rng = random.Random(seed)
+    image = _image_png(rng)
+    prs = Presentation()
+    for n in range(slides):
+        kind = KINDS[n % len(KINDS)]
+        slide = prs.slides.add_slide(prs.slide_layouts[0 if n == 0 else 5])
+        slide.shapes.title.text = f"Section {n + 1}: {kind}"
+        if kind == "table":
+            rows, cols = 12, 6
+            table = slide.shapes.add_table(rows, cols, Inches(0.5), Inches(1.5), Inches(9), Inches(5)).table
+            for r in range(rows):
+                for c in range(cols):
+                    table.cell(r, c).text = f"H{c}" if r == 0 else str(rng.randint(0, 99999))
+            table.cell(1, 0).merge(table.cell(1, 1))
+        elif kind == "code":
+            tf = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(4)).text_frame
+            tf.text = "Example:"
+            for line in _CODE:
+                tf.add_paragraph().text = line
+        elif kind == "equation":
+            tf = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(1)).text_frame
+            tf.text = "Mass-energy equivalence"
+            for _ in range(3):
+                tf.paragraphs[0]._p.append(etree.fromstring(_MATH_XML))
+            # PowerPoint이 저장하는 형태: mc:Choice 수식 도형 + mc:Fallback 그림
+            choice = slide.shapes.add_textbox(Inches(0.5), Inches(3), Inches(9), Inches(1))
+            choice.text_frame.text = "Saved by PowerPoint"
+            choice.text_frame.paragraphs[0]._p.append(etree.fromstring(_MATH_XML))
+            fallback = slide.shapes.add_picture(io.BytesIO(image), Inches(0.5), Inches(3), Inches(9), Inches(1))
+            alt = etree.SubElement(choice._element.getparent(), f"{{{_MC_URI}}}AlternateContent", nsmap={"mc": _MC_URI})
+            etree.SubElement(alt, f"{{{_MC_URI}}}Choice", Requires="a14").append(choice._element)
+            etree.SubElement(alt, f"{{{_MC_URI}}}Fallback").append(fallback._element)
+        elif kind == "image":
+            slide.shapes.add_picture(io.BytesIO(image), Inches(1), Inches(1.5), Inches(8), Inches(5))
+        body = slide.shapes.add_textbox(Inches(0.5), Inches(6.6), Inches(9), Inches(0.8)).text_frame
+        body.text = _sentence(rng, words=_WORDS_KO)
+        for level in (1, 2):
+            p = body.add_paragraph()
+            p.text = _sentence(rng, 8, _WORDS_KO)
+            p.level = level
+            p.font.size = Pt(10)
+    props = prs.core_properties
+    props.created = props.modified = datetime.datetime(2024, 1, 1)
+    props.last_modified_by = "thomas_utils benchmarks"
+    props.revision = 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(str(path))
+    _pin_zip(path)
+    return path
+
+
+def build(corpus_dir: Union[str, Path], pdf_pages: int = 50, pptx_slides: int = 60) -> Dict[str, Path]:
+    """Generate (or reuse) the corpus; returns {"pdf": path, "pptx": path, "batch": dir}.
+
+    "batch" is a directory with a few smaller copies of both document types for the
+    batch command.
+    """
+    corpus_dir = Path(corpus_dir)
+    pdf = corpus_dir / f"doc-{pdf_pages}p-{SEED}.pdf"
+    pptx = corpus_dir / f"deck-{pptx_slides}s-{SEED}.pptx"
+    if not pdf.exists():
+        make_pdf(pdf.with_name("tmp-" + pdf.name), pdf_pages).replace(pdf)
+    if not pptx.exists():
+        make_pptx(pptx.with_name("tmp-" + pptx.name), pptx_slides).replace(pptx)
+    batch = corpus_dir / f"batch-{pdf_pages}-{pptx_slides}"
+    if not batch.exists():
+        # 중단돼도 반쪽짜리 디렉터리가 남지 않도록 임시 이름으로 만든 뒤 교체
+        tmp = batch.with_name(batch.name + ".tmp")
+        for i in range(4):
+            make_pdf(tmp / f"doc{i}.pdf", max(1, pdf_pages // 4), SEED + i)
+            make_pptx(tmp / f"deck{i}.pptx", max(1, pptx_slides // 4), SEED + i)
+        tmp.replace(batch)
+    return {"pdf": pdf, "pptx": pptx, "batch": batch}
+
+
+def batch_units(batch_dir: Path) -> List[Path]:
+    return sorted(p for p in batch_dir.iterdir() if p.suffix in (".pdf", ".pptx"))
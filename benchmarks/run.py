@@ -0,0 +1,338 @@
+"""Run the benchmark suite and check it against a JSON baseline.
+
+Usage:
+    python -m benchmarks [--pdf-pages 50] [--pptx-slides 60] [--repeat 3] [-k GLOB ...]
+                         [--baseline benchmarks/baseline.json] [--save-baseline]
+                         [--thresholds benchmarks/thresholds.json] [--json OUT.json]
+
+Each case runs in a fresh interpreter so peak RSS is per case (worker and CLI
+subprocesses included). Reported per case: best wall time over --repeat runs,
+the first (cold) run, peak RSS and pages (or slides) per second. LLM cases talk
+to benchmarks.stub_llm, so the suite never needs network access or an API key.
+
+With a baseline file present, every case is compared against it using the
+thresholds file; the exit status is 1 if any case regressed beyond its threshold.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT))
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLDS = Path(__file__).with_name("thresholds.json")
+# 비교하는 지표 (값이 클수록 나쁨)
+METRICS = ("wall_s", "peak_rss_mb")
+
+
+class Case(NamedTuple):
+    name: str
+    run: Callable[[Dict[str, Path], Path], None]
+    units: str  # "pdf", "pptx" 또는 "batch": 처리량 계산에 쓸 페이지/슬라이드 수
+    requires: Callable[[], Optional[str]] = lambda: None
+
+
+def _has_module(name: str) -> Optional[str]:
+    import importlib.util
+
+    return None if importlib.util.find_spec(name) else f"{name} not installed"
+
+
+def _has_soffice() -> Optional[str]:
+    return None if shutil.which("soffice") or shutil.which("libreoffice") else "LibreOffice not in PATH"
+
+
+def _cli(tmp: Path, output: str, *args: str) -> None:
+    """Run the CLI with tmp as working directory and check that it wrote tmp/output.
+
+    pptx2md always writes under ./output, so running in tmp keeps the repository clean.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(_ROOT), os.environ.get("PYTHONPATH")))))
+    cmd = [sys.executable, "-m", "thomas_utils", *args]
+    subprocess.run(cmd, cwd=str(tmp), env=env, check=True, stdout=subprocess.DEVNULL)
+    if not (tmp / output).exists():
+        raise RuntimeError(f"{args[0]} did not write {tmp / output}")
+
+
+def _pdf(engine: str, workers: Optional[int] = None):
+    def run(corpus: Dict[str, Path], tmp: Path) -> None:
+        from thomas_utils.converters import convert
+
+        convert(str(corpus["pdf"]), engine=engine, workers=workers)
+
+    return run
+
+
+def _pdf_stream(corpus: Dict[str, Path], tmp: Path) -> None:
+    from thomas_utils.converters import iter_convert
+
+    for _ in iter_convert(str(corpus["pdf"])):
+        pass
+
+
+def _hybrid_plan(corpus: Dict[str, Path], tmp: Path) -> None:
+    from thomas_utils.converters.hybrid_impl import plan
+
+    plan(corpus["pdf"])
+
+
+def _pptx(**kwargs: Any):
+    def run(corpus: Dict[str, Path], tmp: Path) -> None:
+        from thomas_utils.converters import convert_pptx
+
+        convert_pptx(corpus["pptx"], **kwargs)
+
+    return run
+
+
+def _pptx_multimodal(corpus: Dict[str, Path], tmp: Path) -> None:
+    from thomas_utils.converters import convert_pptx
+
+    # 슬라이드 PDF 캐시는 실행마다 새로 시작 (첫 반복 = 콜드)
+    convert_pptx(corpus["pptx"], use_llm_multimodal=True, pdf_cache_dir=tmp / "pdf_cache")
+
+
+CASES = [
+    Case("pdf-pymupdf", _pdf("pymupdf"), "pdf"),
+    Case("pdf-pymupdf-j4", _pdf("pymupdf", workers=4), "pdf"),
+    Case("pdf-pymupdf-stream", _pdf_stream, "pdf"),
+    Case("pdf-hybrid-plan", _hybrid_plan, "pdf"),
+    Case("pdf-hybrid", _pdf("hybrid"), "pdf", lambda: _has_module("marker")),
+    Case("pdf-marker", _pdf("marker"), "pdf", lambda: _has_module("marker")),
+    Case("pptx-python-pptx", _pptx(), "pptx"),
+    Case("pptx-fast", _pptx(engine="fast"), "pptx"),
+    Case("pptx-html-tables", _pptx(table_format="html"), "pptx"),
+    Case("pptx-unstructured", _pptx(engine="unstructured"), "pptx", lambda: _has_module("unstructured")),
+    Case("pptx-llm-polish", _pptx(use_llm=True), "pptx", lambda: _has_module("openai")),
+    Case(
+        "pptx-multimodal",
+        _pptx_multimodal,
+        "pptx",
+        lambda: _has_module("openai") or _has_soffice(),
+    ),
+    Case("cli-pdf2md", lambda c, tmp: _cli(tmp, "out.md", "pdf2md", str(c["pdf"]), "-o", "out.md"), "pdf"),
+    Case("cli-pptx2md", lambda c, tmp: _cli(tmp, "output/out.md", "pptx2md", str(c["pptx"]), "-o", "out.md"), "pptx"),
+    Case(
+        "cli-pptx2md-llm",
+        lambda c, tmp: _cli(
+            tmp, "output/out.md", "pptx2md", str(c["pptx"]), "-o", "out.md", "--pptx-use-llm", "--llm-cache", "off"
+        ),
+        "pptx",
+        lambda: _has_module("openai"),
+    ),
+    Case("cli-batch", lambda c, tmp: _cli(tmp, "out", "batch", str(c["batch"]), "-o", "out", "-q"), "batch"),
+]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak RSS of this process or any waited-for child, in MiB (None if unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+
+            return psutil.Process().memory_info().peak_wset / 2**20
+        except (ImportError, AttributeError):
+            return None
+    # Linux는 KiB, macOS는 바이트 단위
+    unit = 2**20 if sys.platform == "darwin" else 2**10
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        # Linux의 ru_maxrss는 exec 이전(부모 프로세스)의 최대값을 물려받으므로 VmHWM을 우선 사용
+        with open("/proc/self/status") as f:
+            own = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        pass
+    return max(own, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) / unit
+
+
+def _child(name: str, corpus: Dict[str, Path], repeat: int) -> Dict[str, Any]:
+    """Run one case in this (fresh) process and measure it."""
+    case = next(c for c in CASES if c.name == name)
+    times: List[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            case.run(corpus, Path(tmp))
+            times.append(time.perf_counter() - start)
+    peak = _peak_rss_mb()
+    return {
+        "wall_s": round(min(times), 4),
+        "cold_s": round(times[0], 4),
+        "peak_rss_mb": round(peak, 1) if peak is not None else None,
+    }
+
+
+def _units(corpus: Dict[str, Path], pdf_pages: int, pptx_slides: int) -> Dict[str, int]:
+    from benchmarks.corpus import batch_units
+
+    batch = 0
+    for p in batch_units(corpus["batch"]):
+        batch += max(1, (pdf_pages if p.suffix == ".pdf" else pptx_slides) // 4)
+    return {"pdf": pdf_pages, "pptx": pptx_slides, "batch": batch}
+
+
+def run_cases(
+    names: List[str],
+    corpus: Dict[str, Path],
+    repeat: int,
+    env: Dict[str, str],
+    units: Dict[str, int],
+) -> Dict[str, Dict[str, Any]]:
+    """Run each selected case in its own interpreter; returns {case: metrics or {"skipped": reason}}."""
+    results: Dict[str, Dict[str, Any]] = {}
+    corpus_arg = json.dumps({k: str(v) for k, v in corpus.items()})
+    for case in CASES:
+        if case.name not in names:
+            continue
+        reason = case.requires()
+        if reason:
+            results[case.name] = {"skipped": reason}
+            print(f"  {case.name:22s} skipped ({reason})", flush=True)
+            continue
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", "--child", case.name, "--corpus", corpus_arg, "--repeat", str(repeat)],
+            cwd=str(_ROOT),
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            err = (proc.stderr.strip().splitlines() or ["exit status %d" % proc.returncode])[-1]
+            results[case.name] = {"error": err}
+            print(f"  {case.name:22s} FAILED: {err}", flush=True)
+            continue
+        metrics = json.loads(proc.stdout.strip().splitlines()[-1])
+        n = units[case.units]
+        metrics["units"] = n
+        metrics["units_per_s"] = round(n / metrics["wall_s"], 1) if metrics["wall_s"] else None
+        results[case.name] = metrics
+        rss = f"{metrics['peak_rss_mb']:7.0f} MiB" if metrics["peak_rss_mb"] is not None else "      n/a"
+        print(
+            f"  {case.name:22s} {metrics['wall_s'] * 1000:9.0f} ms  (cold {metrics['cold_s'] * 1000:7.0f} ms)"
+            f"  {metrics['units_per_s'] or 0:8.1f} {case.units if case.units != 'batch' else 'units'}/s  peak {rss}",
+            flush=True,
+        )
+    return results
+
+
+def _threshold(thresholds: Dict[str, Any], case: str, metric: str) -> float:
+    ratio = thresholds.get("default", {}).get(metric, 0.25)
+    for pattern, overrides in thresholds.get("cases", {}).items():
+        if fnmatch.fnmatch(case, pattern) and metric in overrides:
+            ratio = overrides[metric]
+    return ratio
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    thresholds: Dict[str, Any],
+) -> List[str]:
+    """Regressions of results against baseline, one message per metric that got worse.
+
+    A metric regresses when it exceeds the baseline by more than its ratio
+    (thresholds["default"][metric], overridden per case by glob in thresholds["cases"])
+    and by more than the absolute floor thresholds["min_delta"][metric], which keeps
+    timer noise on very short cases from failing the run.
+    """
+    regressions: List[str] = []
+    floors = thresholds.get("min_delta", {})
+    for case, cur in results.items():
+        base = baseline.get(case)
+        if not base or "skipped" in cur or "error" in cur or "skipped" in base or "error" in base:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), cur.get(metric)
+            if old is None or new is None:
+                continue
+            ratio = _threshold(thresholds, case, metric)
+            if new > old * (1 + ratio) and new - old > floors.get(metric, 0):
+                regressions.append(
+                    f"{case}: {metric} {old} -> {new} (+{(new / old - 1) * 100 if old else float('inf'):.0f}%, limit +{ratio * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf-pages", type=int, default=50)
+    parser.add_argument("--pptx-slides", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-k", "--cases", nargs="*", metavar="GLOB", help="Only run cases matching these globs")
+    parser.add_argument("--corpus-dir", type=Path, help="Where generated documents are kept (default: temp dir)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to --baseline")
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Stub LLM response delay in seconds")
+    parser.add_argument("--json", type=Path, metavar="OUT.json", help="Also write the results here")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        corpus = {k: Path(v) for k, v in json.loads(args.corpus).items()}
+        print(json.dumps(_child(args.child, corpus, args.repeat)))
+        return 0
+    if args.list:
+        for case in CASES:
+            print(case.name)
+        return 0
+
+    from benchmarks import corpus as corpus_mod
+    from benchmarks import stub_llm
+
+    names = [c.name for c in CASES if not args.cases or any(fnmatch.fnmatch(c.name, g) for g in args.cases)]
+    params = {"pdf_pages": args.pdf_pages, "pptx_slides": args.pptx_slides, "repeat": args.repeat}
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus_dir or Path(tmp)
+        print(f"Corpus: {args.pdf_pages}-page PDF, {args.pptx_slides}-slide PPTX in {corpus_dir}", flush=True)
+        corpus = corpus_mod.build(corpus_dir, args.pdf_pages, args.pptx_slides)
+        units = _units(corpus, args.pdf_pages, args.pptx_slides)
+        with stub_llm.serve(args.llm_latency) as env:
+            results = run_cases(names, corpus, args.repeat, env, units)
+
+    report = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "params": params},
+        "cases": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    status = 0
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote baseline {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("meta", {}).get("params") != params:
+            print(f"Baseline {args.baseline} was recorded with {baseline.get('meta', {}).get('params')}; not comparing")
+            return 2
+        thresholds = json.loads(args.thresholds.read_text(encoding="utf-8")) if args.thresholds.exists() else {}
+        regressions = compare(results, baseline.get("cases", {}), thresholds)
+        for msg in regressions:
+            print(f"REGRESSION {msg}")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions against {args.baseline}")
+    if any("error" in r for r in results.values()):
+        status = status or 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
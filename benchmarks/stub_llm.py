@@ -0,0 +1,66 @@
+"""Offline OpenAI-compatible endpoint for benchmarking the LLM paths.
+
+Serves POST /v1/chat/completions on 127.0.0.1 with a fixed per-request latency.
+Text prompts (polish) are answered with the Markdown that follows the prompt
+header, so the polished document keeps its slide count; image prompts (vision)
+are answered with a minimal slide block. No request ever leaves the machine.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator
+
+_VISION_REPLY = "## Slide 1\n**Type**: Content Slide\n\n### Content\n\nstub\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.latency)
+        content = body["messages"][0]["content"]
+        if isinstance(content, str):
+            # 보정 프롬프트 뒤의 마크다운을 그대로 돌려줌 (슬라이드 수 유지)
+            start = content.find("## Slide")
+            reply = content[start:] if start >= 0 else content
+        else:
+            reply = _VISION_REPLY
+        data = json.dumps(
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": reply}}],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@contextmanager
+def serve(latency: float = 0.05) -> Iterator[Dict[str, str]]:
+    """Run the stub in a background thread; yields the env vars that point openai at it."""
+    handler = type("StubHandler", (_Handler,), {"latency": latency})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield {
+            "OPENAI_API_KEY": "stub",
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{server.server_address[1]}/v1",
+            "NO_PROXY": "127.0.0.1,localhost",
+        }
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,118 @@
+"""Tests for batch conversion."""
+
+from pathlib import Path
+
+import pytest
+
+
+def _make_sample_pdf(path: Path, n_pages: int = 1) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for i in range(n_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Batch page {i} content.")
+    doc.save(str(path))
+    doc.close()
+
+
+def _make_sample_pptx(path: Path) -> None:
+    from pptx import Presentation
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = "Batch slide"
+    prs.save(str(path))
+
+
+def test_collect_inputs_dir_and_glob(tmp_path: Path) -> None:
+    """Directories are searched recursively, globs expanded, other suffixes ignored."""
+    from thomas_utils.converters.batch import collect_inputs
+
+    (tmp_path / "sub").mkdir()
+    _make_sample_pdf(tmp_path / "a.pdf")
+    _make_sample_pptx(tmp_path / "sub" / "b.pptx")
+    (tmp_path / "notes.txt").write_text("x")
+
+    pairs = collect_inputs([tmp_path, str(tmp_path / "*.pdf")])
+    assert [rel.as_posix() for _, rel in pairs] == ["a.md", "sub/b.md"]
+
+    with pytest.raises(FileNotFoundError, match="not found"):
+        collect_inputs([tmp_path / "missing.pdf"])
+
+
+def test_collect_inputs_same_name(tmp_path: Path) -> None:
+    """Inputs that share a file name get distinct outputs instead of overwriting each other."""
+    from thomas_utils.converters import convert_many
+    from thomas_utils.converters.batch import collect_inputs
+
+    for d in ("a", "b"):
+        (tmp_path / "in" / d).mkdir(parents=True)
+        _make_sample_pdf(tmp_path / "in" / d / "x.pdf")
+    _make_sample_pptx(tmp_path / "in" / "a" / "x.pptx")
+
+    pairs = collect_inputs([str(tmp_path / "in" / "**" / "*.p*")])
+    assert sorted(rel.as_posix() for _, rel in pairs) == ["a/x.pdf.md", "a/x.pptx.md", "b/x.md"]
+
+    results = convert_many([str(tmp_path / "in" / "**" / "*.p*")], output_dir=tmp_path / "out", workers=1)
+    assert all(r["error"] is None for r in results)
+    assert len({r["output"] for r in results}) == 3
+    assert "Batch slide" in (tmp_path / "out" / "a" / "x.pptx.md").read_text(encoding="utf-8")
+
+    with pytest.raises(ValueError, match="both be written"):
+        collect_inputs([tmp_path / "in" / "a" / "x.pdf", tmp_path / "in" / "b" / "x.pdf"])
+
+
+def test_convert_many_parallel(tmp_path: Path) -> None:
+    """convert_many() writes one .md per input and reports throughput."""
+    from thomas_utils.converters import convert_many
+
+    src = tmp_path / "in"
+    src.mkdir()
+    _make_sample_pdf(src / "small.pdf")
+    _make_sample_pdf(src / "big.pdf", n_pages=3)
+    _make_sample_pptx(src / "deck.pptx")
+
+    seen = []
+    results = convert_many([src], output_dir=tmp_path / "out", workers=2, progress=seen.append)
+
+    assert [Path(r["input"]).name for r in results] == ["big.pdf", "deck.pptx", "small.pdf"]
+    assert all(r["error"] is None for r in results)
+    assert [r["pages"] for r in results] == [3, 1, 1]
+    assert "Batch page 2" in (tmp_path / "out" / "big.md").read_text(encoding="utf-8")
+    assert "Batch slide" in (tmp_path / "out" / "deck.md").read_text(encoding="utf-8")
+    assert len(seen) == 3
+    assert seen[-1]["done"] == 3 and seen[-1]["pages"] == 5
+    assert seen[-1]["docs_per_s"] > 0
+
+
+def test_convert_many_reports_errors(tmp_path: Path) -> None:
+    """A broken file is reported in its result instead of aborting the batch."""
+    from thomas_utils.converters import convert_many
+
+    _make_sample_pdf(tmp_path / "ok.pdf")
+    (tmp_path / "bad.pdf").write_bytes(b"not a pdf")
+
+    results = convert_many([tmp_path], output_dir=tmp_path / "out", workers=1)
+    by_name = {Path(r["input"]).name: r for r in results}
+    assert by_name["ok.pdf"]["error"] is None
+    assert by_name["bad.pdf"]["error"]
+
+
+def test_cli_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """batch subcommand converts a directory and exits 0."""
+    import sys
+
+    from thomas_utils.cli import main
+
+    _make_sample_pdf(tmp_path / "one.pdf")
+    _make_sample_pdf(tmp_path / "two.pdf")
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr(sys, "argv", ["thomas-utils", "batch", str(tmp_path), "-o", str(out_dir), "-j", "1", "-q"])
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 0
+    assert (out_dir / "one.md").exists()
+    assert (out_dir / "two.md").exists()
+
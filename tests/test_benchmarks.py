@@ -0,0 +1,64 @@
+"""Tests for the benchmark harness (corpus determinism, stub LLM, regression check)."""
+
+import hashlib
+from pathlib import Path
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_corpus_is_deterministic(tmp_path: Path) -> None:
+    """Same parameters give byte-identical PDF and PPTX files that both engines can read."""
+    from benchmarks.corpus import KINDS, make_pdf, make_pptx
+    from thomas_utils.converters import convert_pptx
+
+    n = len(KINDS)
+    assert _digest(make_pdf(tmp_path / "a.pdf", n)) == _digest(make_pdf(tmp_path / "b.pdf", n))
+    assert _digest(make_pptx(tmp_path / "a.pptx", n)) == _digest(make_pptx(tmp_path / "b.pptx", n))
+
+    md = convert_pptx(tmp_path / "a.pptx")
+    assert md.count("## Slide") == n
+    assert "| H0" in md and "```" in md
+    assert convert_pptx(tmp_path / "a.pptx", engine="fast") == md
+
+
+def test_stub_llm_keeps_polished_document(monkeypatch) -> None:
+    """The polish path runs offline against the stub and keeps the slide structure."""
+    from benchmarks import stub_llm
+    from thomas_utils.converters import pptx_impl
+
+    md = "## Slide 1\n**Type**: Content Slide\n\n### Content\n\nSome prose to polish.\n"
+    with stub_llm.serve(latency=0) as env:
+        for k, v in env.items():
+            monkeypatch.setenv(k, v)
+        assert pptx_impl._llm_polish(md).count("## Slide 1") == 1
+        assert "Some prose to polish." in pptx_impl._llm_polish(md)
+
+
+def test_compare_thresholds() -> None:
+    """Regressions beyond the ratio and the absolute floor are reported; per-case globs override."""
+    from benchmarks.run import compare
+
+    thresholds = {
+        "default": {"wall_s": 0.25, "peak_rss_mb": 0.2},
+        "min_delta": {"wall_s": 0.05},
+        "cases": {"cli-*": {"wall_s": 1.0}},
+    }
+    baseline = {
+        "pdf": {"wall_s": 1.0, "peak_rss_mb": 100},
+        "tiny": {"wall_s": 0.01, "peak_rss_mb": 100},
+        "cli-x": {"wall_s": 1.0, "peak_rss_mb": 100},
+        "gone": {"skipped": "marker not installed"},
+    }
+    results = {
+        "pdf": {"wall_s": 1.3, "peak_rss_mb": 119},
+        "tiny": {"wall_s": 0.03, "peak_rss_mb": 100},
+        "cli-x": {"wall_s": 1.9, "peak_rss_mb": 100},
+        "gone": {"wall_s": 9.0, "peak_rss_mb": 100},
+    }
+    regressions = compare(results, baseline, thresholds)
+    assert len(regressions) == 1 and regressions[0].startswith("pdf: wall_s")
+    results["cli-x"]["wall_s"] = 2.1
+    results["pdf"]["peak_rss_mb"] = 121
+    assert len(compare(results, baseline, thresholds)) == 3
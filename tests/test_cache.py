@@ -0,0 +1,82 @@
+"""Tests for the on-disk conversion cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _make_sample_pdf(path: Path, text: str = "Cache test content.") -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for i in range(2):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{text} page {i}")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_parse_size() -> None:
+    from thomas_utils.converters.cache import parse_size
+
+    assert parse_size("1024") == 1024
+    assert parse_size("2K") == 2048
+    assert parse_size("1.5MB") == 3 << 19
+    assert parse_size(7) == 7
+    with pytest.raises(ValueError, match="Invalid size"):
+        parse_size("lots")
+
+
+def test_key_depends_on_content_engine_and_selection(tmp_path: Path) -> None:
+    """Same bytes at different paths share a key; engine/pages/options/content change it."""
+    from thomas_utils.converters import ConversionCache
+
+    cache = ConversionCache(tmp_path / "cache")
+    a = tmp_path / "a.pdf"
+    _make_sample_pdf(a)
+    b = tmp_path / "copy.pdf"
+    b.write_bytes(a.read_bytes())
+
+    base = cache.key(a, "pymupdf")
+    assert cache.key(b, "pymupdf") == base
+    assert cache.key(a, "marker") != base
+    assert cache.key(a, "pymupdf", [1, 0]) == cache.key(a, "pymupdf", [0, 1]) != base
+    assert cache.key(a, "pymupdf", options={"use_llm": True}) != base
+    _make_sample_pdf(b, text="Other")
+    assert cache.key(b, "pymupdf") != base
+
+
+def test_convert_uses_cache(tmp_path: Path) -> None:
+    """A second convert() of identical bytes is served from the cache."""
+    from thomas_utils.converters import ConversionCache, convert
+
+    pdf_path = tmp_path / "sample.pdf"
+    _make_sample_pdf(pdf_path)
+    cache = ConversionCache(tmp_path / "cache")
+
+    first = convert(pdf_path, cache=cache)
+    assert cache.stats() == {"hits": 0, "misses": 1}
+    second = convert(pdf_path, cache=cache)
+    assert second == first
+    assert cache.stats() == {"hits": 1, "misses": 1}
+    convert(pdf_path, pages=[0], cache=cache)
+    assert cache.misses == 2
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    """Entries beyond max_size are evicted least-recently-used first; get() refreshes recency."""
+    from thomas_utils.converters import ConversionCache
+
+    cache = ConversionCache(tmp_path / "cache", max_size=250)
+    keys = ["a" * 64, "b" * 64, "c" * 64]
+    for i, k in enumerate(keys[:2]):
+        cache.put(k, "x" * 100)
+        os.utime(cache._entry(k), (1000 + i, 1000 + i))
+    assert cache.get(keys[0]) is not None  # a 가 가장 최근 사용
+    cache.put(keys[2], "x" * 100)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    assert cache.size() <= 250
@@ -0,0 +1,122 @@
+"""Tests for token-aware JSONL chunking of the document IR."""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def test_chunks_respect_cap_and_overlap() -> None:
+    from thomas_utils.converters.chunking import _chunk_texts
+
+    pieces = [f"p{i} a b" for i in range(6)]  # 조각마다 3토큰
+    chunks = list(_chunk_texts(pieces, 8, 4, _words))
+    assert chunks == [
+        "p0 a b\n\np1 a b",
+        "p1 a b\n\np2 a b",
+        "p2 a b\n\np3 a b",
+        "p3 a b\n\np4 a b",
+        "p4 a b\n\np5 a b",
+    ]
+    assert list(_chunk_texts(pieces, 8, 0, _words))[1] == "p2 a b\n\np3 a b"
+    # 너무 긴 조각은 줄, 그다음 단어 경계에서 나눔
+    assert list(_chunk_texts(["a b c d e f g"], 3, 0, _words)) == ["a b", "c d", "e f", "g"]
+
+
+def test_long_table_repeats_header() -> None:
+    from thomas_utils.converters.chunking import _chunk_texts
+
+    table = "| h1 | h2 |\n|---|---|\n" + "\n".join(f"| r{i} | x |" for i in range(4))
+    chunks = list(_chunk_texts([table], 20, 0, _words))
+    assert len(chunks) > 1
+    assert all(c.startswith("| h1 | h2 |\n|---|---|\n| r") for c in chunks)
+    assert sum(c.count("| x |") for c in chunks) == 4
+
+
+def test_iter_chunks_metadata_and_unit_boundaries() -> None:
+    from thomas_utils.converters import ir
+    from thomas_utils.converters.chunking import iter_chunks
+
+    long_page = "# **Results**\n\n" + "\n\n".join("word " * 30 for _ in range(5)) + "\n\n![](img.png)\n"
+    units = [
+        ir.Page(0, 2, [ir.Markdown(long_page)]),
+        ir.Page(1, 2, [ir.Markdown("```\ncode\n\nmore\n```\n")]),
+    ]
+    records = list(iter_chunks(ir.Document("doc.pdf", units), max_tokens=80, overlap=20))
+    assert {r["page"] for r in records} == {0, 1}
+    first = [r for r in records if r["page"] == 0]
+    assert len(first) > 1 and [r["chunk"] for r in first] == list(range(len(first)))
+    assert all(r["tokens"] <= 80 and r["title"] == "Results" and "img.png" not in r["text"] for r in records[:-1])
+    # 코드 블록은 빈 줄이 있어도 나누지 않고, 페이지를 넘어 이어 붙이지 않음
+    assert records[-1]["text"] == "```\ncode\n\nmore\n```" and records[-1]["title"] is None
+    assert records[-1]["id"] == "doc.pdf#page1-0"
+    assert records[0]["hash"] == hashlib.sha256(records[0]["text"].encode("utf-8")).hexdigest()
+
+    slide = ir.Slide(3, 4, "Content Slide", title="Plan", shapes=[[ir.Paragraph("Intro"), ir.ListItem("step", 1)]])
+    (record,) = iter_chunks(ir.Document("deck.pptx", [slide]))
+    assert (record["slide"], record["title"], record["text"]) == (3, "Plan", "Plan\n\nIntro\n\n   - step")
+
+    for max_tokens, overlap in ((0, 0), (10, 10), (10, -1)):
+        with pytest.raises(ValueError, match="Chunk"):
+            iter_chunks(ir.Document("x", []), max_tokens=max_tokens, overlap=overlap)
+
+
+def test_cli_format_jsonl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """pptx2md / pdf2md --format jsonl write one chunk record per line."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    import thomas_utils.converters as converters
+    from thomas_utils.cli import _pdf2md, _pptx2md
+
+    monkeypatch.chdir(tmp_path)
+    prs = Presentation()
+    for i in range(2):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Topic {i}"
+        tf = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(6), Inches(4)).text_frame
+        tf.text = " ".join(["cat"] * 40)
+        tf.add_paragraph().text = " ".join(["dog"] * 40)
+    deck = tmp_path / "deck.pptx"
+    prs.save(str(deck))
+
+    class PptxArgs:
+        input = str(deck)
+        output = None
+        slides = None
+        output_format = "jsonl"
+        chunk_tokens = 50
+        chunk_overlap = 0
+
+    assert _pptx2md(PptxArgs()) == 0
+    lines = (tmp_path / "output" / "deck.jsonl").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [(r["slide"], r["chunk"]) for r in records] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert records[2]["title"] == "Topic 1" and records[2]["text"].startswith("Topic 1\n\ncat")
+
+    def fake_iter_convert(path, pages=None, engine="pymupdf"):
+        for i in range(3):
+            yield {"page": i, "page_count": 3, "index": i, "total": 3, "text": f"page {i}\n"}
+
+    monkeypatch.setattr(converters, "iter_convert", fake_iter_convert)
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+
+    class PdfArgs:
+        input = str(pdf)
+        output = None
+        pages = None
+        engine = "pymupdf"
+        output_format = "jsonl"
+
+    assert _pdf2md(PdfArgs()) == 0
+    lines = (tmp_path / "output" / "doc.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["text"] for line in lines] == ["page 0", "page 1", "page 2"]
+
+    PdfArgs.chunk_overlap = 600
+    assert _pdf2md(PdfArgs()) == 1
@@ -111,3 +111,40 @@ def test_cli_pptx2md_default_output_dir(tmp_path: Path, monkeypatch: pytest.Monk
     assert out_path.exists()
     text = out_path.read_text(encoding="utf-8")
     assert "CLI" in text or "test" in text or "slide" in text
+
+
+def test_cli_pdf2md_streams_pages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """pdf2md writes each page chunk as it is produced and removes partial output on failure."""
+    import thomas_utils.converters as converters
+    from thomas_utils.cli import _pdf2md
+
+    pdf_path = tmp_path / "in.pdf"
+    _make_sample_pdf(pdf_path)
+    out_path = tmp_path / "out.md"
+    seen_sizes = []
+
+    def fake_iter_convert(path, pages=None, engine="pymupdf"):
+        for i in range(3):
+            if out_path.exists():
+                seen_sizes.append(out_path.stat().st_size)
+            yield {"page": i, "page_count": 3, "index": i, "total": 3, "text": f"page {i}\n"}
+
+    monkeypatch.setattr(converters, "iter_convert", fake_iter_convert)
+
+    class Args:
+        input = str(pdf_path)
+        output = str(out_path)
+        pages = None
+        engine = "pymupdf"
+
+    assert _pdf2md(Args()) == 0
+    assert out_path.read_text(encoding="utf-8") == "page 0\npage 1\npage 2\n"
+    assert seen_sizes == [0, 7, 14]
+
+    def failing_iter_convert(path, pages=None, engine="pymupdf"):
+        yield {"page": 0, "page_count": 2, "index": 0, "total": 2, "text": "page 0\n"}
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(converters, "iter_convert", failing_iter_convert)
+    assert _pdf2md(Args()) == 1
+    assert not out_path.exists()
@@ -54,3 +54,212 @@ def test_get_engine() -> None:
     assert get_engine("marker") == "marker"
     with pytest.raises(ValueError, match="Unknown engine"):
         get_engine("invalid")
+
+
+def test_convert_pymupdf_parallel_matches_serial(tmp_path: Path) -> None:
+    """Page-parallel conversion is byte-identical to the serial path, with and without pages."""
+    import pymupdf
+
+    from thomas_utils.converters import convert
+
+    pdf_path = tmp_path / "multi.pdf"
+    doc = pymupdf.open()
+    for i in range(7):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {i}", fontsize=20)
+        page.insert_text((72, 120), f"Body text on page {i}.", fontsize=11)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    assert convert(pdf_path, workers=3) == convert(pdf_path)
+    assert convert(pdf_path, pages=[1, 2, 5, 6], workers=2) == convert(pdf_path, pages=[1, 2, 5, 6])
+    # 순서가 섞이거나 중복된 선택도 직렬 경로처럼 문서 순서로 한 번씩 변환
+    assert convert(pdf_path, pages=[5, 1, 2, 1], workers=2) == convert(pdf_path, pages=[5, 1, 2, 1])
+    assert convert(pdf_path, pages=[5, 1, 2, 1], workers=2) == convert(pdf_path, pages=[1, 2, 5])
+
+
+def test_split_pages_contiguous() -> None:
+    from thomas_utils.converters.pymupdf_impl import _split
+
+    assert _split(list(range(7)), 3) == [[0, 1, 2], [3, 4], [5, 6]]
+    assert _split([4, 9], 8) == [[4], [9]]
+
+
+def test_iter_convert_pages(tmp_path: Path) -> None:
+    """iter_convert() yields one chunk per selected page; joined it equals convert()."""
+    import pymupdf
+
+    from thomas_utils.converters import convert, iter_convert
+
+    pdf_path = tmp_path / "multi.pdf"
+    doc = pymupdf.open()
+    for i in range(4):
+        doc.new_page().insert_text((72, 72), f"Streamed page {i}.")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    chunks = list(iter_convert(pdf_path, pages=[1, 3]))
+    assert [c["page"] for c in chunks] == [1, 3]
+    assert [c["index"] for c in chunks] == [0, 1]
+    assert all(c["page_count"] == 4 and c["total"] == 2 for c in chunks)
+    assert "Streamed page 3" in chunks[1]["text"]
+    assert "".join(c["text"] for c in chunks) == convert(pdf_path, pages=[1, 3])
+
+    chunks = list(iter_convert(pdf_path, pages=[3, 1, 3]))
+    assert [(c["page"], c["index"], c["total"]) for c in chunks] == [(1, 0, 2), (3, 1, 2)]
+    assert "".join(c["text"] for c in chunks) == convert(pdf_path, pages=[3, 1, 3])
+
+
+def _install_fake_marker(monkeypatch: pytest.MonkeyPatch, calls: list) -> None:
+    """Replace marker with a stub whose converter echoes page count and pagination."""
+    import sys
+    import types
+
+    from thomas_utils.converters import marker_impl
+
+    class FakePdfConverter:
+        def __init__(self, artifact_dict, config=None):
+            calls.append((artifact_dict, config))
+            self.paginate = bool(config and config.get("paginate_output"))
+
+        def __call__(self, path):
+            import pymupdf
+
+            with pymupdf.open(path) as doc:
+                texts = [doc[i].get_text().strip() for i in range(doc.page_count)]
+            if self.paginate:
+                return "".join(f"\n\n{{{i}}}" + "-" * 48 + f"\n\n{t}" for i, t in enumerate(texts))
+            return "\n\n".join(texts)
+
+    fake = {
+        "marker": types.ModuleType("marker"),
+        "marker.converters": types.ModuleType("marker.converters"),
+        "marker.converters.pdf": types.SimpleNamespace(PdfConverter=FakePdfConverter),
+        "marker.models": types.SimpleNamespace(create_model_dict=lambda: {"models": 1}),
+        "marker.output": types.SimpleNamespace(text_from_rendered=lambda r: (r, {}, {})),
+    }
+    for name, mod in fake.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+    monkeypatch.setattr(marker_impl, "_models", None)
+    monkeypatch.setattr(marker_impl, "_converters", {})
+
+
+def test_marker_converter_built_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """marker models are loaded once per process and reused by later convert() calls."""
+    from thomas_utils.converters import marker_impl
+
+    calls: list = []
+    _install_fake_marker(monkeypatch, calls)
+
+    pdf_path = tmp_path / "m.pdf"
+    _make_sample_pdf(pdf_path)
+    marker_impl.preload()
+    assert marker_impl.is_loaded()
+    first = marker_impl.convert(pdf_path)
+    assert "Test Heading" in first
+    assert marker_impl.convert(pdf_path) == first
+    assert calls == [({"models": 1}, None)]
+
+
+def test_marker_pages_subset(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """marker converts only the requested pages and labels them with original page numbers."""
+    import pymupdf
+
+    from thomas_utils.converters import convert
+
+    calls: list = []
+    _install_fake_marker(monkeypatch, calls)
+
+    pdf_path = tmp_path / "multi.pdf"
+    doc = pymupdf.open()
+    for i in range(5):
+        doc.new_page().insert_text((72, 72), f"Marker page {i}")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    result = convert(pdf_path, pages=[1, 3], engine="marker")
+    assert "Marker page 1" in result and "Marker page 3" in result
+    assert "Marker page 0" not in result and "Marker page 4" not in result
+    assert "{1}" + "-" * 48 in result and "{3}" + "-" * 48 in result
+    assert "{0}" + "-" * 48 not in result
+    # 순서가 뒤섞이거나 중복된 선택도 문서 순서로 한 번씩
+    assert convert(pdf_path, pages=[3, 1, 3], engine="marker") == result
+    with pytest.raises(ValueError, match="out of range"):
+        convert(pdf_path, pages=[9], engine="marker")
+
+
+def _make_mixed_pdf(path: Path) -> None:
+    """Page 0: digital text, page 1: scanned (image only), page 2: digital text."""
+    import pymupdf
+
+    doc = pymupdf.open()
+    for i in range(3):
+        page = doc.new_page()
+        if i == 1:
+            scan = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 200, 260), False)
+            scan.clear_with(200)
+            page.insert_image(page.rect, pixmap=scan)
+        else:
+            page.insert_text((72, 72), f"Digital page {i} with a real text layer that is long enough.")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_hybrid_sends_only_scanned_pages_to_marker(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """auto/hybrid profiles pages, runs marker on the scanned page only and keeps page order."""
+    from thomas_utils.converters import convert, hybrid_impl, iter_convert, marker_impl
+
+    calls: list = []
+    _install_fake_marker(monkeypatch, calls)
+    converted: list = []
+    real = marker_impl.convert_pages
+    monkeypatch.setattr(marker_impl, "convert_pages", lambda p, pages: converted.append(pages) or real(p, pages))
+
+    pdf_path = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(pdf_path)
+    profiles = hybrid_impl.plan(pdf_path)
+    assert [p["engine"] for p in profiles] == ["pymupdf", "marker", "pymupdf"]
+    assert profiles[1]["image_coverage"] > 0.5 and profiles[1]["chars"] == 0
+
+    chunks = list(iter_convert(pdf_path, engine="auto"))
+    assert [(c["page"], c["engine"]) for c in chunks] == [(0, "pymupdf"), (1, "marker"), (2, "pymupdf")]
+    assert converted == [[1]]
+    result = convert(pdf_path, engine="hybrid")
+    assert result == "".join(c["text"] for c in chunks)
+    assert result.index("Digital page 0") < result.index("Digital page 2")
+    assert convert(pdf_path, engine="hybrid", workers=2) == result
+    assert convert(pdf_path, pages=[2, 1, 0, 2], engine="hybrid") == result
+    assert convert(pdf_path, pages=[2, 1, 0, 2], engine="hybrid", workers=2) == result
+    # 스캔 페이지가 없으면 marker를 전혀 부르지 않음
+    converted.clear()
+    assert convert(pdf_path, pages=[0, 2], engine="hybrid") == convert(pdf_path, pages=[0, 2])
+    assert converted == []
+
+
+def test_hybrid_routes_on_text_coverage(tmp_path: Path) -> None:
+    """A full-page image with only a thin text layer goes to marker; one under real body text does not."""
+    import pymupdf
+
+    from thomas_utils.converters import hybrid_impl
+
+    pdf_path = tmp_path / "ocr.pdf"
+    doc = pymupdf.open()
+    scan = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 200, 260), False)
+    scan.clear_with(200)
+    for i in range(2):
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=scan)
+        if i == 0:
+            # 보이지 않는 OCR 텍스트 한 줄: 글자 수는 기준을 넘지만 면적은 작음
+            line = "Scanned page with an OCR text layer of one long line."
+            page.insert_text((72, 72), line, fontsize=8, render_mode=3)
+        else:
+            body = " ".join(["Body text printed over a full-page background image."] * 40)
+            page.insert_textbox(pymupdf.Rect(50, 50, 550, 750), body, fontsize=11)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    ocr, body = hybrid_impl.plan(pdf_path)
+    assert ocr["chars"] >= hybrid_impl.MIN_TEXT_CHARS and ocr["text_coverage"] < hybrid_impl.SCAN_TEXT_COVERAGE
+    assert (ocr["engine"], ocr["reason"]) == ("marker", "scanned (image with a sparse text layer)")
+    assert body["text_coverage"] >= hybrid_impl.SCAN_TEXT_COVERAGE and body["engine"] == "pymupdf"
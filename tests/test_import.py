@@ -0,0 +1,46 @@
+"""Startup cost: importing the package and CLI must not load conversion engines."""
+
+import subprocess
+import sys
+
+# 엔진 모듈: 실제 변환 시에만 로드되어야 함
+_HEAVY = ("pptx", "pymupdf4llm", "pymupdf", "fitz", "pandas", "openai", "marker", "torch")
+
+# thomas_utils 자체 import 시간 상한 (마이크로초, -X importtime 누적값)
+_IMPORT_BUDGET_US = 150_000
+
+
+def _importtime(code: str) -> dict:
+    """Run code in a fresh interpreter with -X importtime; return {module: cumulative µs}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative.strip())
+        except ValueError:
+            continue  # header line
+    return times
+
+
+def test_import_loads_no_engines() -> None:
+    code = (
+        "import thomas_utils.cli\n"
+        "from thomas_utils.converters import convert, convert_pptx, iter_convert, iter_slides\n"
+    )
+    times = _importtime(code)
+    loaded = [m for m in times if m.split(".")[0] in _HEAVY]
+    assert loaded == []
+
+
+def test_import_time_budget() -> None:
+    times = _importtime("import thomas_utils.cli, thomas_utils.converters")
+    total = sum(us for name, us in times.items() if name in ("thomas_utils", "thomas_utils.cli", "thomas_utils.converters"))
+    assert total < _IMPORT_BUDGET_US, f"thomas_utils import took {total / 1000:.1f} ms"
@@ -0,0 +1,115 @@
+"""Tests for the document IR and its Markdown / JSON emitters."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _make_deck(path: Path) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = "Overview"
+    tf = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(6), Inches(2)).text_frame
+    tf.text = "Intro"
+    for text, level in (("point", 1), ("import os", 0), ("def f():", 0)):
+        p = tf.add_paragraph()
+        p.text = text
+        p.level = level
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(4), Inches(4), Inches(1)).table
+    for r in range(2):
+        for c in range(2):
+            table.cell(r, c).text = f"r{r}c{c}"
+    second = prs.slides.add_slide(prs.slide_layouts[6])
+    tf = second.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1)).text_frame
+    tf.text = "nested first"
+    tf.paragraphs[0].level = 2
+    prs.save(str(path))
+
+
+@pytest.mark.parametrize("engine", ["python-pptx", "fast"])
+def test_slide_ir_blocks_and_markdown(tmp_path: Path, engine: str) -> None:
+    """Engines produce typed blocks; the emitted Markdown equals convert_pptx()."""
+    from thomas_utils.converters import convert_pptx, ir
+    from thomas_utils.converters.pptx_impl import iter_units
+
+    deck = tmp_path / "deck.pptx"
+    _make_deck(deck)
+    units = list(iter_units(deck, engine=engine))
+    assert [(u.index, u.count, u.title) for u in units] == [(0, 2, "Overview"), (1, 2, None)]
+    first = units[0]
+    assert [type(b).__name__ for shape in first.shapes for b in shape] == ["Paragraph", "ListItem", "Code", "Table"]
+    assert first.shapes[0][2].text == "import os\ndef f():"
+    assert first.shapes[1][0].rows == [["r0c0", "r0c1"], ["r1c0", "r1c1"]]
+    assert not hasattr(first, "__dict__") and not hasattr(first.shapes[0][0], "__dict__")
+
+    assert ir.to_markdown(ir.Document(deck.name, units)) == convert_pptx(deck, engine=engine)
+    # 도형의 첫 목록 항목은 (기존 출력대로) 들여쓰기 없이 시작
+    assert units[1].markdown().endswith("### Content\n\n- nested first")
+
+
+def test_json_emitter_streams_units(tmp_path: Path) -> None:
+    import io
+
+    from thomas_utils.converters import ir
+    from thomas_utils.converters.pptx_impl import iter_units
+
+    deck = tmp_path / "deck.pptx"
+    _make_deck(deck)
+    stream = io.StringIO()
+    ir.write(ir.Document(deck.name, iter_units(deck, slides=[1, 0])), stream, "json")
+    data = json.loads(stream.getvalue())
+    assert data["source"] == "deck.pptx"
+    assert [u["slide"] for u in data["units"]] == [0, 1]
+    blocks = data["units"][0]["blocks"]
+    assert blocks[1] == {"type": "list_item", "text": "point", "level": 1, "shape": 0}
+    assert blocks[3]["type"] == "table" and blocks[3]["shape"] == 1
+    assert (data["units"][0]["layout"], data["units"][0]["type"]) == ("Title Only", "Title Slide")
+
+    with pytest.raises(ValueError, match="Unknown output format"):
+        ir.write(ir.Document("x", []), stream, "yaml")
+
+
+def test_cli_format_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """pptx2md / pdf2md --format json write one object per slide / page."""
+    import thomas_utils.converters as converters
+    from thomas_utils.cli import _pdf2md, _pptx2md
+
+    monkeypatch.chdir(tmp_path)
+    deck = tmp_path / "deck.pptx"
+    _make_deck(deck)
+
+    class PptxArgs:
+        input = str(deck)
+        output = None
+        slides = None
+        output_format = "json"
+
+    assert _pptx2md(PptxArgs()) == 0
+    data = json.loads((tmp_path / "output" / "deck.json").read_text(encoding="utf-8"))
+    assert len(data["units"]) == 2
+
+    def fake_iter_convert(path, pages=None, engine="pymupdf"):
+        for i in range(2):
+            yield {"page": i, "page_count": 2, "index": i, "total": 2, "text": f"page {i}\n"}
+
+    monkeypatch.setattr(converters, "iter_convert", fake_iter_convert)
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+
+    class PdfArgs:
+        input = str(pdf)
+        output = None
+        pages = None
+        engine = "pymupdf"
+        output_format = "json"
+
+    assert _pdf2md(PdfArgs()) == 0
+    data = json.loads((tmp_path / "output" / "doc.json").read_text(encoding="utf-8"))
+    assert data["units"][1] == {"page": 1, "page_count": 2, "blocks": [{"type": "markdown", "text": "page 1\n"}]}
+
+    PdfArgs.jobs = 2
+    assert _pdf2md(PdfArgs()) == 1
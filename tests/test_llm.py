@@ -0,0 +1,246 @@
+"""Tests for the concurrent LLM paths against a local fake OpenAI-compatible server."""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+
+class _FakeOpenAI(BaseHTTPRequestHandler):
+    """Minimal /v1/chat/completions: echoes the slide number, throttles the first request."""
+
+    state: dict = {}
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        st = self.state
+        with st["lock"]:
+            st["requests"] += 1
+            first = st["requests"] == 1
+            st["active"] += 1
+            st["max_active"] = max(st["max_active"], st["active"])
+        try:
+            if first and st.get("throttle_first"):
+                self._send(429, {"error": {"message": "slow down"}}, {"Retry-After": "0"})
+                return
+            time.sleep(st.get("delay", 0.05))
+            content = body["messages"][0]["content"]
+            text = content if isinstance(content, str) else content[0]["text"]
+            with st["lock"]:
+                st.setdefault("prompts", []).append(text)
+                if not isinstance(content, str) and len(content) > 1:
+                    st.setdefault("image_urls", []).append(content[1]["image_url"]["url"])
+            if "FAILME" in text:
+                self._send(500, {"error": {"message": "boom"}})
+                return
+            reply = st["reply"](text)
+            self._send(
+                200,
+                {
+                    "id": "x",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": body["model"],
+                    "choices": [
+                        {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": reply}}
+                    ],
+                },
+            )
+        finally:
+            with st["lock"]:
+                st["active"] -= 1
+
+    def _send(self, code: int, payload: dict, headers: dict = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _slide_reply(prompt: str) -> str:
+    n = re.search(r"## Slide (\d+)", prompt).group(1)
+    return f"## Slide {n}\n**Type**: Content Slide\n\n### Content\n\nvision text {n}"
+
+
+def _fake_render(images: list):
+    """Stand-in for _render_pptx_slides_to_images returning fixed image bytes per slide."""
+    return lambda path, image_options=None, slides=None, pdf_cache_dir=None: dict(enumerate(images))
+
+
+@pytest.fixture
+def fake_openai(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict]:
+    state = {"lock": threading.Lock(), "requests": 0, "active": 0, "max_active": 0, "reply": _slide_reply}
+    _FakeOpenAI.state = state
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOpenAI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_multimodal_concurrent_in_slide_order(
+    fake_openai: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Slide requests run in parallel, a 429 is retried, and output keeps slide order."""
+    pytest.importorskip("openai")
+    from thomas_utils.converters import pptx_impl
+
+    fake_openai["throttle_first"] = True
+    monkeypatch.setattr(pptx_impl, "_render_pptx_slides_to_images", _fake_render([b"png"] * 6))
+    result = pptx_impl._convert_pptx_multimodal(tmp_path / "deck.pptx", llm_concurrency=4)
+
+    positions = [result.index(f"vision text {n}") for n in range(1, 7)]
+    assert positions == sorted(positions)
+    assert result.count("\n---\n") == 5
+    assert fake_openai["requests"] == 7
+    assert fake_openai["max_active"] > 1
+
+
+def test_multimodal_data_url_matches_image_format(
+    fake_openai: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """JPEG/WebP slide images are sent with their own MIME type, not image/png."""
+    pytest.importorskip("openai")
+    from thomas_utils.converters import pptx_impl
+
+    images = [b"\x89PNG\r\n\x1a\nxx", b"\xff\xd8\xffxx", b"RIFF\x00\x00\x00\x00WEBPxx"]
+    monkeypatch.setattr(pptx_impl, "_render_pptx_slides_to_images", _fake_render(images))
+    pptx_impl._convert_pptx_multimodal(tmp_path / "deck.pptx", llm_concurrency=1)
+
+    mimes = [url.split(";", 1)[0] for url in fake_openai["image_urls"]]
+    assert mimes == ["data:image/png", "data:image/jpeg", "data:image/webp"]
+
+
+def test_token_bucket_limits_rate() -> None:
+    from thomas_utils.converters.llm_client import TokenBucket
+
+    bucket = TokenBucket(rate=20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_adaptive_limiter_backs_off_and_recovers() -> None:
+    from thomas_utils.converters.llm_client import AdaptiveLimiter
+
+    lim = AdaptiveLimiter(8)
+    lim.acquire()
+    lim.release(throttled=True)
+    assert lim.limit == 4
+    for _ in range(4):
+        lim.acquire()
+        lim.release()
+    assert lim.limit == 5
+
+
+def _polish_reply(prompt: str) -> str:
+    md = prompt[prompt.index("\n\n## Slide ") + 2 :]
+    return md.replace("plain words", "Polished words")
+
+
+def test_llm_polish_per_slide_chunks(
+    fake_openai: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Polish runs per slide chunk, skips table/code/empty slides, and falls back per failed chunk."""
+    pytest.importorskip("openai")
+    from thomas_utils.converters import llm_client, pptx_impl
+
+    monkeypatch.setattr(llm_client, "RETRIES", 0)
+    monkeypatch.setattr(pptx_impl, "_POLISH_CHUNK_CHARS", 60)
+    fake_openai["reply"] = _polish_reply
+    slides = [
+        "## Slide 1\n**Type**: Content Slide\n\n### Content\n\nplain words one",
+        "## Slide 2\n**Type**: Content Slide\n\n### Content\n\n| a | b |\n|---|---|\n| 1 | 2 |",
+        "## Slide 3\n**Type**: Content Slide\n\n### Content\n\n```\nimport os\n```",
+        "## Slide 4\n**Type**: Content Slide\n\n### Content",
+        "## Slide 5\n**Type**: Content Slide\n\n### Content\n\nplain words FAILME",
+        "## Slide 6\n**Type**: Content Slide\n\n### Content\n\nplain words six",
+    ]
+    md = "\n\n---\n\n".join(slides) + "\n"
+
+    result = pptx_impl._llm_polish(md)
+
+    assert pptx_impl._split_slide_blocks(result)[1:4] == slides[1:4]
+    assert "Polished words one" in result and "Polished words six" in result
+    assert "plain words FAILME" in result
+    sent = fake_openai["prompts"]
+    assert len(sent) == 3
+    assert not any("| a | b |" in p or "import os" in p for p in sent)
+
+
+def test_split_slide_blocks_roundtrip() -> None:
+    from thomas_utils.converters.pptx_impl import _split_slide_blocks
+
+    md = "## Slide 1\n\nA\n\n---\n\n## Slide 2\n\nB\n"
+    assert _split_slide_blocks(md) == ["## Slide 1\n\nA", "## Slide 2\n\nB"]
+    assert "\n\n---\n\n".join(_split_slide_blocks(md)) + "\n" == md
+
+
+def test_multimodal_llm_cache_skips_network(
+    fake_openai: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second conversion of unchanged slides makes zero requests; refresh re-queries."""
+    pytest.importorskip("openai")
+    from thomas_utils.converters import pptx_impl
+    from thomas_utils.converters.llm_cache import LLMCache
+
+    monkeypatch.setattr(pptx_impl, "_render_pptx_slides_to_images", _fake_render([b"a", b"b", b"c"]))
+    db = tmp_path / "llm.sqlite"
+
+    first = pptx_impl._convert_pptx_multimodal(tmp_path / "deck.pptx", llm_cache=LLMCache(db))
+    assert fake_openai["requests"] == 3
+    cache = LLMCache(db)
+    second = pptx_impl._convert_pptx_multimodal(tmp_path / "deck.pptx", llm_cache=cache)
+    assert second == first
+    assert fake_openai["requests"] == 3
+    assert cache.stats() == {"hits": 3, "misses": 0}
+
+    pptx_impl._convert_pptx_multimodal(tmp_path / "deck.pptx", llm_cache=LLMCache(db, mode="refresh"))
+    assert fake_openai["requests"] == 6
+
+
+def test_llm_cache_modes_ttl_and_eviction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import time as time_mod
+
+    from thomas_utils.converters.llm_cache import LLMCache
+
+    db = tmp_path / "llm.sqlite"
+    k1 = LLMCache.key("gpt-4o", "prompt", b"img")
+    assert k1 != LLMCache.key("gpt-4o", "prompt", b"img2") != LLMCache.key("gpt-4o-mini", "prompt", b"img")
+
+    ro = LLMCache(db, mode="read-only")
+    ro.put(k1, "x")
+    assert ro.get(k1) is None
+
+    cache = LLMCache(db, max_size=10)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    assert cache.get("a") == "12345"  # a 가 더 최근 사용
+    cache.put("c", "12345")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345" and cache.get("c") == "12345"
+
+    expiring = LLMCache(db, ttl=60)
+    now = time_mod.time()
+    monkeypatch.setattr(time_mod, "time", lambda: now + 120)
+    assert expiring.get("a") is None
+    with pytest.raises(ValueError, match="Unknown LLM cache mode"):
+        LLMCache(db, mode="sometimes")
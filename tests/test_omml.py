@@ -0,0 +1,159 @@
+"""Tests for the built-in OMML -> LaTeX converter."""
+
+from pathlib import Path
+
+import pytest
+
+_NS = (
+    'xmlns:a14="http://schemas.microsoft.com/office/drawing/2010/main" '
+    'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math"'
+)
+
+
+def _r(text: str) -> str:
+    return f"<m:r><m:t>{text}</m:t></m:r>"
+
+
+def _latex(inner: str) -> str:
+    from lxml import etree
+
+    from thomas_utils.converters.omml import to_latex
+
+    return to_latex(etree.fromstring(f"<m:oMath {_NS}>{inner}</m:oMath>"))
+
+
+@pytest.mark.parametrize(
+    "inner, expected",
+    [
+        (f"<m:f><m:num>{_r('a')}</m:num><m:den>{_r('b+1')}</m:den></m:f>", r"\frac{a}{b+1}"),
+        (
+            f"<m:f><m:fPr><m:type m:val=\"lin\"/></m:fPr><m:num>{_r('a')}</m:num><m:den>{_r('b')}</m:den></m:f>",
+            "a/b",
+        ),
+        (f"<m:rad><m:deg>{_r('3')}</m:deg><m:e>{_r('x')}</m:e></m:rad>", r"\sqrt[3]{x}"),
+        (
+            f"<m:rad><m:radPr><m:degHide m:val=\"1\"/></m:radPr><m:deg/><m:e>{_r('x')}</m:e></m:rad>",
+            r"\sqrt{x}",
+        ),
+        (
+            f"<m:nary><m:naryPr><m:chr m:val=\"∑\"/></m:naryPr><m:sub>{_r('i=1')}</m:sub>"
+            f"<m:sup>{_r('n')}</m:sup><m:e>{_r('i')}</m:e></m:nary>",
+            r"\sum_{i=1}^{n}{i}",
+        ),
+        (f"<m:nary><m:sub/><m:sup/><m:e>{_r('f')}</m:e></m:nary>", r"\int{f}"),
+        (
+            "<m:d><m:e><m:m>"
+            f"<m:mr><m:e>{_r('1')}</m:e><m:e>{_r('0')}</m:e></m:mr>"
+            f"<m:mr><m:e>{_r('0')}</m:e><m:e>{_r('1')}</m:e></m:mr>"
+            "</m:m></m:e></m:d>",
+            r"\left(\begin{matrix}1 & 0 \\ 0 & 1\end{matrix}\right)",
+        ),
+        (f"<m:acc><m:accPr><m:chr m:val=\"⃗\"/></m:accPr><m:e>{_r('v')}</m:e></m:acc>", r"\vec{v}"),
+        (f"<m:acc><m:e>{_r('x')}</m:e></m:acc>", r"\hat{x}"),
+        (f"<m:sSup><m:e>{_r('x+1')}</m:e><m:sup>{_r('2')}</m:sup></m:sSup>", "{x+1}^{2}"),
+        (
+            f"<m:sSubSup><m:e>{_r('x')}</m:e><m:sub>{_r('i')}</m:sub><m:sup>{_r('2')}</m:sup></m:sSubSup>",
+            "x_{i}^{2}",
+        ),
+        (
+            f"<m:func><m:fName>{_r('sin')}</m:fName><m:e>{_r('θ')}</m:e></m:func>",
+            r"\sin{\theta}",
+        ),
+        (
+            f"<m:limLow><m:e>{_r('lim')}</m:e><m:lim>{_r('n→∞')}</m:lim></m:limLow>",
+            r"\lim_{n\rightarrow\infty}",
+        ),
+        (_r("α β≤Γ") + _r("50%"), r"\alpha \beta\leq\Gamma50\%"),
+        (_r("αx"), r"\alpha x"),
+    ],
+)
+def test_to_latex_constructs(inner: str, expected: str) -> None:
+    assert _latex(inner) == expected
+
+
+def test_to_latex_memoizes_identical_subtrees() -> None:
+    from lxml import etree
+
+    from thomas_utils.converters import omml
+
+    frac = f"<m:oMath><m:f><m:num>{_r('1')}</m:num><m:den>{_r('2')}</m:den></m:f></m:oMath>"
+    omml._convert_xml.cache_clear()
+    # 다른 문서에 있는 같은 수식은 뒤따르는 텍스트가 달라도 한 번만 변환
+    for i in range(5):
+        shape = etree.fromstring(f"<sp {_NS}>{frac}tail {i}</sp>")
+        assert omml.to_latex(shape[0]) == r"\frac{1}{2}"
+    info = omml._convert_xml.cache_info()
+    assert (info.misses, info.hits) == (1, 4)
+
+
+def test_has_math() -> None:
+    from lxml import etree
+
+    from thomas_utils.converters.omml import has_math
+
+    assert has_math(etree.fromstring(f"<a {_NS}><b><m:oMath>{_r('x')}</m:oMath></b></a>"))
+    assert not has_math(etree.fromstring("<a><b>x</b></a>"))
+
+
+@pytest.mark.parametrize("engine", ["python-pptx", "fast"])
+def test_pptx_equations_without_optional_package(tmp_path: Path, engine: str) -> None:
+    """Equations in text boxes come out as $$...$$ blocks with both engines."""
+    from lxml import etree
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    from thomas_utils.converters import convert_pptx
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    tf = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1)).text_frame
+    tf.text = "Energy"
+    math = (
+        f"<a14:m {_NS}><m:oMathPara><m:oMath>{_r('E=m')}"
+        f"<m:sSup><m:e>{_r('c')}</m:e><m:sup>{_r('2')}</m:sup></m:sSup></m:oMath></m:oMathPara></a14:m>"
+    )
+    tf.paragraphs[0]._p.append(etree.fromstring(math))
+    plain = prs.slides.add_slide(prs.slide_layouts[6])
+    plain.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1)).text_frame.text = "No math"
+    deck = tmp_path / "math.pptx"
+    prs.save(str(deck))
+
+    result = convert_pptx(deck, engine=engine)
+    assert "$$E=mc^{2}$$" in result
+    assert result.count("$$") == 2
+    assert result == convert_pptx(deck, engine="python-pptx" if engine == "fast" else "fast")
+
+
+@pytest.mark.parametrize("engine", ["python-pptx", "fast"])
+def test_pptx_equation_in_alternate_content(tmp_path: Path, engine: str) -> None:
+    """PowerPoint's mc:AlternateContent form: the mc:Choice shape is read, the mc:Fallback skipped."""
+    from lxml import etree
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    from thomas_utils.converters import convert_pptx
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    choice = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1))
+    choice.text_frame.text = "Energy"
+    math = (
+        f"<a14:m {_NS}><m:oMathPara><m:oMath>{_r('E=m')}"
+        f"<m:sSup><m:e>{_r('c')}</m:e><m:sup>{_r('2')}</m:sup></m:sSup></m:oMath></m:oMathPara></a14:m>"
+    )
+    choice.text_frame.paragraphs[0]._p.append(etree.fromstring(math))
+    fallback = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(1))
+    fallback.text_frame.text = "Energy (fallback image)"
+    mc = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+    alt = etree.SubElement(choice._element.getparent(), f"{{{mc}}}AlternateContent", nsmap={"mc": mc})
+    etree.SubElement(alt, f"{{{mc}}}Choice", Requires="a14").append(choice._element)
+    etree.SubElement(alt, f"{{{mc}}}Fallback").append(fallback._element)
+    slide.shapes.add_textbox(Inches(1), Inches(3), Inches(6), Inches(1)).text_frame.text = "After"
+    deck = tmp_path / "math.pptx"
+    prs.save(str(deck))
+
+    result = convert_pptx(deck, engine=engine)
+    assert result.count("$$E=mc^{2}$$") == 1
+    assert "fallback" not in result
+    assert result.index("Energy") < result.index("After")
+    assert result == convert_pptx(deck, engine="python-pptx" if engine == "fast" else "fast")
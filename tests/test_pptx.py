@@ -59,3 +59,168 @@ def test_convert_pptx_invalid_extension(tmp_path: Path) -> None:
     pdf_path.write_bytes(b"fake pdf")
     with pytest.raises(ValueError, match="Expected .pptx"):
         convert_pptx(str(pdf_path))
+
+
+def _make_multi_slide_pptx(path: Path, n: int = 4) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for i in range(n):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Deck title {i}"
+        slide.shapes.add_textbox(Inches(1), Inches(2), Inches(6), Inches(1)).text_frame.text = f"Body {i}"
+    prs.save(str(path))
+
+
+def test_convert_pptx_slide_selection(tmp_path: Path) -> None:
+    """slides= keeps only the selected slides, numbered by their original position."""
+    from thomas_utils.converters import convert_pptx
+
+    pptx_path = tmp_path / "deck.pptx"
+    _make_multi_slide_pptx(pptx_path)
+    result = convert_pptx(str(pptx_path), slides=[3, 1])
+    assert "## Slide 2" in result and "## Slide 4" in result
+    assert "## Slide 1\n" not in result and "## Slide 3" not in result
+    assert result.count("\n---\n") == 1
+    assert result.index("Body 1") < result.index("Body 3")
+
+    with pytest.raises(ValueError, match="out of range"):
+        convert_pptx(str(pptx_path), slides=[7])
+
+
+def test_unstructured_engine_slide_selection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The unstructured engine groups elements by page number and validates slides= like the others."""
+    import sys
+    import types
+
+    from thomas_utils.converters import convert_pptx
+
+    def partition_pptx(path):
+        pages = [(1, "Deck title 0"), (1, "Body 0"), (None, "Note 0"), (3, "Body 2")]
+        return [types.SimpleNamespace(text=t, metadata=types.SimpleNamespace(page_number=p)) for p, t in pages]
+
+    monkeypatch.setitem(sys.modules, "unstructured", types.ModuleType("unstructured"))
+    monkeypatch.setitem(sys.modules, "unstructured.partition", types.ModuleType("unstructured.partition"))
+    monkeypatch.setitem(
+        sys.modules, "unstructured.partition.pptx", types.SimpleNamespace(partition_pptx=partition_pptx)
+    )
+    pptx_path = tmp_path / "deck.pptx"
+    _make_multi_slide_pptx(pptx_path, n=3)
+
+    result = convert_pptx(str(pptx_path), engine="unstructured")
+    assert "## Slide 1\n**Type**: Content Slide\n\n### Content\n\nDeck title 0\n\nBody 0\n\nNote 0" in result
+    assert "## Slide 2\n" in result and result.rstrip().endswith("Body 2")
+    assert "Body 0" not in convert_pptx(str(pptx_path), engine="unstructured", slides=[2])
+    with pytest.raises(ValueError, match="out of range"):
+        convert_pptx(str(pptx_path), engine="unstructured", slides=[7])
+
+
+def test_iter_slides_matches_convert(tmp_path: Path) -> None:
+    """iter_slides() yields one block per slide; joined with separators it equals convert_pptx()."""
+    from thomas_utils.converters import convert_pptx, iter_slides
+
+    pptx_path = tmp_path / "deck.pptx"
+    _make_multi_slide_pptx(pptx_path)
+    items = list(iter_slides(pptx_path))
+    assert [it["slide"] for it in items] == [0, 1, 2, 3]
+    assert all(it["slide_count"] == 4 for it in items)
+    assert items[0]["text"].startswith("## Slide 1\n")
+    assert "\n\n---\n\n".join(it["text"] for it in items) + "\n" == convert_pptx(str(pptx_path))
+
+
+def _make_table_pptx(path: Path) -> None:
+    """One slide with a 3x3 table: header row, a 2-column merge and a 2-row merge."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    table = slide.shapes.add_table(3, 3, Inches(1), Inches(1), Inches(6), Inches(2)).table
+    for r, row in enumerate([["이름", "Q1", "Q2"], ["Merged cols", "", "x|y"], ["Tall", "a", ""]]):
+        for c, text in enumerate(row):
+            table.cell(r, c).text = text
+    table.cell(1, 0).merge(table.cell(1, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    prs.save(str(path))
+
+
+def test_table_markdown_and_html_with_merged_cells(tmp_path: Path) -> None:
+    """Tables render without pandas; merged text appears once, HTML keeps colspan/rowspan."""
+    from thomas_utils.converters import convert_pptx
+
+    pptx_path = tmp_path / "table.pptx"
+    _make_table_pptx(pptx_path)
+
+    md = convert_pptx(pptx_path)
+    lines = [l for l in md.splitlines() if l.startswith("|")]
+    assert lines[0].startswith("| 이름") and "Q1" in lines[0]
+    assert set(lines[1]) == {"|", "-"}
+    assert md.count("Merged cols") == 1 and "x\\|y" in md
+    # 동일한 표시 폭으로 정렬 (한글은 2칸)
+    from thomas_utils.converters.tables import display_width
+
+    assert len({display_width(l) for l in lines}) == 1
+
+    html = convert_pptx(pptx_path, table_format="html")
+    assert "<th>이름</th>" in html
+    assert '<td colspan="2">Merged cols</td>' in html
+    assert '<td rowspan="2">x|y</td>' in html
+    assert convert_pptx(pptx_path, table_format="auto") == html
+
+
+def _make_mixed_pptx(path: Path) -> None:
+    """Title / bullet / blank layouts with bodies, code lines, tables, a line break and a group."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for i in range(4):
+        slide = prs.slides.add_slide(prs.slide_layouts[(0, 1, 6, 1)[i]])
+        if slide.shapes.title is not None:
+            slide.shapes.title.text = f"Title {i}"
+        if i == 0:
+            slide.placeholders[1].text = "Subtitle 0"
+        if i in (1, 3):
+            tf = slide.placeholders[1].text_frame
+            tf.text = "Top level"
+            p = tf.add_paragraph()
+            p.text = "nested"
+            p.level = 1
+        tf = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(4), Inches(1)).text_frame
+        tf.text = f"Body {i}"
+        for line in ["import os", "def f():", "    return 1", "![img](x.png)", "a | b"]:
+            tf.add_paragraph().text = line
+        tf.paragraphs[0].add_line_break()
+        if i % 2 == 0:
+            table = slide.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(6), Inches(1)).table
+            for r in range(2):
+                for c in range(2):
+                    table.cell(r, c).text = f"r{r}c{c}"
+        slide.shapes.add_textbox(Inches(5), Inches(1), Inches(2), Inches(1)).text_frame.text = f"Side {i}"
+        slide.shapes.add_textbox(Inches(6), Inches(6), Inches(1), Inches(1))
+    group = prs.slides[2].shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(0.2), Inches(2), Inches(0.5)).text_frame.text = "Grouped text"
+    prs.save(str(path))
+
+
+def test_fast_engine_matches_python_pptx(tmp_path: Path) -> None:
+    """engine="fast" produces the python-pptx output and additionally reads group shapes."""
+    from thomas_utils.converters import convert_pptx
+
+    pptx_path = tmp_path / "mixed.pptx"
+    _make_mixed_pptx(pptx_path)
+    for table_format in ("markdown", "html"):
+        for slides in (None, [3, 0]):
+            ref = convert_pptx(pptx_path, slides=slides, table_format=table_format)
+            fast = convert_pptx(pptx_path, slides=slides, table_format=table_format, engine="fast")
+            # python-pptx는 그룹 내부를 보지 않으므로 그 줄만 다름
+            assert fast.replace("Grouped text\n\n", "") == ref
+
+    fast = convert_pptx(pptx_path, engine="fast")
+    slide3 = fast.split("\n---\n")[2]
+    assert slide3.index("Grouped text") < slide3.index("Side 2") < slide3.index("| r0c0")
+
+    table_path = tmp_path / "table.pptx"
+    _make_table_pptx(table_path)
+    assert convert_pptx(table_path, engine="fast", table_format="auto") == convert_pptx(table_path, table_format="auto")
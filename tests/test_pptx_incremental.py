@@ -0,0 +1,95 @@
+"""Tests for incremental PPTX re-conversion."""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+
+def _make_deck(path: Path, bodies: List[str]) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for i, body in enumerate(bodies):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Title {body}"
+        slide.shapes.add_textbox(Inches(1), Inches(2), Inches(6), Inches(1)).text_frame.text = f"Body {body}"
+    prs.save(str(path))
+
+
+def test_fingerprints_follow_slide_content(tmp_path: Path) -> None:
+    from thomas_utils.converters.pptx_incremental import slide_fingerprints
+
+    a, b = tmp_path / "a.pptx", tmp_path / "b.pptx"
+    _make_deck(a, ["one", "two", "three"])
+    _make_deck(b, ["one", "TWO", "three"])
+    fa, fb = slide_fingerprints(a), slide_fingerprints(b)
+    assert len(fa) == 3 and len(set(fa)) == 3
+    assert fa[0] == fb[0] and fa[2] == fb[2] and fa[1] != fb[1]
+
+
+@pytest.mark.parametrize("engine", ["python-pptx", "fast"])
+def test_incremental_reuses_unchanged_slides(tmp_path: Path, engine: str) -> None:
+    """Only edited / inserted slides are converted; output equals a full conversion."""
+    from thomas_utils.converters import SlideManifest, convert_pptx
+
+    deck = tmp_path / "deck.pptx"
+    manifest = SlideManifest(tmp_path / "deck.slides.json")
+
+    _make_deck(deck, ["one", "two", "three", "four"])
+    assert convert_pptx(deck, engine=engine, manifest=manifest) == convert_pptx(deck, engine=engine)
+    assert (manifest.reused, manifest.converted) == (0, 4)
+
+    _make_deck(deck, ["one", "TWO", "three", "four"])
+    assert convert_pptx(deck, engine=engine, manifest=manifest) == convert_pptx(deck, engine=engine)
+    assert (manifest.reused, manifest.converted) == (3, 1)
+
+    # 앞에 슬라이드를 끼워 넣으면 나머지는 번호만 바뀌어 재사용
+    _make_deck(deck, ["zero", "one", "TWO", "three", "four"])
+    result = convert_pptx(deck, engine=engine, manifest=manifest)
+    assert result == convert_pptx(deck, engine=engine)
+    assert (manifest.reused, manifest.converted) == (4, 1)
+    assert "## Slide 5\n" in result
+
+    assert convert_pptx(deck, engine=engine, slides=[4, 0], manifest=manifest) == convert_pptx(
+        deck, engine=engine, slides=[4, 0]
+    )
+    assert manifest.converted == 0
+
+
+def test_incremental_options_invalidate_manifest(tmp_path: Path) -> None:
+    from thomas_utils.converters import SlideManifest, convert_pptx
+
+    deck = tmp_path / "deck.pptx"
+    manifest = SlideManifest(tmp_path / "m.json")
+    _make_deck(deck, ["one", "two"])
+    convert_pptx(deck, manifest=manifest)
+    convert_pptx(deck, table_format="html", manifest=manifest)
+    assert manifest.converted == 2
+    with pytest.raises(ValueError, match="Incremental"):
+        convert_pptx(deck, engine="unstructured", manifest=manifest)
+
+
+def test_incremental_multimodal_renders_changed_slides_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The vision path renders (and would query) only slides missing from the manifest."""
+    from thomas_utils.converters import SlideManifest, convert_pptx, llm_client, pptx_impl
+
+    rendered: List[List[int]] = []
+
+    def fake_render(pptx_path, image_options=None, slides=None, pdf_cache_dir=None):
+        rendered.append(list(slides))
+        return {i: b"image %d" % i for i in slides}
+
+    monkeypatch.setattr(pptx_impl, "_render_pptx_slides_to_images", fake_render)
+    monkeypatch.setattr(llm_client, "openai_client", lambda: (None, "offline"))
+
+    deck = tmp_path / "deck.pptx"
+    manifest = SlideManifest(tmp_path / "m.json")
+    _make_deck(deck, ["one", "two", "three"])
+    first = convert_pptx(deck, use_llm_multimodal=True, manifest=manifest)
+    _make_deck(deck, ["one", "two", "THREE"])
+    second = convert_pptx(deck, use_llm_multimodal=True, manifest=manifest)
+    assert rendered == [[0, 1, 2], [2]]
+    assert second == first
+    assert (manifest.reused, manifest.converted) == (2, 1)
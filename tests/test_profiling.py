@@ -0,0 +1,95 @@
+"""Tests for stage profiling (thomas_utils.profiling and --profile)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+def _make_table_pptx(path: Path) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for i in range(3):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {i}"
+        slide.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(4), Inches(1))
+        slide.shapes.add_textbox(Inches(1), Inches(4), Inches(4), Inches(1)).text_frame.text = "Body"
+    prs.save(str(path))
+
+
+def test_span_is_noop_without_profiler() -> None:
+    """With no active profiler, span() hands out one shared no-op object."""
+    from thomas_utils import profiling
+
+    assert profiling.active() is None
+    assert profiling.span("a") is profiling.span("b")
+    with profiling.span("a"), profiling.document("doc"):
+        pass
+
+
+def test_profile_collects_stages_and_calls_back(tmp_path: Path) -> None:
+    """Converter stages are recorded per document and reported to the callback."""
+    from thomas_utils import profiling
+    from thomas_utils.converters import convert_pptx
+
+    pptx_path = tmp_path / "deck.pptx"
+    _make_table_pptx(pptx_path)
+    events = []
+    with profiling.profile(callback=events.append) as prof:
+        with profiling.document("deck"):
+            convert_pptx(pptx_path)
+        convert_pptx(pptx_path, engine="fast")
+    assert profiling.active() is None
+
+    docs = {d["document"]: d for d in prof.report()["documents"]}
+    stages = docs["deck"]["stages"]
+    assert stages["pptx.slide"]["count"] == 3 and stages["pptx.table"]["count"] == 3
+    assert stages["pptx.open"]["count"] == 1
+    assert docs["deck"]["seconds"] >= stages["pptx.slide"]["seconds"] > 0
+    assert docs[None]["stages"]["pptx.slide"]["count"] == 3
+    assert {e["document"] for e in events} == {"deck", None}
+    assert all("peak_bytes" not in st for st in stages.values())
+
+
+def test_profile_memory_peaks_nest() -> None:
+    """With memory=True a parent span's peak covers the allocations of nested spans."""
+    from thomas_utils import profiling
+
+    with profiling.profile(memory=True) as prof:
+        with profiling.span("outer"):
+            with profiling.span("inner"):
+                data = bytearray(4 * 2**20)
+                del data
+            with profiling.span("after"):
+                pass
+    stages = prof.report()["documents"][0]["stages"]
+    assert stages["inner"]["peak_bytes"] >= 4 * 2**20
+    assert stages["outer"]["peak_bytes"] >= stages["inner"]["peak_bytes"]
+    assert stages["after"]["peak_bytes"] < 2**20
+
+
+def test_cli_profile_writes_report(tmp_path: Path) -> None:
+    """pdf2md --profile writes one document with its stage breakdown."""
+    import pymupdf
+
+    pdf_path = tmp_path / "in.pdf"
+    doc = pymupdf.open()
+    for i in range(2):
+        doc.new_page().insert_text((72, 72), f"Page {i}")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    report_path = tmp_path / "profile.json"
+    subprocess.run(
+        [sys.executable, "-m", "thomas_utils", "pdf2md", str(pdf_path), "-o", str(tmp_path / "out.md"), "--profile", str(report_path)],
+        check=True,
+        capture_output=True,
+        cwd=str(Path(__file__).resolve().parents[1]),
+    )
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    (doc_report,) = report["documents"]
+    assert doc_report["document"] == str(pdf_path)
+    assert doc_report["stages"]["pymupdf.page"]["count"] == 2
+    assert "write" in doc_report["stages"]
@@ -0,0 +1,196 @@
+"""Tests for the serve mode (local conversion service)."""
+
+import http.client
+import json
+import queue
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _make_pdf(path: Path) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for n in range(2):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Served page {n}.")
+    doc.save(str(path))
+    doc.close()
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: str):
+        super().__init__("localhost")
+        self.socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def _request(conn, method: str, url: str, body=None, headers=None):
+    conn.request(method, url, body=body, headers=headers or {})
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_http_convert_sync_and_async(tmp_path: Path) -> None:
+    """Path and upload jobs return the same Markdown as convert(); metrics count them."""
+    from thomas_utils.converters import convert
+    from thomas_utils.server import ConversionService, make_server
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path)
+    expected = convert(str(pdf_path), engine="pymupdf")
+
+    with ConversionService(workers=1, input_root=tmp_path) as service:
+        server = make_server(service, port=0)
+        _serve(server)
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+            status, job = _request(
+                conn, "POST", "/convert", json.dumps({"path": str(pdf_path)}), {"Content-Type": "application/json"}
+            )
+            assert status == 200 and job["status"] == "done"
+            assert job["markdown"] == expected
+
+            status, job = _request(
+                conn, "POST", "/convert?wait=0", pdf_path.read_bytes(), {"Content-Type": "application/pdf"}
+            )
+            assert status == 202
+            status, job = _request(conn, "GET", f"/jobs/{job['id']}?wait=30")
+            assert status == 200 and job["markdown"] == expected
+            assert _request(conn, "DELETE", f"/jobs/{job['id']}")[0] == 200
+            assert _request(conn, "GET", f"/jobs/{job['id']}")[0] == 404
+
+            missing = json.dumps({"path": str(tmp_path / "missing.pdf")})
+            status, err = _request(conn, "POST", "/convert", missing, {"Content-Type": "application/json"})
+            assert status == 404 and "not found" in err["error"]
+            assert _request(conn, "POST", "/convert", b"plain text", {"Content-Type": "text/plain"})[0] == 400
+            # 입력 루트 밖의 파일은 상대 경로든 절대 경로든 거부
+            outside = json.dumps({"path": "../" + tmp_path.name + "/../../etc/passwd"})
+            assert _request(conn, "POST", "/convert", outside, {"Content-Type": "application/json"})[0] == 403
+            outside = json.dumps({"path": "/etc/passwd"})
+            assert _request(conn, "POST", "/convert", outside, {"Content-Type": "application/json"})[0] == 403
+            relative = json.dumps({"path": "doc.pdf"})
+            status, job = _request(conn, "POST", "/convert", relative, {"Content-Type": "application/json"})
+            assert status == 200 and job["markdown"] == expected
+
+            status, metrics = _request(conn, "GET", "/metrics")
+            assert metrics["jobs"]["submitted"] == 3
+            assert metrics["jobs"]["completed"] == 3
+            assert metrics["queue_depth"] == 0
+            assert metrics["latency_seconds"]["run"]["max"] > 0
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_queue_full_rejects(tmp_path: Path) -> None:
+    """submit() raises queue.Full once the bounded queue is full (workers not started)."""
+    from thomas_utils.server import ConversionService
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path)
+    service = ConversionService(workers=1, queue_size=1, input_root=tmp_path)
+    try:
+        service.submit(path=pdf_path)
+        with pytest.raises(queue.Full):
+            service.submit(path=pdf_path)
+        assert service.metrics()["jobs"]["rejected"] == 1
+    finally:
+        service.start()
+        service.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available")
+def test_unix_socket_process_pool(tmp_path: Path) -> None:
+    """Unix socket transport with a persistent process pool."""
+    from thomas_utils.converters import convert
+    from thomas_utils.server import ConversionService, make_server
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path)
+    sock = tmp_path / "serve.sock"
+
+    with ConversionService(workers=2) as service:
+        server = make_server(service, socket_path=sock)
+        _serve(server)
+        try:
+            conn = _UnixConnection(str(sock))
+            status, job = _request(
+                conn, "POST", "/convert?pages=1", pdf_path.read_bytes(), {"Content-Type": "application/octet-stream"}
+            )
+            assert status == 200
+            assert job["markdown"] == convert(str(pdf_path), pages=[1], engine="pymupdf")
+            assert _request(conn, "GET", "/metrics")[1]["mode"] == "process"
+        finally:
+            server.shutdown()
+            server.server_close()
+    assert not sock.exists()
+
+
+def test_path_jobs_need_input_root(tmp_path: Path) -> None:
+    from thomas_utils.server import ConversionService
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path)
+    with ConversionService(workers=1) as service:
+        with pytest.raises(PermissionError, match="input root"):
+            service.submit(path=pdf_path)
+        assert service.submit(data=pdf_path.read_bytes()).done.wait(30)
+    (tmp_path / "root").mkdir()
+    (tmp_path / "root" / "link.pdf").symlink_to(pdf_path)
+    with ConversionService(workers=1, input_root=tmp_path / "root") as service:
+        with pytest.raises(PermissionError, match="outside"):
+            service.submit(path="link.pdf")
+
+
+def test_bad_content_length_rejected(tmp_path: Path) -> None:
+    """Negative or non-numeric Content-Length gets 400 instead of a blocked or dropped request."""
+    from thomas_utils.server import ConversionService, make_server
+
+    with ConversionService(workers=1) as service:
+        server = make_server(service, port=0)
+        _serve(server)
+        try:
+            for length in ("-1", "abc"):
+                with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=10) as sock:
+                    sock.sendall(
+                        b"POST /convert HTTP/1.1\r\nHost: x\r\nContent-Type: application/pdf\r\n"
+                        b"Content-Length: " + length.encode() + b"\r\n\r\n"
+                    )
+                    assert sock.recv(1024).startswith(b"HTTP/1.1 400")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_pool_restarted_without_fork_after_worker_death(tmp_path: Path) -> None:
+    """A dead worker fails only its job; the pool is rebuilt with forkserver/spawn and keeps serving."""
+    import os
+    import signal
+
+    from thomas_utils.server import ConversionService
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path)
+    with ConversionService(workers=2, input_root=tmp_path) as service:
+        old = service._pool
+        for pid in list(old._processes):
+            os.kill(pid, signal.SIGKILL)
+        job = service.submit(path=pdf_path)
+        assert job.done.wait(60) and job.status == "failed" and "restarted" in job.error
+        assert service._pool is not old
+        assert service._pool._mp_context.get_start_method() in ("forkserver", "spawn")
+        job = service.submit(path=pdf_path)
+        assert job.done.wait(120) and job.status == "done"
@@ -0,0 +1,99 @@
+"""Tests for slide image rasterization and encoding (vision LLM input)."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+
+def _make_slide_pdf(path: Path) -> None:
+    """One 16:9 page (720x405 pt) with some text in the middle and empty margins."""
+    import pymupdf
+
+    doc = pymupdf.open()
+    page = doc.new_page(width=720, height=405)
+    page.insert_text((200, 200), "Quarterly results", fontsize=24)
+    page.draw_rect(pymupdf.Rect(200, 220, 500, 260), color=(0.8, 0.1, 0.1), fill=(0.8, 0.1, 0.1))
+    doc.save(str(path))
+    doc.close()
+
+
+def _size(data: bytes):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as im:
+        return im.size, im.mode, im.format
+
+
+def test_default_render_is_unchanged_png(tmp_path: Path) -> None:
+    """Without options the page is a PNG at PyMuPDF's default resolution, as before."""
+    import pymupdf
+
+    from thomas_utils.converters.slide_images import image_mime, render_page
+
+    _make_slide_pdf(tmp_path / "s.pdf")
+    with pymupdf.open(str(tmp_path / "s.pdf")) as doc:
+        data = render_page(doc[0])
+        assert data == doc[0].get_pixmap(alpha=False).tobytes("png")
+    assert image_mime(data) == "image/png"
+
+
+def test_dpi_max_edge_and_jpeg(tmp_path: Path) -> None:
+    import pymupdf
+
+    from thomas_utils.converters.slide_images import ImageOptions, image_mime, render_page
+
+    _make_slide_pdf(tmp_path / "s.pdf")
+    with pymupdf.open(str(tmp_path / "s.pdf")) as doc:
+        big = render_page(doc[0], ImageOptions(dpi=144))
+        capped = render_page(doc[0], ImageOptions(dpi=144, max_edge=512))
+        jpeg = render_page(doc[0], ImageOptions(format="jpeg", quality=60, grayscale=True))
+    pytest.importorskip("PIL")
+    assert _size(big)[0] == (1440, 810)
+    assert max(_size(capped)[0]) == 512
+    assert image_mime(jpeg) == "image/jpeg"
+    assert _size(jpeg)[1] == "L"
+
+
+def test_autocrop_and_auto_picks_smallest(tmp_path: Path) -> None:
+    pytest.importorskip("PIL")
+    import pymupdf
+
+    from thomas_utils.converters.slide_images import ImageOptions, render_page
+
+    _make_slide_pdf(tmp_path / "s.pdf")
+    with pymupdf.open(str(tmp_path / "s.pdf")) as doc:
+        cropped = render_page(doc[0], ImageOptions(autocrop=True))
+        auto = render_page(doc[0], ImageOptions(format="auto", max_edge=640))
+        candidates = [render_page(doc[0], ImageOptions(format=f, max_edge=640)) for f in ("png", "jpeg", "webp")]
+    (w, h), _, _ = _size(cropped)
+    assert w < 720 and h < 405
+    assert len(auto) == min(len(c) for c in candidates)
+
+
+def test_image_options_validation() -> None:
+    from thomas_utils.converters.slide_images import ImageOptions
+
+    with pytest.raises(ValueError, match="format"):
+        ImageOptions(format="gif")
+    with pytest.raises(ValueError, match="quality"):
+        ImageOptions(quality=0)
+
+
+def test_render_pdf_pages_parallel_matches_serial(tmp_path: Path) -> None:
+    """The process-pool path renders only the requested pages, identical to serial rendering."""
+    import pymupdf
+
+    from thomas_utils.converters.slide_images import render_pdf_pages
+
+    doc = pymupdf.open()
+    for i in range(12):
+        doc.new_page(width=320, height=180).insert_text((40, 90), f"Slide {i + 1}")
+    doc.save(str(tmp_path / "deck.pdf"))
+    doc.close()
+
+    pages = [11, 0, 3, 4, 5, 6, 7, 8, 9]
+    serial = render_pdf_pages(tmp_path / "deck.pdf", pages, workers=1)
+    parallel = render_pdf_pages(tmp_path / "deck.pdf", pages, workers=3)
+    assert list(parallel) == pages
+    assert parallel == serial
@@ -0,0 +1,182 @@
+"""Tests for the LibreOffice instance pool, using a fake soffice executable."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_FAKE_SOFFICE = '''#!{python}
+import sys, time
+from pathlib import Path
+
+args = sys.argv[1:]
+profile = next(a.split("=", 1)[1] for a in args if a.startswith("-env:UserInstallation="))
+outdir = Path(args[args.index("--outdir") + 1])
+src = Path(args[-1])
+with open({log!r}, "a") as f:
+    f.write(profile + "\\n")
+if "hang" in src.name:
+    time.sleep(30)
+time.sleep(0.2)
+import pymupdf
+doc = pymupdf.open()
+doc.new_page().insert_text((72, 72), src.stem)
+doc.save(str(outdir / (src.stem + ".pdf")))
+'''
+
+
+@pytest.fixture
+def fake_soffice(tmp_path: Path) -> Path:
+    log = tmp_path / "soffice.log"
+    exe = tmp_path / "soffice"
+    exe.write_text(_FAKE_SOFFICE.format(python=sys.executable, log=str(log)))
+    exe.chmod(0o755)
+    return exe
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake soffice is a POSIX script")
+def test_pool_runs_in_parallel_with_separate_profiles(fake_soffice: Path, tmp_path: Path) -> None:
+    from thomas_utils.converters.soffice_pool import SofficePool
+
+    pool = SofficePool(size=2, soffice=str(fake_soffice), use_uno=False)
+    srcs = []
+    for i in range(4):
+        src = tmp_path / f"deck{i}.pptx"
+        src.write_bytes(b"pptx")
+        srcs.append(src)
+    outs = []
+    start = time.monotonic()
+    threads = [
+        threading.Thread(target=lambda s=s: outs.append(pool.convert_to_pdf(s, tmp_path)))
+        for s in srcs
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - start
+    pool.close()
+
+    assert sorted(p.name for p in outs) == [f"deck{i}.pdf" for i in range(4)]
+    profiles = (tmp_path / "soffice.log").read_text().split()
+    assert len(set(profiles)) == 2
+    assert elapsed < 4 * 0.2 + 2.0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake soffice is a POSIX script")
+def test_pool_restarts_hung_instance(fake_soffice: Path, tmp_path: Path) -> None:
+    from thomas_utils.converters.soffice_pool import SofficePool
+
+    pool = SofficePool(size=1, timeout=1.0, soffice=str(fake_soffice), use_uno=False)
+    hang = tmp_path / "hang.pptx"
+    hang.write_bytes(b"pptx")
+    with pytest.raises(RuntimeError, match="timed out"):
+        pool.convert_to_pdf(hang, tmp_path)
+    ok = tmp_path / "ok.pptx"
+    ok.write_bytes(b"pptx")
+    assert pool.convert_to_pdf(ok, tmp_path).exists()
+    pool.close()
+
+
+def test_pool_missing_soffice(tmp_path: Path) -> None:
+    from thomas_utils.converters.soffice_pool import SofficePool
+
+    pool = SofficePool(size=1, soffice=str(tmp_path / "no-such-soffice"), use_uno=False)
+    src = tmp_path / "deck.pptx"
+    src.write_bytes(b"pptx")
+    with pytest.raises(FileNotFoundError, match="soffice"):
+        pool.convert_to_pdf(src, tmp_path)
+    pool.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake soffice is a POSIX script")
+def test_cached_pdf_skips_office_for_unchanged_deck(fake_soffice: Path, tmp_path: Path) -> None:
+    from thomas_utils.converters.soffice_pool import SofficePool, cached_pdf
+
+    pool = SofficePool(size=1, soffice=str(fake_soffice), use_uno=False)
+    log = tmp_path / "soffice.log"
+    cache_dir = tmp_path / "pdfcache"
+    deck = tmp_path / "deck.pptx"
+    deck.write_bytes(b"pptx v1")
+
+    first = cached_pdf(deck, cache_dir, pool=pool)
+    again = cached_pdf(deck, cache_dir, pool=pool)
+    assert first == again and first.exists()
+    assert len(log.read_text().split()) == 1
+
+    deck.write_bytes(b"pptx v2")
+    changed = cached_pdf(deck, cache_dir, max_size=1, pool=pool)
+    pool.close()
+    assert changed != first
+    assert len(log.read_text().split()) == 2
+    # 최대 크기를 넘으면 오래된 PDF부터 지우되 방금 만든 것은 유지
+    assert sorted(cache_dir.glob("*.pdf")) == [changed]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake soffice is a POSIX script")
+def test_cached_pdf_survives_eviction(fake_soffice: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """With out_dir the caller keeps its own link, even if another process evicts the cache entry."""
+    import os
+
+    from thomas_utils.converters.soffice_pool import SofficePool, cached_pdf
+
+    pool = SofficePool(size=1, soffice=str(fake_soffice), use_uno=False)
+    log = tmp_path / "soffice.log"
+    cache_dir = tmp_path / "pdfcache"
+    out_dir = tmp_path / "mine"
+    out_dir.mkdir()
+    deck = tmp_path / "deck.pptx"
+    deck.write_bytes(b"pptx")
+
+    mine = cached_pdf(deck, cache_dir, pool=pool, out_dir=out_dir)
+    (entry,) = cache_dir.glob("*.pdf")
+    assert mine.parent == out_dir and mine.read_bytes() == entry.read_bytes()
+    entry.unlink()
+    assert mine.exists()
+
+    # 적중 확인 직후 다른 프로세스가 지우면 다시 변환
+    cached_pdf(deck, cache_dir, pool=pool)
+    real_link = os.link
+    evicted: list = []
+
+    def evicting_link(src, dst):
+        if not evicted:
+            evicted.append(src)
+            Path(src).unlink()
+        real_link(src, dst)
+
+    monkeypatch.setattr(os, "link", evicting_link)
+    mine.unlink()
+    again = cached_pdf(deck, cache_dir, pool=pool, out_dir=out_dir)
+    pool.close()
+    assert evicted == [entry] and again == mine and mine.exists() and entry.exists()
+    assert len(log.read_text().split()) == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake soffice is a POSIX script")
+def test_render_slides_uses_cached_pdf(
+    fake_soffice: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from thomas_utils.converters import pptx_impl, soffice_pool
+
+    pool = soffice_pool.SofficePool(size=1, soffice=str(fake_soffice), use_uno=False)
+    monkeypatch.setattr(soffice_pool, "get_pool", lambda: pool)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    deck = tmp_path / "deck.pptx"
+    deck.write_bytes(b"pptx")
+    cache_dir = tmp_path / "pdfcache"
+
+    first = pptx_impl._render_pptx_slides_to_images(deck, pdf_cache_dir=cache_dir)
+    second = pptx_impl._render_pptx_slides_to_images(deck, slides=[0], pdf_cache_dir=cache_dir)
+    assert list(first) == [0] and first[0].startswith(b"\x89PNG")
+    assert second == first
+    assert len((tmp_path / "soffice.log").read_text().split()) == 1
+    # 캐시 디렉터리를 주지 않으면 매번 변환하고 아무 데도 남기지 않음
+    assert pptx_impl._render_pptx_slides_to_images(deck) == first
+    assert len((tmp_path / "soffice.log").read_text().split()) == 2
+    assert not (tmp_path / "home").exists()
+    with pytest.raises(ValueError, match="out of range"):
+        pptx_impl._render_pptx_slides_to_images(deck, slides=[3], pdf_cache_dir=cache_dir)
+    pool.close()
@@ -0,0 +1,102 @@
+"""Tests for memory-bounded windowed PDF conversion."""
+
+from pathlib import Path
+
+import pytest
+
+
+def _make_pdf(path: Path, pages: int = 5) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for n in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {n}", fontsize=18)
+        page.insert_text((72, 110), f"Body text on page {n} for thomas_utils.")
+    doc.save(str(path))
+    doc.close()
+
+
+def test_windows_match_convert(tmp_path: Path) -> None:
+    """Joined windows equal convert() and respect the window size."""
+    from thomas_utils.converters import convert, iter_windows
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path)
+    chunks = list(iter_windows(pdf_path, window=2))
+    assert [c["pages"] for c in chunks] == [[0, 1], [2, 3], [4]]
+    assert all(c["page_count"] == 5 for c in chunks)
+    assert "".join(c["text"] for c in chunks) == convert(str(pdf_path), engine="pymupdf")
+    chunks = list(iter_windows(pdf_path, window=2, pages=[4, 1, 3, 1]))
+    assert [c["pages"] for c in chunks] == [[1, 3], [4]]
+    assert "".join(c["text"] for c in chunks) == convert(str(pdf_path), pages=[4, 1, 3, 1], engine="pymupdf")
+
+
+def test_windows_validate_arguments(tmp_path: Path) -> None:
+    from thomas_utils.converters import iter_windows
+
+    pdf_path = tmp_path / "doc.pdf"
+    _make_pdf(pdf_path, pages=2)
+    with pytest.raises(ValueError, match="window"):
+        next(iter_windows(pdf_path, window=0))
+    with pytest.raises(ValueError, match="out of range"):
+        next(iter_windows(pdf_path, pages=[5]))
+
+
+def test_next_window_size() -> None:
+    """The window shrinks near the RSS ceiling and never exceeds the configured size."""
+    from thomas_utils.converters.windowed import next_window_size
+
+    mb = 1 << 20
+    assert next_window_size(50, None, 50, 100 * mb, 200 * mb, 100 * mb) == 50
+    # 페이지당 2MB, 여유 80MB -> 40페이지
+    assert next_window_size(50, 200 * mb, 50, 100 * mb, 200 * mb, 100 * mb) == 40
+    assert next_window_size(50, 1000 * mb, 50, 100 * mb, 200 * mb, 100 * mb) == 50
+    assert next_window_size(50, 100 * mb, 50, 100 * mb, 200 * mb, 150 * mb) == 1
+
+
+def test_cli_pdf2md_window(tmp_path: Path) -> None:
+    from thomas_utils.cli import _pdf2md
+    from thomas_utils.converters import convert
+
+    pdf_path = tmp_path / "doc.pdf"
+    out = tmp_path / "doc.md"
+    _make_pdf(pdf_path)
+
+    class Args:
+        input = str(pdf_path)
+        output = str(out)
+        pages = None
+        engine = "pymupdf"
+        window = 2
+        max_rss = "64G"
+
+    assert _pdf2md(Args()) == 0
+    assert out.read_text(encoding="utf-8") == convert(str(pdf_path), engine="pymupdf")
+
+
+def test_batch_window(tmp_path: Path) -> None:
+    from thomas_utils.converters import convert
+    from thomas_utils.converters.batch import convert_many
+
+    pdf_path = tmp_path / "in" / "doc.pdf"
+    pdf_path.parent.mkdir()
+    _make_pdf(pdf_path)
+    results = convert_many([tmp_path / "in"], tmp_path / "out", workers=1, window=2, progress=None)
+    assert results[0]["error"] is None
+    assert (tmp_path / "out" / "doc.md").read_text(encoding="utf-8") == convert(str(pdf_path), engine="pymupdf")
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "x"])
+def test_cli_rejects_bad_window(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, value: str
+) -> None:
+    """--window below 1 is a usage error instead of silently turning windowing off."""
+    from thomas_utils.cli import main
+
+    for command in ("pdf2md", "batch"):
+        monkeypatch.setattr("sys.argv", ["thomas-utils", command, str(tmp_path / "doc.pdf"), "--window", value])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 2
+        assert "--window" in capsys.readouterr().err
@@ -3,6 +3,7 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import Iterable
 
 
 def _parse_pages(s: str) -> list[int]:
@@ -17,8 +18,143 @@ def _parse_pages(s: str) -> list[int]:
     return sorted(set(out))
 
 
+def _make_cache(args: argparse.Namespace):
+    """ConversionCache from --cache-dir / --cache-max-size, or None when caching is off."""
+    cache_dir = getattr(args, "cache_dir", None)
+    if not cache_dir:
+        return None
+    from thomas_utils.converters.cache import ConversionCache
+
+    return ConversionCache(cache_dir, max_size=getattr(args, "cache_max_size", None))
+
+
+def _make_llm_cache(args: argparse.Namespace):
+    """LLMCache for the LLM / multimodal paths from --llm-cache* options, or None."""
+    if not (getattr(args, "pptx_use_llm", False) or getattr(args, "pptx_use_llm_multimodal", False)):
+        return None
+    mode = getattr(args, "llm_cache", "on") or "on"
+    if mode == "off":
+        return None
+    from thomas_utils.converters.llm_cache import LLMCache
+
+    return LLMCache(
+        getattr(args, "llm_cache_path", None),
+        mode=mode,
+        ttl=getattr(args, "llm_cache_ttl", None),
+        max_size=getattr(args, "llm_cache_max_size", None),
+    )
+
+
+def _add_cache_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Reuse results for identical inputs/options from this cache directory (default: off)",
+    )
+    p.add_argument(
+        "--cache-max-size",
+        metavar="SIZE",
+        help="Evict least-recently-used cache entries beyond this size, e.g. 500M, 2G (default: unbounded)",
+    )
+
+
+def _add_profile_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--profile",
+        metavar="OUT.json",
+        help="Write a per-document, per-stage timing breakdown to this JSON file",
+    )
+    p.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile, also record tracemalloc peaks per stage (slower)",
+    )
+
+
+def _write_chunks(out_path: Path, chunks: Iterable[str]) -> None:
+    """Write output text to out_path piece by piece as it is produced; remove the partial file on error."""
+    from thomas_utils.profiling import span
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(out_path, "w", encoding="utf-8") as f:
+            for text in chunks:
+                with span("write"):
+                    f.write(text)
+                    f.flush()
+    except BaseException:
+        out_path.unlink(missing_ok=True)
+        raise
+
+
+_SUFFIXES = {"markdown": ".md", "json": ".json", "jsonl": ".jsonl"}
+
+
+def _add_format_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--format",
+        choices=tuple(_SUFFIXES),
+        default="markdown",
+        dest="output_format",
+        help="Markdown; JSON with one object per page/slide and typed content blocks; "
+        "or JSONL with one token-capped chunk per line for embedding (default: markdown)",
+    )
+    p.add_argument(
+        "--chunk-tokens",
+        type=int,
+        default=512,
+        metavar="N",
+        help="With --format jsonl, maximum tokens per chunk (default: 512)",
+    )
+    p.add_argument(
+        "--chunk-overlap",
+        type=int,
+        default=64,
+        metavar="N",
+        help="With --format jsonl, tokens repeated from the previous chunk of the same page/slide (default: 64)",
+    )
+
+
+def _format_chunks(doc, output_format: str, args: argparse.Namespace) -> Iterable[str]:
+    """Text pieces of an IR document in the --format output format, produced as units arrive."""
+    from thomas_utils.converters import ir
+
+    if output_format == "json":
+        return ir.iter_json(doc)
+    if output_format == "jsonl":
+        from thomas_utils.converters.chunking import iter_jsonl
+
+        return iter_jsonl(doc, getattr(args, "chunk_tokens", 512), getattr(args, "chunk_overlap", 64))
+    return ir.iter_markdown(doc)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for an integer of at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def _add_window_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--window",
+        type=_positive_int,
+        metavar="N",
+        help="Convert PDFs N pages at a time, freeing memory between windows (default: off; 50 with --max-rss)",
+    )
+    p.add_argument(
+        "--max-rss",
+        metavar="SIZE",
+        help="Soft memory ceiling for windowed conversion, e.g. 2G; the window shrinks as it is approached",
+    )
+
+
 def _pdf2md(args: argparse.Namespace) -> int:
-    from thomas_utils.converters import convert
+    from thomas_utils.converters import convert, ir, iter_convert, iter_windows
 
     pdf = Path(args.input)
     if not pdf.exists():
@@ -28,11 +164,40 @@ def _pdf2md(args: argparse.Namespace) -> int:
         print(f"Error: expected .pdf file, got: {pdf}", file=sys.stderr)
         return 1
 
-    out_path = Path(args.output) if args.output else Path("output") / (pdf.stem + ".md")
+    output_format = getattr(args, "output_format", "markdown")
+    suffix = _SUFFIXES.get(output_format, ".md")
+    out_path = Path(args.output) if args.output else Path("output") / (pdf.stem + suffix)
     pages = _parse_pages(args.pages) if args.pages else None
 
     try:
-        md = convert(str(pdf), pages=pages, engine=args.engine)
+        cache = _make_cache(args)
+        jobs = getattr(args, "jobs", None)
+        window = getattr(args, "window", None)
+        max_rss = getattr(args, "max_rss", None)
+        if output_format != "markdown":
+            if window is not None or max_rss or cache is not None or (jobs and jobs > 1):
+                raise ValueError(
+                    f"--format {output_format} cannot be combined with --window/--max-rss, --cache-dir or --jobs"
+                )
+            doc = ir.Document(pdf.name, ir.pages(iter_convert(str(pdf), pages=pages, engine=args.engine)))
+            chunks: Iterable[str] = _format_chunks(doc, output_format, args)
+        elif window is not None or max_rss:
+            if cache is not None or (jobs and jobs > 1):
+                raise ValueError("--window/--max-rss cannot be combined with --cache-dir or --jobs")
+            # 창 단위로 변환 -> 기록 -> 메모리 해제를 반복
+            chunks = (
+                c["text"]
+                for c in iter_windows(
+                    str(pdf), engine=args.engine, window=window if window is not None else 50, max_rss=max_rss, pages=pages
+                )
+            )
+        elif cache is not None or (jobs and jobs > 1):
+            chunks = [convert(str(pdf), pages=pages, engine=args.engine, cache=cache, workers=jobs)]
+        else:
+            # 페이지 단위로 변환되는 즉시 파일에 기록 (메모리 일정, 첫 바이트 빠름)
+            doc = ir.Document(pdf.name, ir.pages(iter_convert(str(pdf), pages=pages, engine=args.engine)))
+            chunks = ir.iter_markdown(doc)
+        _write_chunks(out_path, chunks)
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -49,14 +214,31 @@ def _pdf2md(args: argparse.Namespace) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(md, encoding="utf-8")
-    print(f"Wrote {out_path}")
+    print(f"Wrote {out_path}" + (" (cached)" if cache is not None and cache.hits else ""))
     return 0
 
 
+def _make_image_options(args: argparse.Namespace):
+    """ImageOptions for multimodal slide images from --image-* options, or None (PNG at 72 dpi)."""
+    fields = {
+        "dpi": getattr(args, "image_dpi", None),
+        "max_edge": getattr(args, "image_max_edge", None),
+        "format": getattr(args, "image_format", None),
+        "quality": getattr(args, "image_quality", None),
+        "grayscale": getattr(args, "image_grayscale", False) or None,
+        "autocrop": getattr(args, "image_autocrop", False) or None,
+    }
+    fields = {k: v for k, v in fields.items() if v is not None}
+    if not fields:
+        return None
+    from thomas_utils.converters.slide_images import ImageOptions
+
+    return ImageOptions(**fields)
+
+
 def _pptx2md(args: argparse.Namespace) -> int:
-    from thomas_utils.converters import convert_pptx
+    from thomas_utils.converters import convert_pptx, ir
+    from thomas_utils.converters.pptx_impl import iter_units
 
     pptx = Path(args.input)
     if not pptx.exists():
@@ -66,15 +248,51 @@ def _pptx2md(args: argparse.Namespace) -> int:
         print(f"Error: expected .pptx file, got: {pptx}", file=sys.stderr)
         return 1
 
-    # 마크다운은 항상 output/ 폴더에 저장
-    out_path = Path("output") / (Path(args.output).name if args.output else (pptx.stem + ".md"))
+    output_format = getattr(args, "output_format", "markdown")
+    suffix = _SUFFIXES.get(output_format, ".md")
+    # 결과는 항상 output/ 폴더에 저장
+    out_path = Path("output") / (Path(args.output).name if args.output else (pptx.stem + suffix))
+
+    slides = _parse_pages(args.slides) if getattr(args, "slides", None) else None
+
+    manifest = None
+    incremental = getattr(args, "incremental", None)
+    if incremental is not None:
+        from thomas_utils.converters import SlideManifest
+
+        manifest = SlideManifest(incremental or out_path.with_suffix(".slides.json"))
 
+    use_llm = getattr(args, "pptx_use_llm", False)
+    use_llm_multimodal = getattr(args, "pptx_use_llm_multimodal", False)
+    engine = getattr(args, "pptx_engine", "python-pptx")
+    table_format = getattr(args, "table_format", "markdown")
     try:
+        cache = _make_cache(args)
+        if cache is None and manifest is None and not (use_llm or use_llm_multimodal):
+            # 슬라이드 단위로 추출되는 즉시 파일에 기록
+            doc = ir.Document(pptx.name, iter_units(str(pptx), slides, table_format, engine))
+            _write_chunks(out_path, _format_chunks(doc, output_format, args))
+            print(f"Wrote {out_path}")
+            return 0
+        if output_format != "markdown":
+            raise ValueError(
+                f"--format {output_format} cannot be combined with --pptx-use-llm, "
+                "--pptx-use-llm-multimodal, --incremental or --cache-dir"
+            )
         md = convert_pptx(
             str(pptx),
-            use_llm=getattr(args, "pptx_use_llm", False),
-            engine=getattr(args, "pptx_engine", "python-pptx"),
-            use_llm_multimodal=getattr(args, "pptx_use_llm_multimodal", False),
+            slides=slides,
+            use_llm=use_llm,
+            engine=engine,
+            use_llm_multimodal=use_llm_multimodal,
+            cache=cache,
+            llm_concurrency=getattr(args, "llm_concurrency", 4),
+            llm_rate=getattr(args, "llm_rate", None),
+            llm_cache=_make_llm_cache(args),
+            image_options=_make_image_options(args),
+            table_format=table_format,
+            manifest=manifest,
+            pdf_cache_dir=getattr(args, "slide_pdf_cache", None),
         )
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -86,9 +304,73 @@ def _pptx2md(args: argparse.Namespace) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    from thomas_utils.profiling import span
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(md, encoding="utf-8")
-    print(f"Wrote {out_path}")
+    with span("write"):
+        out_path.write_text(md, encoding="utf-8")
+    note = " (cached)" if cache is not None and cache.hits else ""
+    if manifest is not None and not note:
+        note = f" ({manifest.reused} slides reused, {manifest.converted} converted)"
+    print(f"Wrote {out_path}{note}")
+    return 0
+
+
+def _batch(args: argparse.Namespace) -> int:
+    from thomas_utils.converters.batch import convert_many, print_progress
+
+    try:
+        results = convert_many(
+            args.inputs,
+            output_dir=args.output_dir,
+            workers=args.workers,
+            engine=args.engine,
+            pptx_engine=args.pptx_engine,
+            progress=None if args.quiet else print_progress,
+            prefork=False if args.no_prefork else None,
+            cache_dir=args.cache_dir,
+            cache_max_size=args.cache_max_size,
+            window=args.window,
+            max_rss=args.max_rss,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not results:
+        print("Error: no .pdf or .pptx files found", file=sys.stderr)
+        return 1
+    failed = [r for r in results if r["error"]]
+    for r in failed:
+        print(f"Error: {r['input']}: {r['error']}", file=sys.stderr)
+    print(f"Converted {len(results) - len(failed)}/{len(results)} files into {args.output_dir}")
+    if args.cache_dir:
+        hits = sum(1 for r in results if r.get("cached"))
+        print(f"Cache: {hits} hits, {len(results) - hits} misses")
+    return 1 if failed else 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from thomas_utils.server import serve
+
+    warm = [w for w in (args.warm or "").replace(" ", "").split(",") if w]
+    try:
+        serve(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            max_upload=args.max_upload,
+            quiet=not args.verbose,
+            workers=args.workers,
+            queue_size=args.queue_size,
+            warm=warm,
+            cache_dir=args.cache_dir,
+            cache_max_size=args.cache_max_size,
+            input_root=getattr(args, "input_root", None),
+        )
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
     return 0
 
 
@@ -101,7 +383,9 @@ def main() -> None:
 
     pdf2md_p = subparsers.add_parser("pdf2md", help="Convert PDF to Markdown")
     pdf2md_p.add_argument("input", metavar="INPUT.pdf", help="Input PDF path")
-    pdf2md_p.add_argument("-o", "--output", metavar="OUTPUT.md", help="Output Markdown path (default: output/INPUT.md)")
+    pdf2md_p.add_argument(
+        "-o", "--output", metavar="OUTPUT.md", help="Output path (default: output/INPUT.md, .json or .jsonl)"
+    )
     pdf2md_p.add_argument(
         "--pages",
         metavar="LIST",
@@ -109,19 +393,30 @@ def main() -> None:
     )
     pdf2md_p.add_argument(
         "--engine",
-        choices=("pymupdf", "marker"),
+        choices=("pymupdf", "marker", "hybrid", "auto"),
         default="pymupdf",
-        help="Conversion engine (default: pymupdf)",
+        help="Conversion engine; hybrid/auto sends only scanned or graphics-heavy pages to marker (default: pymupdf)",
+    )
+    pdf2md_p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Convert page chunks in N parallel processes (pymupdf pages; default: serial)",
     )
+    _add_format_arg(pdf2md_p)
+    _add_window_args(pdf2md_p)
+    _add_cache_args(pdf2md_p)
+    _add_profile_args(pdf2md_p)
     pdf2md_p.set_defaults(_run=_pdf2md)
 
     pptx2md_p = subparsers.add_parser("pptx2md", help="Convert PowerPoint to Markdown")
     pptx2md_p.add_argument("input", metavar="INPUT.pptx", help="Input PPTX path")
-    pptx2md_p.add_argument("-o", "--output", metavar="OUTPUT.md", help="Output Markdown path (default: output/INPUT.md)")
+    pptx2md_p.add_argument("-o", "--output", metavar="OUTPUT.md", help="Output file name in output/ (default: INPUT.md, .json or .jsonl)")
     pptx2md_p.add_argument(
         "--slides",
         metavar="LIST",
-        help="0-based slide indices (currently ignored, all slides are converted)",
+        help="0-based slide indices, e.g. 0,1,2 or 0-5 (default: all)",
     )
     pptx2md_p.add_argument(
         "--pptx-use-llm",
@@ -130,21 +425,209 @@ def main() -> None:
     )
     pptx2md_p.add_argument(
         "--engine",
-        choices=("python-pptx", "unstructured"),
+        choices=("python-pptx", "fast", "unstructured"),
         default="python-pptx",
         dest="pptx_engine",
         help="PPTX conversion engine (default: python-pptx)",
     )
+    pptx2md_p.add_argument(
+        "--table-format",
+        choices=("markdown", "html", "auto"),
+        default="markdown",
+        help="Tables as GFM markdown, HTML (keeps merged cells), or auto (HTML only for merged cells; default: markdown)",
+    )
     pptx2md_p.add_argument(
         "--pptx-use-llm-multimodal",
         action="store_true",
         help="Render each slide to image and convert via vision LLM (GPT-4o); needs pywin32 (Windows) or LibreOffice + pymupdf",
     )
+    pptx2md_p.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Maximum simultaneous LLM requests; halved automatically on 429/5xx (default: 4)",
+    )
+    pptx2md_p.add_argument(
+        "--llm-rate",
+        type=float,
+        metavar="RPS",
+        help="Maximum LLM requests per second (default: unlimited)",
+    )
+    pptx2md_p.add_argument(
+        "--llm-cache",
+        choices=("on", "read-only", "refresh", "off"),
+        default="on",
+        help="Local LLM response cache: on, read-only (no writes), refresh (re-query and overwrite) or off (default: on)",
+    )
+    pptx2md_p.add_argument(
+        "--llm-cache-path",
+        metavar="FILE",
+        help="SQLite file for the LLM response cache (default: ~/.cache/thomas_utils/llm_cache.sqlite)",
+    )
+    pptx2md_p.add_argument(
+        "--llm-cache-ttl",
+        type=float,
+        metavar="SECONDS",
+        help="Ignore cached LLM responses older than this (default: no expiry)",
+    )
+    pptx2md_p.add_argument(
+        "--llm-cache-max-size",
+        metavar="SIZE",
+        help="Evict least-recently-used LLM responses beyond this size, e.g. 200M (default: unbounded)",
+    )
+    pptx2md_p.add_argument(
+        "--image-dpi",
+        type=int,
+        metavar="DPI",
+        help="Slide image resolution for --pptx-use-llm-multimodal (default: 72)",
+    )
+    pptx2md_p.add_argument(
+        "--image-max-edge",
+        type=int,
+        metavar="PX",
+        help="Limit the longer slide image edge to PX pixels (default: no limit)",
+    )
+    pptx2md_p.add_argument(
+        "--image-format",
+        choices=("png", "jpeg", "webp", "auto"),
+        help="Slide image encoding; auto sends the smallest of png/jpeg/webp (default: png)",
+    )
+    pptx2md_p.add_argument(
+        "--image-quality",
+        type=int,
+        metavar="Q",
+        help="JPEG/WebP quality 1-100 (default: 80)",
+    )
+    pptx2md_p.add_argument(
+        "--image-grayscale",
+        action="store_true",
+        help="Send slide images in grayscale",
+    )
+    pptx2md_p.add_argument(
+        "--image-autocrop",
+        action="store_true",
+        help="Trim uniform margins from slide images",
+    )
+    pptx2md_p.add_argument(
+        "--slide-pdf-cache",
+        metavar="DIR",
+        help="Keep LibreOffice's PDF of each deck in DIR (keyed by content) so unchanged decks "
+        "skip LibreOffice on the next multimodal run (default: off)",
+    )
+    pptx2md_p.add_argument(
+        "--incremental",
+        nargs="?",
+        const="",
+        metavar="MANIFEST",
+        help="Reuse unchanged slides from a per-deck manifest and convert only changed ones "
+        "(default manifest: output/INPUT.slides.json)",
+    )
+    _add_format_arg(pptx2md_p)
+    _add_cache_args(pptx2md_p)
+    _add_profile_args(pptx2md_p)
     pptx2md_p.set_defaults(_run=_pptx2md)
 
+    batch_p = subparsers.add_parser("batch", help="Convert many PDF/PowerPoint files in parallel")
+    batch_p.add_argument("inputs", nargs="+", metavar="PATH", help="Input files, directories or glob patterns")
+    batch_p.add_argument(
+        "-o",
+        "--output-dir",
+        metavar="DIR",
+        default="output",
+        help="Output directory; directory inputs keep their sub-folder layout (default: output)",
+    )
+    batch_p.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Number of worker processes (default: CPU count)",
+    )
+    batch_p.add_argument(
+        "--engine",
+        choices=("pymupdf", "marker", "hybrid", "auto"),
+        default="pymupdf",
+        help="PDF conversion engine (default: pymupdf)",
+    )
+    batch_p.add_argument(
+        "--pptx-engine",
+        choices=("python-pptx", "fast", "unstructured"),
+        default="python-pptx",
+        help="PPTX conversion engine (default: python-pptx)",
+    )
+    batch_p.add_argument(
+        "--no-prefork",
+        action="store_true",
+        help="With --engine marker, let each worker load its own models instead of forking from a preloaded parent",
+    )
+    batch_p.add_argument("-q", "--quiet", action="store_true", help="Do not print live throughput")
+    _add_window_args(batch_p)
+    _add_cache_args(batch_p)
+    _add_profile_args(batch_p)
+    batch_p.set_defaults(_run=_batch)
+
+    serve_p = subparsers.add_parser(
+        "serve", help="Run a local conversion service that keeps engines warm between requests"
+    )
+    serve_p.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    serve_p.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    serve_p.add_argument("--socket", metavar="PATH", help="Listen on this Unix socket instead of TCP")
+    serve_p.add_argument(
+        "--input-root",
+        metavar="DIR",
+        help='Allow JSON {"path": ...} jobs for files under DIR (default: uploads only)',
+    )
+    serve_p.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Concurrent conversions; 1 runs jobs in the server process, more use a process pool (default: CPU count)",
+    )
+    serve_p.add_argument(
+        "--queue-size",
+        type=int,
+        default=64,
+        metavar="N",
+        help="Jobs allowed to wait for a worker before requests get 503 (default: 64)",
+    )
+    serve_p.add_argument(
+        "--warm",
+        metavar="LIST",
+        help="Engines to load at start-up, comma-separated: pymupdf, pptx, marker (default: load on first use)",
+    )
+    serve_p.add_argument(
+        "--max-upload",
+        default="1G",
+        metavar="SIZE",
+        help="Largest accepted request body, e.g. 200M (default: 1G)",
+    )
+    serve_p.add_argument("-v", "--verbose", action="store_true", help="Log every request to stderr")
+    _add_cache_args(serve_p)
+    serve_p.set_defaults(_run=_serve)
+
     args = parser.parse_args()
     run = getattr(args, "_run", None)
     if run is None:
         parser.print_help()
         sys.exit(0)
+    if getattr(args, "profile", None):
+        sys.exit(_run_profiled(run, args))
     sys.exit(run(args))
+
+
+def _run_profiled(run, args: argparse.Namespace) -> int:
+    """Run a subcommand under a Profiler and write its report to --profile."""
+    from contextlib import nullcontext
+
+    from thomas_utils import profiling
+
+    with profiling.profile(memory=getattr(args, "profile_memory", False)) as prof:
+        # 단일 문서 명령은 문서 이름으로 묶고, batch는 문서마다 워커에서 묶음
+        name = getattr(args, "input", None)
+        with profiling.document(name) if name else nullcontext():
+            rc = run(args)
+    prof.write(args.profile)
+    print(f"Wrote profile {args.profile}", file=sys.stderr)
+    return rc
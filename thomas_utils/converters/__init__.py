@@ -1,6 +1,56 @@
-"""Conversion engines for PDF and PowerPoint -> Markdown."""
+"""Conversion engines for PDF and PowerPoint -> Markdown.
 
-from thomas_utils.converters.pptx_impl import convert as convert_pptx
-from thomas_utils.converters.registry import convert, get_engine
+Public names are resolved on first access, so importing this package does not
+load python-pptx, pymupdf4llm or any other engine until it is actually used.
+"""
 
-__all__ = ["convert", "convert_pptx", "get_engine"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from thomas_utils.converters.batch import convert_many
+    from thomas_utils.converters.cache import ConversionCache
+    from thomas_utils.converters.pptx_impl import convert as convert_pptx
+    from thomas_utils.converters.pptx_impl import iter_slides
+    from thomas_utils.converters.pptx_incremental import SlideManifest
+    from thomas_utils.converters.registry import convert, get_engine, iter_convert
+    from thomas_utils.converters.windowed import iter_windows
+
+# 공개 이름 -> (모듈, 속성)
+_LAZY = {
+    "ConversionCache": ("thomas_utils.converters.cache", "ConversionCache"),
+    "SlideManifest": ("thomas_utils.converters.pptx_incremental", "SlideManifest"),
+    "convert": ("thomas_utils.converters.registry", "convert"),
+    "convert_many": ("thomas_utils.converters.batch", "convert_many"),
+    "convert_pptx": ("thomas_utils.converters.pptx_impl", "convert"),
+    "get_engine": ("thomas_utils.converters.registry", "get_engine"),
+    "iter_convert": ("thomas_utils.converters.registry", "iter_convert"),
+    "iter_slides": ("thomas_utils.converters.pptx_impl", "iter_slides"),
+    "iter_windows": ("thomas_utils.converters.windowed", "iter_windows"),
+}
+
+__all__ = [
+    "ConversionCache",
+    "SlideManifest",
+    "convert",
+    "convert_many",
+    "convert_pptx",
+    "get_engine",
+    "iter_convert",
+    "iter_slides",
+    "iter_windows",
+]
+
+
+def __getattr__(name: str):
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,337 @@
+"""Batch conversion of many PDF / PowerPoint files over a process pool."""
+
+import gc
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from thomas_utils import profiling
+
+_SUFFIXES = (".pdf", ".pptx")
+
+
+def collect_inputs(inputs: Iterable[Union[str, Path]]) -> List[Tuple[Path, Path]]:
+    """Expand files, directories and glob patterns into (path, relative output path) pairs.
+
+    Directories are searched recursively for .pdf / .pptx files and their layout is
+    mirrored in the output; glob matches mirror the layout below the pattern's first
+    wildcard directory, plain files are written by file name. Inputs that would share
+    an output (x.pdf and x.pptx) keep their source suffix (x.pdf.md, x.pptx.md).
+    Duplicates are dropped, order is stable (sorted per input).
+
+    Raises:
+        FileNotFoundError: An input does not exist.
+        ValueError: Two different inputs still map to the same output path.
+    """
+    seen = set()
+    found: List[Tuple[Path, Path]] = []
+
+    def add(path: Path, rel: Path) -> None:
+        key = path.resolve()
+        if key in seen or path.suffix.lower() not in _SUFFIXES:
+            return
+        seen.add(key)
+        found.append((path, rel))
+
+    for item in inputs:
+        s = str(item)
+        p = Path(s)
+        if p.is_dir():
+            for f in sorted(p.rglob("*")):
+                if f.is_file():
+                    add(f, f.relative_to(p))
+        elif any(c in s for c in "*?["):
+            base = _glob_base(p)
+            for m in sorted(glob.glob(s, recursive=True)):
+                f = Path(m)
+                if f.is_file():
+                    add(f, f.relative_to(base))
+        elif p.is_file():
+            add(p, Path(p.name))
+        else:
+            raise FileNotFoundError(f"Input not found: {p}")
+
+    def key(rel: Path) -> str:
+        # 대소문자를 구분하지 않는 파일 시스템에서도 겹치지 않도록
+        return rel.with_suffix(".md").as_posix().lower()
+
+    counts: Dict[str, int] = {}
+    for _, rel in found:
+        counts[key(rel)] = counts.get(key(rel), 0) + 1
+    out = [
+        (path, rel.with_suffix(".md") if counts[key(rel)] == 1 else rel.with_name(rel.name + ".md"))
+        for path, rel in found
+    ]
+    claimed: Dict[str, Path] = {}
+    for path, rel in out:
+        other = claimed.setdefault(rel.as_posix().lower(), path)
+        if other is not path:
+            raise ValueError(f"Inputs {other} and {path} would both be written to {rel}")
+    return out
+
+
+def _glob_base(pattern: Path) -> Path:
+    """Leading directories of a glob pattern up to its first wildcard component."""
+    parts = pattern.parts
+    n = next(i for i, part in enumerate(parts) if any(c in part for c in "*?["))
+    return Path(*parts[:n]) if n else Path(".")
+
+
+def _doc_units(path: Path) -> int:
+    """Page count (PDF) or slide count (PPTX), read cheaply; 0 if unknown."""
+    try:
+        if path.suffix.lower() == ".pptx":
+            with zipfile.ZipFile(path) as zf:
+                return sum(
+                    1
+                    for n in zf.namelist()
+                    if n.startswith("ppt/slides/slide") and n.endswith(".xml")
+                )
+        import pymupdf
+
+        with pymupdf.open(str(path)) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def _convert_one(
+    path: str,
+    out_path: str,
+    engine: str,
+    pptx_engine: str,
+    units: int,
+    cache_dir: Optional[str] = None,
+    cache_max_size: Optional[Union[int, str]] = None,
+    window: Optional[int] = None,
+    max_rss: Optional[Union[int, str]] = None,
+    profile_memory: Optional[bool] = None,
+) -> Dict:
+    """Worker entry point: convert one file and write its Markdown. Never raises.
+
+    With profile_memory set (True/False = tracemalloc on/off), the stages are
+    profiled by a new Profiler in this worker and returned under "profile";
+    otherwise spans go to whatever profiler is active (the in-process path).
+    """
+    own = profile_memory is not None
+    with (profiling.profile(memory=bool(profile_memory)) if own else nullcontext()) as prof:
+        with profiling.document(path):
+            result = _convert_and_write(
+                path, out_path, engine, pptx_engine, units, cache_dir, cache_max_size, window, max_rss
+            )
+    if prof is not None:
+        result["profile"] = prof.report()["documents"]
+    return result
+
+
+def _convert_and_write(
+    path: str,
+    out_path: str,
+    engine: str,
+    pptx_engine: str,
+    units: int,
+    cache_dir: Optional[str],
+    cache_max_size: Optional[Union[int, str]],
+    window: Optional[int] = None,
+    max_rss: Optional[Union[int, str]] = None,
+) -> Dict:
+    start = time.perf_counter()
+    result: Dict = {"input": path, "output": out_path, "pages": units, "error": None, "cached": False}
+    try:
+        cache = None
+        if cache_dir:
+            from thomas_utils.converters.cache import ConversionCache
+
+            cache = ConversionCache(cache_dir, max_size=cache_max_size)
+        out = Path(out_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        md: Optional[str] = None
+        if path.lower().endswith(".pptx"):
+            from thomas_utils.converters.pptx_impl import convert as convert_pptx
+
+            md = convert_pptx(path, engine=pptx_engine, cache=cache)
+        elif window is not None or max_rss:
+            # 창마다 바로 파일에 기록 (결과 캐시는 쓰지 않음)
+            _write_windows(path, out, engine, window, max_rss)
+        else:
+            from thomas_utils.converters.registry import convert
+
+            md = convert(path, engine=engine, cache=cache)
+        result["cached"] = bool(cache is not None and cache.hits)
+        if md is not None:
+            with profiling.span("write"):
+                out.write_text(md, encoding="utf-8")
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _write_windows(
+    path: str,
+    out: Path,
+    engine: str,
+    window: Optional[int],
+    max_rss: Optional[Union[int, str]],
+) -> None:
+    """Windowed PDF conversion straight into out; a partial file is removed on error."""
+    from thomas_utils.converters.windowed import DEFAULT_WINDOW, iter_windows
+
+    try:
+        with open(out, "w", encoding="utf-8") as f:
+            for chunk in iter_windows(path, engine=engine, window=window if window is not None else DEFAULT_WINDOW, max_rss=max_rss):
+                with profiling.span("write"):
+                    f.write(chunk["text"])
+                    f.flush()
+    except BaseException:
+        out.unlink(missing_ok=True)
+        raise
+
+
+def _init_forked_worker() -> None:
+    """Pool initializer for pre-forked workers: one intra-op thread each to avoid oversubscription."""
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+
+
+def _prefork_context(engine: str, prefork: Optional[bool], has_pdf: bool):
+    """Load marker models in this process and return a fork context, or None if not applicable."""
+    if prefork is False or engine != "marker" or not has_pdf:
+        return None
+    if "fork" not in multiprocessing.get_all_start_methods():
+        if prefork:
+            raise ValueError("prefork requires the 'fork' start method (not available on this platform)")
+        return None
+    from thomas_utils.converters import marker_impl
+
+    marker_impl.preload()
+    # 로드된 모델 객체를 GC 대상에서 빼서 fork 후 refcount/GC 스캔으로 페이지가 복사되는 것을 줄인다
+    gc.collect()
+    gc.freeze()
+    return multiprocessing.get_context("fork")
+
+
+def convert_many(
+    inputs: Iterable[Union[str, Path]],
+    output_dir: Union[str, Path] = "output",
+    workers: Optional[int] = None,
+    engine: str = "pymupdf",
+    pptx_engine: str = "python-pptx",
+    progress: Optional[Callable[[Dict], None]] = None,
+    prefork: Optional[bool] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    cache_max_size: Optional[Union[int, str]] = None,
+    window: Optional[int] = None,
+    max_rss: Optional[Union[int, str]] = None,
+) -> List[Dict]:
+    """Convert many PDF / PPTX files to Markdown in parallel.
+
+    The engine is picked from the file type. Jobs are scheduled largest first
+    (page/slide count, then file size) so one huge document does not finish last.
+
+    Args:
+        inputs: Files, directories (searched recursively) or glob patterns.
+        output_dir: Directory that receives the .md files.
+        workers: Number of worker processes. None = os.cpu_count(); 1 = run in-process.
+        engine: PDF engine, "pymupdf", "marker" or "hybrid" ("auto").
+        pptx_engine: PPTX engine, "python-pptx", "fast" or "unstructured".
+        progress: Optional callback called after each document with a stats dict
+                  (done, total, failed, pages, elapsed, docs_per_s, pages_per_s).
+        prefork: For engine "marker": load the models once in this process and fork
+                 workers that share them copy-on-write. None = automatic where the
+                 "fork" start method exists; False = each worker loads its own models.
+        cache_dir: Optional ConversionCache directory shared by all workers.
+        cache_max_size: LRU size bound for cache_dir (bytes or '500M' style string).
+        window: Convert PDFs this many pages at a time, writing and freeing memory
+                after each window (see windowed.iter_windows). Bypasses cache_dir.
+        max_rss: Soft RSS ceiling per worker (bytes or '2G'); enables windowing
+                 (default window 50) and shrinks the window as it is approached.
+
+    When a profiler is active (thomas_utils.profiling.profile), every document is
+    profiled, including those converted in worker processes; their stage timings are
+    merged into the active profiler when they finish.
+
+    Returns:
+        One dict per input (input, output, pages, seconds, error, cached) in input order.
+    """
+    from thomas_utils.converters.registry import get_engine
+
+    engine = get_engine(engine)
+    jobs = collect_inputs(inputs)
+    out_dir = Path(output_dir)
+    sized = [(path, rel, _doc_units(path), path.stat().st_size) for path, rel in jobs]
+    order = {str(path): i for i, (path, _, _, _) in enumerate(sized)}
+    # 큰 문서부터 배정해 마지막에 한 워커만 남는 꼬리 지연을 줄인다
+    sized.sort(key=lambda j: (j[2], j[3]), reverse=True)
+
+    results: List[Dict] = []
+    stats = {"done": 0, "total": len(sized), "failed": 0, "pages": 0}
+    start = time.perf_counter()
+
+    prof = profiling.active()
+
+    def record(res: Dict) -> None:
+        docs = res.pop("profile", None)
+        if docs and prof is not None:
+            prof.merge(docs)
+        results.append(res)
+        stats["done"] += 1
+        stats["failed"] += 1 if res["error"] else 0
+        stats["pages"] += res["pages"]
+        if progress is not None:
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            progress(
+                dict(
+                    stats,
+                    elapsed=elapsed,
+                    docs_per_s=stats["done"] / elapsed,
+                    pages_per_s=stats["pages"] / elapsed,
+                )
+            )
+
+    extra = (str(cache_dir) if cache_dir else None, cache_max_size, window, max_rss)
+    args = [
+        (str(p), str(out_dir / rel), engine, pptx_engine, units) + extra
+        for p, rel, units, _ in sized
+    ]
+    n_workers = workers or os.cpu_count() or 1
+    if n_workers <= 1 or len(args) <= 1:
+        for a in args:
+            record(_convert_one(*a))
+    else:
+        has_pdf = any(not a[0].lower().endswith(".pptx") for a in args)
+        ctx = _prefork_context(engine, prefork, has_pdf)
+        pool_kwargs = {"mp_context": ctx, "initializer": _init_forked_worker} if ctx is not None else {}
+        try:
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(args)), **pool_kwargs) as pool:
+                # 워커 프로세스는 자체 프로파일러로 기록하고 결과와 함께 돌려줌
+                profile_memory = prof.memory if prof is not None else None
+                futures = [pool.submit(_convert_one, *a, profile_memory) for a in args]
+                for fut in as_completed(futures):
+                    record(fut.result())
+        finally:
+            if ctx is not None:
+                gc.unfreeze()
+
+    results.sort(key=lambda r: order[r["input"]])
+    return results
+
+
+def print_progress(stats: Dict) -> None:
+    """Default progress reporter: one self-overwriting status line on stderr."""
+    sys.stderr.write(
+        f"\r[{stats['done']}/{stats['total']}] "
+        f"{stats['docs_per_s']:.2f} docs/s, {stats['pages_per_s']:.1f} pages/s"
+        + (f", {stats['failed']} failed" if stats["failed"] else "")
+    )
+    if stats["done"] == stats["total"]:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
@@ -0,0 +1,157 @@
+"""Content-addressed on-disk cache for finished Markdown conversions.
+
+Entries are keyed by a hash of the input bytes, engine, page/slide selection and
+options, stored as one file each, and evicted least-recently-used first once the
+directory grows past max_size. Writes go through a temp file + os.replace, so
+several processes can share one cache directory safely.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from thomas_utils import __version__
+
+_SUFFIX = ".md"
+
+
+def parse_size(s: Union[str, int]) -> int:
+    """Parse a size such as 1048576, '500M', '2G' or '1.5GB' into bytes."""
+    if isinstance(s, int):
+        return s
+    t = s.strip().upper().rstrip("B")
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    mult = 1
+    if t and t[-1] in units:
+        mult = units[t[-1]]
+        t = t[:-1]
+    try:
+        return int(float(t) * mult)
+    except ValueError:
+        raise ValueError(f"Invalid size: {s!r} (expected e.g. 500M, 2G)") from None
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file's bytes, read in 1 MiB blocks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ConversionCache:
+    """Size-bounded LRU cache of conversion results under a directory.
+
+    Args:
+        cache_dir: Directory for cache entries (created on demand).
+        max_size: Maximum total size in bytes (int or '500M' style string). None = unbounded.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_size: Optional[Union[int, str]] = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = parse_size(max_size) if max_size is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._approx_size: Optional[int] = None
+
+    def key(
+        self,
+        path: Union[str, Path],
+        engine: str,
+        selection: Optional[Iterable[int]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Cache key for converting path with engine, page/slide selection and options."""
+        p = Path(path)
+        if not p.is_file():
+            raise FileNotFoundError(f"Input not found: {p}")
+        meta = {
+            "version": __version__,
+            "engine": engine,
+            "selection": sorted(set(selection)) if selection is not None else None,
+            "options": options or {},
+        }
+        h = hashlib.sha256(file_digest(p).encode("ascii"))
+        h.update(json.dumps(meta, sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / (key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached Markdown for key, or None. A hit refreshes the entry's LRU position."""
+        entry = self._entry(key)
+        try:
+            text = entry.read_text(encoding="utf-8")
+            os.utime(entry)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store text under key atomically, then evict old entries if over max_size."""
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, entry)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        if self.max_size is not None:
+            if self._approx_size is None:
+                self._approx_size = self.size()
+            else:
+                self._approx_size += len(data)
+            if self._approx_size > self.max_size:
+                self.evict()
+
+    def size(self) -> int:
+        """Total size in bytes of all entries currently on disk."""
+        total = 0
+        for f in self.cache_dir.glob("*/*" + _SUFFIX):
+            try:
+                total += f.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def evict(self) -> int:
+        """Delete least-recently-used entries until the cache fits max_size. Returns bytes freed."""
+        if self.max_size is None:
+            return 0
+        entries = []
+        for f in self.cache_dir.glob("*/*" + _SUFFIX):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 먼저 지운 경우
+            entries.append((st.st_mtime, st.st_size, f))
+        total = sum(e[1] for e in entries)
+        freed = 0
+        for _, size, f in sorted(entries, key=lambda e: e[0]):
+            if total - freed <= self.max_size:
+                break
+            try:
+                f.unlink()
+            except FileNotFoundError:
+                pass
+            freed += size
+        self._approx_size = total - freed
+        return freed
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this cache object."""
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,225 @@
+"""Token-aware chunking of the document IR into ready-to-embed JSONL records.
+
+Each slide or page is split on its own: a chunk never spans two units, and
+overlap is only carried between chunks of the same unit. Units are cut at
+block boundaries (paragraphs, list items, code blocks, tables); a block larger
+than the cap is split further at line, then word boundaries. Overlap repeats
+whole pieces from the end of the previous chunk, up to the overlap budget.
+
+Tokens are counted with tiktoken when it is installed
+(pip install thomas-utils[chunking]), otherwise with a conservative estimate:
+one token per CJK/Hangul character, one per four characters of other words
+and punctuation runs.
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from thomas_utils.converters import ir
+
+DEFAULT_MAX_TOKENS = 512
+DEFAULT_OVERLAP = 64
+DEFAULT_ENCODING = "cl100k_base"
+
+# 한중일 문자는 글자마다 토큰 하나 이상으로 쪼개지는 경우가 많음
+_CJK = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_TOKEN_PATTERN = re.compile(rf"[{_CJK}]|[^\W{_CJK}]+|[^\w\s]+")
+_TABLE_RULE_PATTERN = re.compile(r"^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+
+def _approx_tokens(text: str) -> int:
+    return sum(1 + (len(t) - 1) // 4 for t in _TOKEN_PATTERN.findall(text))
+
+
+@lru_cache(maxsize=None)
+def token_counter(encoding: Optional[str] = None) -> Callable[[str], int]:
+    """A function counting the tokens of a string.
+
+    Args:
+        encoding: tiktoken encoding name. None uses cl100k_base if tiktoken is
+                  installed and the approximate counter otherwise.
+
+    Raises:
+        ImportError: encoding is given but tiktoken is not installed.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        if encoding is not None:
+            raise ImportError(
+                f"Token encoding {encoding!r} requires tiktoken. Install with: pip install thomas-utils[chunking]"
+            ) from None
+        return _approx_tokens
+    enc = tiktoken.get_encoding(encoding or DEFAULT_ENCODING)
+    return lambda text: len(enc.encode_ordinary(text))
+
+
+def _split_blocks(text: str) -> List[str]:
+    """Blank-line separated blocks of Markdown, keeping fenced code blocks whole."""
+    blocks: List[str] = []
+    for part in text.split("\n\n"):
+        # 닫히지 않은 코드 펜스 안이면 앞 블록에 이어 붙임
+        if blocks and blocks[-1].count("```") % 2:
+            blocks[-1] += "\n\n" + part
+        else:
+            blocks.append(part)
+    return blocks
+
+
+def _unit_pieces(unit: ir.Unit) -> List[str]:
+    """Text pieces of one unit in reading order, image lines dropped and empty pieces skipped."""
+    if isinstance(unit, ir.Slide):
+        texts = [t for t in (unit.title, unit.subtitle) if t]
+        texts += [b.markdown() for shape in unit.shapes for b in shape]
+    else:
+        texts = [b.markdown() for b in unit.blocks]
+    pieces = []
+    for text in texts:
+        for block in _split_blocks(text):
+            if "![" in block:
+                block = re.sub(r"\n{2,}", "\n", ir.IMAGE_LINE_PATTERN.sub("", block))
+            # 목록 항목의 들여쓰기는 유지
+            block = block.strip("\n").rstrip()
+            if block.strip():
+                pieces.append(block)
+    return pieces
+
+
+def _fit(piece: str, max_tokens: int, count: Callable[[str], int]) -> Iterator[Tuple[str, int]]:
+    """(text, tokens) parts of piece, split at lines, then words, so each fits max_tokens if possible.
+
+    A Markdown table is split between rows, and every part repeats the header row.
+    """
+    n = count(piece)
+    if n <= max_tokens:
+        yield piece, n
+        return
+    for sep in ("\n", " "):
+        parts = piece.split(sep)
+        if len(parts) > 1:
+            break
+    else:
+        # 더 나눌 경계가 없는 한 단어는 그대로 둠
+        yield piece, n
+        return
+    head, head_n = "", 0
+    if sep == "\n" and len(parts) > 2 and _TABLE_RULE_PATTERN.match(parts[1]):
+        head = parts[0] + "\n" + parts[1] + "\n"
+        head_n = count(head)
+        if head_n < max_tokens // 2:
+            parts = parts[2:]
+        else:
+            head, head_n = "", 0
+    buf: List[str] = []
+    size = 0
+    for part in parts + [None]:
+        k = 0 if part is None else count(part)
+        if buf and (part is None or size + k > max_tokens - head_n):
+            for text, m in _fit(sep.join(buf), max_tokens - head_n, count):
+                yield head + text, head_n + m
+            buf, size = [], 0
+        if part is not None:
+            buf.append(part)
+            size += k + 1
+
+
+def _size(chunk: List[Tuple[str, int]]) -> int:
+    # 조각 사이의 빈 줄은 토큰 하나로 계산
+    return sum(n for _, n in chunk) + len(chunk) - 1 if chunk else 0
+
+
+def _chunk_texts(pieces: List[str], max_tokens: int, overlap: int, count: Callable[[str], int]) -> Iterator[str]:
+    """Pack pieces greedily into chunks of at most max_tokens, repeating up to overlap tokens."""
+    chunk: List[Tuple[str, int]] = []
+    size = 0
+    fresh = False
+    for piece in pieces:
+        for text, n in _fit(piece, max_tokens, count):
+            if chunk and size + 1 + n > max_tokens:
+                if fresh:
+                    yield "\n\n".join(t for t, _ in chunk)
+                kept = 0
+                while kept < len(chunk) and _size(chunk[len(chunk) - kept - 1 :]) <= overlap:
+                    kept += 1
+                chunk, fresh = chunk[len(chunk) - kept :], False
+                while chunk and _size(chunk) + 1 + n > max_tokens:
+                    chunk.pop(0)
+                size = _size(chunk)
+            size += n + (1 if chunk else 0)
+            chunk.append((text, n))
+            fresh = True
+    if fresh:
+        yield "\n\n".join(t for t, _ in chunk)
+
+
+def _page_title(page: ir.Page) -> Optional[str]:
+    for block in page.blocks:
+        match = _HEADING_PATTERN.search(block.markdown())
+        if match:
+            return match.group(1).replace("*", "").strip() or None
+    return None
+
+
+def iter_chunks(
+    doc: ir.Document,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    overlap: int = DEFAULT_OVERLAP,
+    encoding: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Chunk records of doc, produced as each unit arrives from the engine.
+
+    Args:
+        doc: IR document (e.g. from pptx_impl.iter_units or ir.pages).
+        max_tokens: Token cap per chunk.
+        overlap: Tokens repeated from the end of the previous chunk of the same slide/page.
+        encoding: tiktoken encoding name (default: cl100k_base, or the approximate counter).
+
+    Yields:
+        {"id", "source", "slide" or "page", "title", "chunk", "tokens", "hash", "text"};
+        "hash" is the SHA-256 of "text".
+
+    Raises:
+        ValueError: max_tokens < 1, or overlap not in [0, max_tokens).
+    """
+    if max_tokens < 1:
+        raise ValueError(f"Chunk token cap must be at least 1, got {max_tokens}")
+    if not 0 <= overlap < max_tokens:
+        raise ValueError(f"Chunk overlap must be between 0 and {max_tokens - 1} tokens, got {overlap}")
+    count = token_counter(encoding)
+    return _iter_chunks(doc, max_tokens, overlap, count)
+
+
+def _iter_chunks(
+    doc: ir.Document, max_tokens: int, overlap: int, count: Callable[[str], int]
+) -> Iterator[Dict[str, Any]]:
+    for unit in doc.units:
+        if isinstance(unit, ir.Slide):
+            key, title = "slide", unit.title
+        else:
+            key, title = "page", _page_title(unit)
+        for n, text in enumerate(_chunk_texts(_unit_pieces(unit), max_tokens, overlap, count)):
+            yield {
+                "id": f"{doc.source}#{key}{'' if unit.index is None else unit.index}-{n}",
+                "source": doc.source,
+                key: unit.index,
+                "title": title,
+                "chunk": n,
+                "tokens": count(text),
+                "hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                "text": text,
+            }
+
+
+def iter_jsonl(
+    doc: ir.Document,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    overlap: int = DEFAULT_OVERLAP,
+    encoding: Optional[str] = None,
+) -> Iterator[str]:
+    """iter_chunks() as JSON Lines, one line per chunk (arguments are validated immediately)."""
+    chunks = iter_chunks(doc, max_tokens, overlap, encoding)
+    return (json.dumps(c, ensure_ascii=False) + "\n" for c in chunks)
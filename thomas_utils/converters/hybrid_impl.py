@@ -0,0 +1,181 @@
+"""Hybrid PDF -> Markdown: route each page to pymupdf4llm or marker.
+
+Every page is profiled cheaply with PyMuPDF (text-layer size and coverage, image
+area, vector-drawing density). Pages that look scanned (mostly image, with no
+or only a sparse text layer such as an OCR line) or are dominated by vector
+graphics (ruled tables, charts, outlined text) go to marker; all other pages go
+to pymupdf4llm. marker runs once over the subset of pages that need it (see
+marker_impl.convert_pages), and the results are merged in page order.
+
+Requires the marker extra only when at least one page is routed to marker.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from thomas_utils.profiling import span
+
+# 텍스트 레이어가 이보다 짧으면 "텍스트 없음"으로 봄 (문자 수)
+MIN_TEXT_CHARS = 50
+# 이미지가 페이지 면적의 이 비율 이상을 덮으면 스캔 페이지 후보
+SCAN_IMAGE_COVERAGE = 0.5
+# 스캔 후보의 텍스트 블록이 페이지의 이 비율 미만이면 텍스트 레이어가 있어도 스캔으로 봄
+SCAN_TEXT_COVERAGE = 0.1
+# 벡터 경로 수가 이 이상이면 표/도표가 복잡한 페이지로 봄
+DENSE_DRAWINGS = 300
+
+
+def _area(rect: Any) -> float:
+    return max(0.0, rect.x1 - rect.x0) * max(0.0, rect.y1 - rect.y0)
+
+
+def profile_page(page: Any) -> Dict[str, Any]:
+    """Measure one PyMuPDF page and decide its engine.
+
+    Returns a dict with "page", "chars", "text_coverage", "image_coverage",
+    "drawings", "engine" ("pymupdf" or "marker") and "reason".
+    """
+    import pymupdf
+
+    page_rect = page.rect
+    page_area = _area(page_rect) or 1.0
+
+    chars = 0
+    text_area = 0.0
+    for block in page.get_text("blocks"):
+        if block[6] == 0:
+            chars += len(block[4].strip())
+            text_area += _area(pymupdf.Rect(block[:4]) & page_rect)
+
+    image_area = 0.0
+    for info in page.get_image_info():
+        image_area += _area(pymupdf.Rect(info["bbox"]) & page_rect)
+
+    get_drawings = getattr(page, "get_cdrawings", None) or page.get_drawings
+    drawings = sum(len(d.get("items", ())) for d in get_drawings())
+
+    text_coverage = min(1.0, text_area / page_area)
+    image_coverage = min(1.0, image_area / page_area)
+    if chars < MIN_TEXT_CHARS and image_coverage >= SCAN_IMAGE_COVERAGE:
+        engine, reason = "marker", "scanned (image without text layer)"
+    elif text_coverage < SCAN_TEXT_COVERAGE and image_coverage >= SCAN_IMAGE_COVERAGE:
+        engine, reason = "marker", "scanned (image with a sparse text layer)"
+    elif drawings >= DENSE_DRAWINGS:
+        engine, reason = "marker", "dense vector graphics / ruled tables"
+    elif chars < MIN_TEXT_CHARS and drawings >= DENSE_DRAWINGS // 10:
+        engine, reason = "marker", "text drawn as vector outlines"
+    else:
+        engine, reason = "pymupdf", "digital text"
+    return {
+        "page": page.number,
+        "chars": chars,
+        "text_coverage": round(text_coverage, 3),
+        "image_coverage": round(image_coverage, 3),
+        "drawings": drawings,
+        "engine": engine,
+        "reason": reason,
+    }
+
+
+def _plan(pdf_path: Union[str, Path], pages: Optional[List[int]]) -> Tuple[int, List[Dict[str, Any]]]:
+    import pymupdf
+
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    with pymupdf.open(str(path)) as doc:
+        # 다른 엔진처럼 선택한 페이지를 문서 순서로 한 번씩 변환
+        page_list = sorted(set(pages)) if pages is not None else list(range(doc.page_count))
+        bad = [p for p in page_list if p < 0 or p >= doc.page_count]
+        if bad:
+            raise ValueError(f"Page index out of range: {bad[0]} (document has {doc.page_count})")
+        return doc.page_count, [profile_page(doc[p]) for p in page_list]
+
+
+def plan(
+    pdf_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+) -> List[Dict[str, Any]]:
+    """Profile the selected pages (all when None) and return one profile_page() dict per page."""
+    return _plan(pdf_path, pages)[1]
+
+
+def iter_convert(
+    pdf_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Convert page by page, yielding the same chunk dicts as pymupdf_impl.iter_convert.
+
+    Each chunk also carries "engine" (the engine that produced it). All marker
+    pages are converted in one run when the first of them is reached.
+    """
+    from thomas_utils.converters import pymupdf_impl
+
+    with span("hybrid.plan"):
+        page_count, profiles = _plan(pdf_path, pages)
+    marker_pages = [p["page"] for p in profiles if p["engine"] == "marker"]
+    fast_pages = [p["page"] for p in profiles if p["engine"] == "pymupdf"]
+    fast = pymupdf_impl.iter_convert(pdf_path, pages=fast_pages) if fast_pages else iter(())
+    marker_texts: Optional[Dict[int, str]] = None
+    for i, prof in enumerate(profiles):
+        if prof["engine"] == "pymupdf":
+            text = next(fast)["text"]
+        else:
+            if marker_texts is None:
+                from thomas_utils.converters.marker_impl import convert_pages
+
+                marker_texts = convert_pages(pdf_path, marker_pages)
+            body = marker_texts.get(prof["page"], "")
+            text = body + "\n\n" if body else ""
+        yield {
+            "page": prof["page"],
+            "page_count": page_count,
+            "index": i,
+            "total": len(profiles),
+            "text": text,
+            "engine": prof["engine"],
+        }
+
+
+def convert(
+    pdf_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+    workers: Optional[int] = None,
+) -> str:
+    """Convert PDF to Markdown, sending only pages that need it to marker.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        pages: Optional 0-based page indices. None = all pages.
+        workers: Page-parallel worker processes for the pymupdf pages (None/1 = serial).
+
+    Returns:
+        UTF-8 Markdown string, each selected page once, in document order.
+    """
+    if not workers or workers <= 1:
+        return "".join(c["text"] for c in iter_convert(pdf_path, pages))
+
+    from thomas_utils.converters import pymupdf_impl
+
+    with span("hybrid.plan"):
+        profiles = plan(pdf_path, pages)
+    marker_pages = [p["page"] for p in profiles if p["engine"] == "marker"]
+    marker_texts: Dict[int, str] = {}
+    if marker_pages:
+        from thomas_utils.converters.marker_impl import convert_pages
+
+        marker_texts = convert_pages(pdf_path, marker_pages)
+    parts: List[str] = []
+    run: List[int] = []
+    # 연속된 pymupdf 페이지는 묶어서 페이지 병렬 변환
+    for prof in profiles + [None]:
+        if prof is not None and prof["engine"] == "pymupdf":
+            run.append(prof["page"])
+            continue
+        if run:
+            parts.append(pymupdf_impl.convert(pdf_path, pages=run, workers=workers))
+            run = []
+        if prof is not None:
+            body = marker_texts.get(prof["page"], "")
+            parts.append(body + "\n\n" if body else "")
+    return "".join(parts)
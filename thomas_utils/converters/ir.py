@@ -0,0 +1,256 @@
+"""Typed intermediate representation (IR) of a converted document, and its emitters.
+
+Engines describe what they extracted as small __slots__ objects instead of
+assembling Markdown strings:
+
+- Document: source name plus a (lazy) iterable of units.
+- Slide / Page: one unit per slide or PDF page. A Slide's content is a list of
+  shapes (text boxes, tables ...), each a list of blocks.
+- Blocks: Paragraph, ListItem, Code, Math, Table, and Markdown for text an
+  engine already delivers as Markdown (PDF engines).
+
+iter_markdown() / iter_json() (and write(), which sends them to a stream) walk
+the units once and emit each unit as soon as the engine has produced it, so a
+document is never held as a whole. The Markdown is byte-for-byte what the
+engines' string-building code produced before.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+SLIDE_SEPARATOR = "\n\n---\n\n"
+FORMATS = ("markdown", "json")
+
+# 마크다운 이미지 문법 줄 제거용 (슬라이드 텍스트에 포함된 경우 제외)
+IMAGE_LINE_PATTERN = re.compile(r"^!\[.*\]\(.*\)\s*$", re.MULTILINE)
+
+
+class Paragraph:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def markdown(self) -> str:
+        return self.text
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "paragraph", "text": self.text}
+
+
+class ListItem:
+    __slots__ = ("text", "level")
+
+    def __init__(self, text: str, level: int):
+        self.text = text
+        self.level = level
+
+    def markdown(self) -> str:
+        return "   " * self.level + "- " + self.text
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "list_item", "text": self.text, "level": self.level}
+
+
+class Code:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def markdown(self) -> str:
+        return "```\n" + self.text + "\n```"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "code", "text": self.text}
+
+
+class Math:
+    __slots__ = ("latex",)
+
+    def __init__(self, latex: str):
+        self.latex = latex
+
+    def markdown(self) -> str:
+        return "$$" + self.latex + "$$"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "math", "latex": self.latex}
+
+
+class Table:
+    """A table rendered in the requested table format, plus its cell texts (None where merged)."""
+
+    __slots__ = ("text", "rows")
+
+    def __init__(self, text: str, rows: List[List[Optional[str]]]):
+        self.text = text
+        self.rows = rows
+
+    def markdown(self) -> str:
+        return self.text
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "table", "text": self.text, "rows": self.rows}
+
+
+class Markdown:
+    """Text an engine already produced as Markdown (PDF pages), passed through unchanged."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def markdown(self) -> str:
+        return self.text
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "markdown", "text": self.text}
+
+
+Block = Union[Paragraph, ListItem, Code, Math, Table, Markdown]
+
+
+def _finish_block(block: str) -> str:
+    """Drop image-only lines, collapse blank-line runs and trim one slide block."""
+    # 대부분의 슬라이드에는 둘 다 없으므로 정규식을 건너뜀
+    if "![" in block:
+        block = IMAGE_LINE_PATTERN.sub("", block)
+    if "\n\n\n" in block:
+        block = re.sub(r"\n{3,}", "\n\n", block)
+    return block.strip()
+
+
+class Slide:
+    """One slide: index (0-based), count (slides in the deck), Type/Layout header and shapes.
+
+    Args:
+        type: "Title Slide", "Content Slide" or "Section Divider".
+        layout: Slide layout name (None if unknown).
+        layout_hint: Layout line of the Markdown header (e.g. "Center-aligned"), if any.
+        shapes: Content in reading order; each shape is a list of blocks. Markdown
+                trims each shape's text, so a leading list item loses its indent.
+    """
+
+    __slots__ = ("index", "count", "type", "layout", "layout_hint", "title", "subtitle", "shapes")
+
+    def __init__(
+        self,
+        index: int,
+        count: int,
+        type: str,
+        layout: Optional[str] = None,
+        layout_hint: Optional[str] = None,
+        title: Optional[str] = None,
+        subtitle: Optional[str] = None,
+        shapes: Optional[List[List[Block]]] = None,
+    ):
+        self.index = index
+        self.count = count
+        self.type = type
+        self.layout = layout
+        self.layout_hint = layout_hint
+        self.title = title
+        self.subtitle = subtitle
+        self.shapes = shapes if shapes is not None else []
+
+    def markdown(self) -> str:
+        """The ## Slide N / **Type** / ### Content block."""
+        lines = [f"## Slide {self.index + 1}", f"**Type**: {self.type}"]
+        if self.layout_hint:
+            lines.append(f"**Layout**: {self.layout_hint}")
+        if self.title:
+            lines.append(f"**Title**: {self.title}")
+        if self.subtitle:
+            lines.append(f"**Subtitle**: {self.subtitle}")
+        lines += ["", "### Content", ""]
+        content = "\n\n".join(
+            text for text in ("\n\n".join(b.markdown() for b in shape).strip() for shape in self.shapes) if text
+        )
+        if content:
+            lines.append(content)
+        return _finish_block("\n".join(lines))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "slide": self.index,
+            "slide_count": self.count,
+            "type": self.type,
+            "layout": self.layout,
+            "title": self.title,
+            "subtitle": self.subtitle,
+            "blocks": [dict(b.to_dict(), shape=n) for n, shape in enumerate(self.shapes) for b in shape],
+        }
+
+
+class Page:
+    """One PDF page: index (0-based; None when an engine converts the selection at once)."""
+
+    __slots__ = ("index", "count", "blocks")
+
+    def __init__(self, index: Optional[int], count: Optional[int], blocks: List[Block]):
+        self.index = index
+        self.count = count
+        self.blocks = blocks
+
+    def markdown(self) -> str:
+        return "".join(b.markdown() for b in self.blocks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"page": self.index, "page_count": self.count, "blocks": [b.to_dict() for b in self.blocks]}
+
+
+Unit = Union[Slide, Page]
+
+
+def pages(chunks: Iterable[Dict[str, Any]]) -> Iterator[Page]:
+    """IR pages from PDF chunk dicts (registry.iter_convert), one Markdown block each."""
+    for chunk in chunks:
+        yield Page(chunk["page"], chunk["page_count"], [Markdown(chunk["text"])])
+
+
+class Document:
+    """A converted file: source name and its units (any iterable; consumed once by an emitter)."""
+
+    __slots__ = ("source", "units")
+
+    def __init__(self, source: str, units: Iterable[Unit]):
+        self.source = source
+        self.units = units
+
+
+def iter_markdown(doc: Document) -> Iterator[str]:
+    """Markdown of doc piece by piece: slides joined by --- separators, pages back to back."""
+    first = True
+    slides = False
+    for unit in doc.units:
+        if isinstance(unit, Slide):
+            slides = True
+            yield unit.markdown() if first else SLIDE_SEPARATOR + unit.markdown()
+        else:
+            yield unit.markdown()
+        first = False
+    if slides:
+        yield "\n"
+
+
+def iter_json(doc: Document) -> Iterator[str]:
+    """JSON of doc piece by piece: {"source": ..., "units": [slide or page objects]}."""
+    yield '{"source": ' + json.dumps(doc.source, ensure_ascii=False) + ', "units": ['
+    for n, unit in enumerate(doc.units):
+        yield ("\n" if n == 0 else ",\n") + json.dumps(unit.to_dict(), ensure_ascii=False)
+    yield "\n]}\n"
+
+
+def write(doc: Document, stream: TextIO, output_format: str = "markdown") -> None:
+    """Write doc to stream as "markdown" or "json", one unit at a time."""
+    if output_format not in FORMATS:
+        raise ValueError(f"Unknown output format: {output_format!r}. Choose from {FORMATS}.")
+    for text in (iter_markdown if output_format == "markdown" else iter_json)(doc):
+        stream.write(text)
+
+
+def to_markdown(doc: Document) -> str:
+    return "".join(iter_markdown(doc))
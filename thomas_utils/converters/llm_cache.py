@@ -0,0 +1,141 @@
+"""Persistent SQLite cache for LLM / vision responses.
+
+Keys are a hash of the model name, the prompt text and (for vision requests)
+the image bytes. Entries expire after a TTL and the least recently used ones are
+evicted once the stored responses exceed max_size. One database file can be
+shared by threads and processes (WAL mode, busy timeout).
+
+Modes:
+    "on"        read and write (default)
+    "read-only" serve hits, never write
+    "refresh"   never read, overwrite with fresh responses
+    "off"       bypass the cache entirely
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from thomas_utils.converters.cache import parse_size
+
+MODES = ("on", "read-only", "refresh", "off")
+
+
+def default_cache_path() -> Path:
+    """~/.cache/thomas_utils/llm_cache.sqlite (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "thomas_utils" / "llm_cache.sqlite"
+
+
+class LLMCache:
+    """SQLite-backed response cache.
+
+    Args:
+        path: Database file. None = default_cache_path().
+        mode: One of MODES.
+        ttl: Entry lifetime in seconds. None = never expires.
+        max_size: Maximum total response size (bytes or '200M' style string). None = unbounded.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        mode: str = "on",
+        ttl: Optional[float] = None,
+        max_size: Optional[Union[int, str]] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cache mode: {mode}. Choose from {MODES}.")
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.mode = mode
+        self.ttl = ttl
+        self.max_size = parse_size(max_size) if max_size is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+                " created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def key(model: str, prompt: str, image: Optional[bytes] = None) -> str:
+        """Cache key for one request."""
+        h = hashlib.sha256()
+        for part in (model.encode("utf-8"), prompt.encode("utf-8")):
+            h.update(hashlib.sha256(part).digest())
+        if image is not None:
+            h.update(hashlib.sha256(image).digest())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for key, or None (always None in "refresh" / "off" mode)."""
+        if self.mode in ("refresh", "off"):
+            return None
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            row = db.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                if self.mode == "on":
+                    db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            if self.mode == "on":
+                db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response (no-op in "read-only" / "off" mode)."""
+        if self.mode in ("read-only", "off"):
+            return
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now),
+            )
+            if self.max_size is not None:
+                self._evict(db)
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+        freed = 0
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if total - freed <= self.max_size:
+                break
+            doomed.append((key,))
+            freed += size
+        db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this cache object."""
+        return {"hits": self.hits, "misses": self.misses}
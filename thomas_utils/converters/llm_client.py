@@ -0,0 +1,198 @@
+"""Concurrent, rate-limited calls to an OpenAI-compatible API.
+
+Used by the PPTX LLM paths: requests run on a thread pool, a token bucket caps
+the request rate, and an adaptive (AIMD) limiter halves concurrency on 429/5xx
+responses and grows it back on success. Throttled or failed requests are retried
+with jittered exponential backoff (or the server's Retry-After).
+"""
+
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 20.0
+
+
+class TokenBucket:
+    """Blocking token bucket: at most `rate` acquisitions per second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """Concurrency cap that halves on throttling and grows by one after `limit` successes."""
+
+    def __init__(self, max_concurrency: int):
+        self.max = max(1, int(max_concurrency))
+        self.limit = self.max
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self._active -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    code = getattr(exc, "status_code", None)
+    if code is None:
+        code = getattr(getattr(exc, "response", None), "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for rate limiting (429), server errors (5xx), timeouts and connection errors."""
+    code = _status_code(exc)
+    if code is not None:
+        return code == 429 or 500 <= code < 600
+    name = type(exc).__name__
+    return "Timeout" in name or "Connection" in name
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_retry(
+    fn: Callable[[], R],
+    limiter: Optional[AdaptiveLimiter] = None,
+    bucket: Optional[TokenBucket] = None,
+    retries: Optional[int] = None,
+) -> R:
+    """Call fn() under the limiter/bucket, retrying retryable errors with jittered backoff."""
+    retries = RETRIES if retries is None else retries
+    for attempt in range(retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            result = fn()
+        except Exception as e:
+            retryable = is_retryable(e)
+            if limiter is not None:
+                limiter.release(throttled=retryable)
+            if not retryable or attempt == retries:
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                # full jitter: 0 ~ min(max, base * 2^attempt)
+                delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+            time.sleep(delay)
+            continue
+        if limiter is not None:
+            limiter.release()
+        return result
+    raise AssertionError("unreachable")
+
+
+def map_concurrent(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    concurrency: int = 4,
+    rate: Optional[float] = None,
+    on_error: Optional[Callable[[T, BaseException], R]] = None,
+) -> List[R]:
+    """Apply fn to items on a thread pool and return the results in input order.
+
+    Args:
+        fn: Callable doing one request; exceptions from it are retried when retryable.
+        items: Inputs, one request each.
+        concurrency: Maximum simultaneous requests (adaptively lowered on 429/5xx).
+        rate: Optional maximum requests per second (token bucket).
+        on_error: Called with (item, exception) when an item finally fails; its return
+                  value is used as that item's result. None = re-raise.
+    """
+    limiter = AdaptiveLimiter(concurrency)
+    bucket = TokenBucket(rate) if rate else None
+
+    def run(item: T) -> R:
+        try:
+            return call_with_retry(lambda: fn(item), limiter, bucket)
+        except Exception as e:
+            if on_error is None:
+                raise
+            return on_error(item, e)
+
+    if not items:
+        return []
+    if len(items) == 1 or limiter.max == 1:
+        return [run(it) for it in items]
+    with ThreadPoolExecutor(max_workers=min(limiter.max, len(items))) as pool:
+        # 호출한 쪽의 ContextVar(프로파일러 등)를 작업 스레드에서도 보이게 함
+        futures = [pool.submit(contextvars.copy_context().run, run, it) for it in items]
+        return [f.result() for f in futures]
+
+
+def openai_client() -> Tuple[Optional[Any], str]:
+    """Return (OpenAI client, "") or (None, reason) if the key or packages are missing.
+
+    Reads OPENAI_API_KEY (and OPENAI_BASE_URL, honoured by the openai package) from
+    the environment / .env. The client's own retries are disabled; callers retry
+    through call_with_retry.
+    """
+    try:
+        import os
+
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            return None, "OPENAI_API_KEY not set"
+        import openai
+    except ImportError:
+        return None, "openai or python-dotenv not installed"
+    client = getattr(openai, "OpenAI", None)
+    if not client:
+        return None, "openai.OpenAI not available"
+    return client(api_key=api_key, max_retries=0), ""
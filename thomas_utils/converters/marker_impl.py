@@ -1,11 +1,122 @@
 """marker-pdf-backed PDF -> Markdown conversion.
 
 Requires: pip install thomas-utils[marker]
-Pages are ignored for this engine; the full document is converted.
+
+Model weights are loaded once per process (on first use or via preload()) and
+reused by later convert() calls. Calling preload() in a parent process before
+forking workers lets the workers share the weights copy-on-write.
+
+When pages are given, only those pages are copied into a subset PDF with PyMuPDF
+and converted; marker's page separators are renumbered to the original pages.
 """
 
+import os
+import re
+import tempfile
+import threading
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
+
+from thomas_utils.profiling import span
+
+_models = None
+_converters: Dict[bool, object] = {}
+_converter_lock = threading.Lock()
+
+# marker paginate_output 구분자: "{page_id}" + "-" * 48
+_PAGE_SEPARATOR = re.compile(r"^\{(\d+)\}(-{48})$", re.MULTILINE)
+
+
+def _get_converter(paginate: bool = False):
+    """Return the process-wide PdfConverter, building it (and loading models) on first use.
+
+    Converters with and without paginated output share one model dict.
+    """
+    global _models
+    conv = _converters.get(paginate)
+    if conv is None:
+        with _converter_lock:
+            conv = _converters.get(paginate)
+            if conv is None:
+                from marker.converters.pdf import PdfConverter
+                from marker.models import create_model_dict
+
+                if _models is None:
+                    with span("marker.load_models"):
+                        _models = create_model_dict()
+                config = {"paginate_output": True} if paginate else None
+                conv = PdfConverter(artifact_dict=_models, config=config)
+                _converters[paginate] = conv
+    return conv
+
+
+def preload() -> None:
+    """Load marker models now instead of on the first convert() call.
+
+    Call this in a parent process before forking workers (see
+    thomas_utils.converters.batch.convert_many) so the model memory is shared.
+    """
+    _get_converter()
+
+
+def is_loaded() -> bool:
+    """True if the models are already loaded in this process."""
+    return _models is not None
+
+
+def _write_subset_pdf(path: Path, pages: List[int], dest: str) -> List[int]:
+    """Copy the given pages of path, each once in document order, into a new PDF at dest.
+
+    Returns the original page index of each page in the subset.
+    """
+    import pymupdf
+
+    with pymupdf.open(str(path)) as src:
+        # 다른 엔진(_page_list 등)과 캐시 키처럼 정렬·중복 제거
+        page_list = sorted(set(pages))
+        bad = [p for p in page_list if p < 0 or p >= src.page_count]
+        if bad:
+            raise ValueError(f"Page index out of range: {bad[0]} (document has {src.page_count})")
+        with pymupdf.open() as sub:
+            for p in page_list:
+                sub.insert_pdf(src, from_page=p, to_page=p)
+            sub.save(dest, garbage=1)
+    return page_list
+
+
+def _renumber_pages(text: str, original: List[int]) -> str:
+    """Map marker's subset page ids in page separators back to original page numbers."""
+
+    def repl(m: "re.Match") -> str:
+        i = int(m.group(1))
+        return f"{{{original[i] if i < len(original) else i}}}{m.group(2)}"
+
+    return _PAGE_SEPARATOR.sub(repl, text)
+
+
+def _render(filepath: str, paginate: bool = False) -> str:
+    from marker.output import text_from_rendered
+
+    converter = _get_converter(paginate)
+    with span("marker.convert"):
+        rendered = converter(filepath)
+    with span("marker.render"):
+        text, _, _ = text_from_rendered(rendered)
+    return text if isinstance(text, str) else str(text)
+
+
+def convert_pages(pdf_path: Union[str, Path], pages: List[int]) -> Dict[int, str]:
+    """Convert the given pages in one marker run and return {original page: Markdown}.
+
+    Used by the hybrid engine, which merges marker pages with pymupdf pages.
+    """
+    text = convert(pdf_path, pages=pages)
+    out: Dict[int, str] = {}
+    matches = list(_PAGE_SEPARATOR.finditer(text))
+    for m, nxt in zip(matches, matches[1:] + [None]):
+        body = text[m.end():nxt.start() if nxt is not None else len(text)]
+        out[int(m.group(1))] = body.strip()
+    return out
 
 
 def convert(
@@ -16,21 +127,26 @@ def convert(
 
     Args:
         pdf_path: Path to the PDF file.
-        pages: Ignored for marker engine (full document is always converted).
+        pages: Optional 0-based page indices. None = all pages. When given, only
+               these pages are run through the models, each once in document order,
+               and the output carries marker page separators ("{N}------…") with the
+               original page numbers.
 
     Returns:
         UTF-8 Markdown string.
     """
-    # pages intentionally unused: marker API does not expose page range in PdfConverter
     path = Path(pdf_path)
     if not path.exists():
         raise FileNotFoundError(f"PDF not found: {path}")
+    if pages is None:
+        return _render(str(path))
 
-    from marker.converters.pdf import PdfConverter
-    from marker.models import create_model_dict
-    from marker.output import text_from_rendered
-
-    converter = PdfConverter(artifact_dict=create_model_dict())
-    rendered = converter(str(path))
-    text, _, _ = text_from_rendered(rendered)
-    return text if isinstance(text, str) else str(text)
+    # marker는 파일 경로를 입력으로 받으므로 부분 PDF를 임시 파일로 만든다
+    fd, tmp = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    try:
+        with span("marker.subset_pdf"):
+            original = _write_subset_pdf(path, pages, tmp)
+        return _renumber_pages(_render(tmp, paginate=True), original)
+    finally:
+        os.unlink(tmp)
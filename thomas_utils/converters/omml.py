@@ -0,0 +1,280 @@
+"""Office Math (OMML) -> LaTeX, built in and dependency-free.
+
+Covers the constructs PowerPoint's equation editor produces: runs (with Greek
+letters, operators and arrows mapped to commands), fractions, radicals, n-ary
+operators (sums, products, integrals, big unions), sub/superscripts (including
+pre-scripts), delimiters, matrices, equation arrays, accents, bars, group
+characters, limits, function applications, boxes and phantoms. Unknown elements
+are descended into, so their content is never lost.
+
+to_latex() memoizes on the serialized m:oMath subtree: decks repeat the same
+equations on many slides, and serializing (C) is much cheaper than converting.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+M_NS_URI = "http://schemas.openxmlformats.org/officeDocument/2006/math"
+_M = "{" + M_NS_URI + "}"
+_VAL = _M + "val"
+
+
+def _table(chars: str, commands: str) -> Dict[str, str]:
+    names = commands.split()
+    assert len(chars) == len(names)
+    return dict(zip(chars, names))
+
+
+# 유니코드 기호 -> LaTeX 명령
+_SYMBOLS = {
+    **_table(
+        "αβγδεϵζηθϑικλμνξπϖρϱσςτυφϕχψω",
+        r"\alpha \beta \gamma \delta \epsilon \epsilon \zeta \eta \theta \vartheta \iota \kappa \lambda \mu \nu "
+        r"\xi \pi \varpi \rho \varrho \sigma \varsigma \tau \upsilon \phi \phi \chi \psi \omega",
+    ),
+    **_table("ΓΔΘΛΞΠΣΥΦΨΩ", r"\Gamma \Delta \Theta \Lambda \Xi \Pi \Sigma \Upsilon \Phi \Psi \Omega"),
+    **_table("∞∂∇ℏℓ∅", r"\infty \partial \nabla \hbar \ell \emptyset"),
+    **_table("±∓×÷·⋅∘∗⊕⊗∧∨¬", r"\pm \mp \times \div \cdot \cdot \circ \ast \oplus \otimes \wedge \vee \neg"),
+    **_table(
+        "≤≥≠≈≡∼≃≅∝≪≫≔⊥∥∠",
+        r"\leq \geq \neq \approx \equiv \sim \simeq \cong \propto \ll \gg \coloneqq \perp \parallel \angle",
+    ),
+    **_table(
+        "∈∉∋⊂⊃⊆⊇∪∩∖∀∃",
+        r"\in \notin \ni \subset \supset \subseteq \supseteq \cup \cap \setminus \forall \exists",
+    ),
+    **_table(
+        "→←↔⇒⇐⇔↦↑↓",
+        r"\rightarrow \leftarrow \leftrightarrow \Rightarrow \Leftarrow \Leftrightarrow \mapsto \uparrow \downarrow",
+    ),
+    **_table("…⋯⋮⋱⟨⟩", r"\ldots \cdots \vdots \ddots \langle \rangle"),
+    **_table("ℝℕℤℚℂ", r"\mathbb{R} \mathbb{N} \mathbb{Z} \mathbb{Q} \mathbb{C}"),
+    "′": "'",
+    "″": "''",
+    "°": r"^{\circ}",
+    "−": "-",
+    # 보이지 않는 연산자(함수 적용, 곱하기, 구분자)와 폭 없는 공백
+    "\u2061": "",
+    "\u2062": "",
+    "\u2063": "",
+    "\u200b": "",
+}
+_ESCAPES = _table("{}#%&$_\\", r"\{ \} \# \% \& \$ \_ \backslash")
+
+_NARY = _table(
+    "∑∏∐∫∬∭∮∯⋃⋂⋁⋀⨁⨂⨀⨄",
+    r"\sum \prod \coprod \int \iint \iiint \oint \oiint \bigcup \bigcap \bigvee \bigwedge "
+    r"\bigoplus \bigotimes \bigodot \biguplus",
+)
+# 결합 문자(U+0300 ...)는 보이지 않으므로 코드 포인트로 적음
+_ACCENTS = _table(
+    "\u0300\u0301\u0302\u0303\u0304\u0305\u0306\u0307\u0308\u030c\u20d6\u20d7\u20e1",
+    r"\grave \acute \hat \tilde \bar \overline \breve \dot \ddot \check \overleftarrow \vec "
+    r"\overleftrightarrow",
+)
+_DELIMS = {
+    **_table("{}⟨⟩〈〉‖⌊⌋⌈⌉", r"\{ \} \langle \rangle \langle \rangle \| \lfloor \rfloor \lceil \rceil"),
+    "": ".",
+}
+# \lim, \sin 처럼 LaTeX에 명령이 있는 함수 이름
+_FUNCTIONS = frozenset(
+    "sin cos tan cot sec csc arcsin arccos arctan sinh cosh tanh coth log ln lg exp lim liminf limsup "
+    "max min sup inf det dim ker deg gcd arg Pr hom mod".split()
+)
+_COMMAND_END = re.compile(r"\\[A-Za-z]+$")
+
+
+def _concat(parts: List[str]) -> str:
+    """Join LaTeX pieces, keeping a command from running into a following letter (\\alpha b)."""
+    out = ""
+    for part in parts:
+        if not part:
+            continue
+        if out and part[0].isalpha() and _COMMAND_END.search(out):
+            out += " "
+        out += part
+    return out
+
+
+def _prop(el: Any, pr: str, name: str, default: str = "") -> str:
+    """m:val of <m:{pr}><m:{name}/> under el; default when absent. A flag without m:val means on ("1")."""
+    pr_el = el.find(_M + pr)
+    node = pr_el.find(_M + name) if pr_el is not None else None
+    if node is None:
+        return default
+    return node.get(_VAL, "1")
+
+
+def _on(value: str) -> bool:
+    return value in ("1", "on", "true")
+
+
+def _text(t: str) -> str:
+    return _concat([_SYMBOLS[ch] if ch in _SYMBOLS else _ESCAPES.get(ch, ch) for ch in t])
+
+
+def _children(el: Any) -> str:
+    # 속성 요소(m:rPr, m:fPr, m:ctrlPr ...)는 건너뜀
+    return _concat([_node(c) for c in el if not (isinstance(c.tag, str) and c.tag.endswith("Pr"))])
+
+
+def _arg(el: Any, name: str) -> str:
+    child = el.find(_M + name)
+    return _children(child) if child is not None else ""
+
+
+def _run(el: Any) -> str:
+    text = "".join(t.text or "" for t in el.iter(_M + "t"))
+    if el.find(f"{_M}rPr/{_M}nor") is not None and text.strip():
+        return r"\text{" + text + "}"
+    return _text(text)
+
+
+def _frac(el: Any) -> str:
+    num, den = _arg(el, "num"), _arg(el, "den")
+    kind = _prop(el, "fPr", "type", "bar")
+    if kind == "lin":
+        return f"{num}/{den}"
+    if kind == "noBar":
+        return r"\genfrac{}{}{0pt}{}{" + num + "}{" + den + "}"
+    return r"\frac{" + num + "}{" + den + "}"
+
+
+def _rad(el: Any) -> str:
+    deg = _arg(el, "deg")
+    if deg and not _on(_prop(el, "radPr", "degHide", "0")):
+        return r"\sqrt[" + deg + "]{" + _arg(el, "e") + "}"
+    return r"\sqrt{" + _arg(el, "e") + "}"
+
+
+def _nary(el: Any) -> str:
+    chr_ = _prop(el, "naryPr", "chr", "∫")
+    op = _NARY.get(chr_) or _text(chr_)
+    sub = "" if _on(_prop(el, "naryPr", "subHide", "0")) else _arg(el, "sub")
+    sup = "" if _on(_prop(el, "naryPr", "supHide", "0")) else _arg(el, "sup")
+    out = op + (f"_{{{sub}}}" if sub else "") + (f"^{{{sup}}}" if sup else "")
+    return out + "{" + _arg(el, "e") + "}"
+
+
+def _base(s: str) -> str:
+    """Brace a script base unless it is a single character or command."""
+    if len(s) == 1 or _COMMAND_END.fullmatch(s):
+        return s
+    return "{" + s + "}"
+
+
+def _delim(el: Any) -> str:
+    beg = _prop(el, "dPr", "begChr", "(")
+    end = _prop(el, "dPr", "endChr", ")")
+    sep = _prop(el, "dPr", "sepChr", "|")
+    inner = (_DELIMS.get(sep) or _text(sep)).join(_children(e) for e in el.iterfind(_M + "e"))
+    return _concat([r"\left" + _DELIMS.get(beg, beg), inner, r"\right" + _DELIMS.get(end, end)])
+
+
+def _matrix(el: Any) -> str:
+    rows = [" & ".join(_children(e) for e in mr.iterfind(_M + "e")) for mr in el.iterfind(_M + "mr")]
+    return r"\begin{matrix}" + r" \\ ".join(rows) + r"\end{matrix}"
+
+
+def _eq_arr(el: Any) -> str:
+    # 수식 배열에서는 &가 정렬 기호
+    rows = [_children(e).replace(r"\&", "&") for e in el.iterfind(_M + "e")]
+    return r"\begin{aligned}" + r" \\ ".join(rows) + r"\end{aligned}"
+
+
+def _acc(el: Any) -> str:
+    chr_ = _prop(el, "accPr", "chr", "̂")
+    return _ACCENTS.get(chr_, r"\hat") + "{" + _arg(el, "e") + "}"
+
+
+def _bar(el: Any) -> str:
+    cmd = r"\overline" if _prop(el, "barPr", "pos", "bot") == "top" else r"\underline"
+    return cmd + "{" + _arg(el, "e") + "}"
+
+
+def _group_chr(el: Any) -> str:
+    chr_ = _prop(el, "groupChrPr", "chr", "⏟")
+    pos = _prop(el, "groupChrPr", "pos", "bot")
+    e = _arg(el, "e")
+    if chr_ == "⏟":
+        return r"\underbrace{" + e + "}"
+    if chr_ == "⏞":
+        return r"\overbrace{" + e + "}"
+    cmd = r"\overset" if pos == "top" else r"\underset"
+    return cmd + "{" + _text(chr_) + "}{" + e + "}"
+
+
+def _lim(el: Any, upper: bool) -> str:
+    base, lim = _arg(el, "e"), _arg(el, "lim")
+    if base.lstrip("\\") in _FUNCTIONS:
+        return _concat([base if base.startswith("\\") else "\\" + base, ("^" if upper else "_") + "{" + lim + "}"])
+    return (r"\overset{" if upper else r"\underset{") + lim + "}{" + base + "}"
+
+
+def _func(el: Any) -> str:
+    name = _arg(el, "fName")
+    if name in _FUNCTIONS:
+        name = "\\" + name
+    elif name.isalpha() and len(name) > 1:
+        name = r"\operatorname{" + name + "}"
+    return name + "{" + _arg(el, "e") + "}"
+
+
+def _phant(el: Any) -> str:
+    if _on(_prop(el, "phantPr", "show", "1")):
+        return _arg(el, "e")
+    return r"\phantom{" + _arg(el, "e") + "}"
+
+
+_HANDLERS: Dict[str, Callable[[Any], str]] = {
+    "r": _run,
+    "f": _frac,
+    "rad": _rad,
+    "nary": _nary,
+    "sSup": lambda el: _base(_arg(el, "e")) + "^{" + _arg(el, "sup") + "}",
+    "sSub": lambda el: _base(_arg(el, "e")) + "_{" + _arg(el, "sub") + "}",
+    "sSubSup": lambda el: _base(_arg(el, "e")) + "_{" + _arg(el, "sub") + "}^{" + _arg(el, "sup") + "}",
+    "sPre": lambda el: "{}_{" + _arg(el, "sub") + "}^{" + _arg(el, "sup") + "}" + _base(_arg(el, "e")),
+    "d": _delim,
+    "m": _matrix,
+    "eqArr": _eq_arr,
+    "acc": _acc,
+    "bar": _bar,
+    "groupChr": _group_chr,
+    "limLow": lambda el: _lim(el, upper=False),
+    "limUpp": lambda el: _lim(el, upper=True),
+    "func": _func,
+    "borderBox": lambda el: r"\boxed{" + _arg(el, "e") + "}",
+    "phant": _phant,
+}
+
+
+def _node(el: Any) -> str:
+    tag = el.tag
+    if not isinstance(tag, str):
+        return ""  # 주석, 처리 명령
+    if tag.startswith(_M):
+        handler = _HANDLERS.get(tag[len(_M) :])
+        if handler is not None:
+            return handler(el)
+    return _children(el)
+
+
+@lru_cache(maxsize=4096)
+def _convert_xml(xml: bytes) -> str:
+    from lxml import etree
+
+    return _children(etree.fromstring(xml)).strip()
+
+
+def to_latex(omath: Any) -> str:
+    """LaTeX for one m:oMath (or m:oMathPara) lxml element, memoized on its serialized XML."""
+    from lxml import etree
+
+    return _convert_xml(etree.tostring(omath, with_tail=False))
+
+
+def has_math(el: Any) -> bool:
+    """True if el (an lxml element) contains any m:oMath, found by a C-level tree walk."""
+    return next(el.iter(_M + "oMath"), None) is not None
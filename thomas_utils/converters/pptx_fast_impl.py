@@ -0,0 +1,355 @@
+"""High-throughput PowerPoint (.pptx) -> Markdown reading slide XML straight from the zip.
+
+The python-pptx engine builds the whole object model (every part, including
+media) and walks slide.shapes several times per slide. This engine instead:
+
+- reads only presentation.xml, the slide parts and the layout/master parts
+  they reference (image and other media parts are never opened);
+- streams each slide with lxml.iterparse and visits every shape once,
+  clearing processed elements as it goes;
+- caches layout names and layout/master placeholder positions per part;
+- recurses into group shapes (python-pptx's slide.shapes does not).
+
+Output uses the same ## Slide N / **Type** / ### Content template and the same
+text, table and OMML helpers as pptx_impl, so decks without group shapes
+produce identical Markdown.
+"""
+
+import io
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from thomas_utils.converters import ir
+from thomas_utils.converters.omml import M_NS_URI
+from thomas_utils.converters.pptx_impl import (
+    _A_NS,
+    _MC_NS,
+    _P_NS,
+    _SHAPE_TAGS,
+    _omml_latex,
+    _paragraph_blocks,
+    _select_indices,
+    _shape_elements,
+    _slide_chunks,
+    _slide_ir,
+    _table_block,
+    _tx_body_paragraphs,
+)
+from thomas_utils.profiling import span
+
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+_TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+
+_TITLE_TYPES = ("title", "ctrTitle")
+# 레이아웃 자리표시자가 위치를 물려받는 마스터 자리표시자 종류 (python-pptx와 동일)
+_MASTER_BASE_TYPE = {
+    "body": "body",
+    "chart": "body",
+    "clipArt": "body",
+    "ctrTitle": "title",
+    "dgm": "body",
+    "dt": "dt",
+    "ftr": "ftr",
+    "media": "body",
+    "obj": "body",
+    "pic": "body",
+    "sldNum": "sldNum",
+    "subTitle": "body",
+    "tbl": "body",
+    "title": "title",
+}
+
+Offset = Tuple[int, int]  # (top, left) in EMU
+
+
+def _etree():
+    from lxml import etree
+
+    return etree
+
+
+def _nv_pr(el: Any) -> Any:
+    """p:nvPr of a shape element (first child is p:nvSpPr / p:nvPicPr / ...)."""
+    nv = el[0] if len(el) else None
+    return nv.find(_P_NS + "nvPr") if nv is not None else None
+
+
+def _placeholder(el: Any) -> Optional[Tuple[str, int]]:
+    """(type, idx) if el is a placeholder; type defaults to "obj" and idx to 0 as in the schema."""
+    nv_pr = _nv_pr(el)
+    ph = nv_pr.find(_P_NS + "ph") if nv_pr is not None else None
+    if ph is None:
+        return None
+    return ph.get("type", "obj"), int(ph.get("idx", 0))
+
+
+def _xfrm(el: Any) -> Any:
+    tag = el.tag
+    if tag == _P_NS + "graphicFrame":
+        return el.find(_P_NS + "xfrm")
+    if tag == _P_NS + "grpSp":
+        return el.find(f"{_P_NS}grpSpPr/{_A_NS}xfrm")
+    return el.find(f"{_P_NS}spPr/{_A_NS}xfrm")
+
+
+def _offset(el: Any) -> Optional[Offset]:
+    xfrm = _xfrm(el)
+    off = xfrm.find(_A_NS + "off") if xfrm is not None else None
+    if off is None:
+        return None
+    return int(off.get("y", 0)), int(off.get("x", 0))
+
+
+def _shape_text(el: Any) -> List[Tuple[str, int]]:
+    tx_body = el.find(_P_NS + "txBody")
+    return _tx_body_paragraphs(tx_body) if tx_body is not None else [("", 0)]
+
+
+class _Package:
+    """Lazily read, cached view of the parts of one .pptx zip."""
+
+    def __init__(self, zf: zipfile.ZipFile):
+        self.zf = zf
+        self._rels: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._layouts: Dict[str, Tuple[str, Dict[int, Tuple[str, Optional[Offset]]], Optional[str]]] = {}
+        self._masters: Dict[str, Dict[str, Optional[Offset]]] = {}
+
+    def _xml(self, part: str) -> Any:
+        return _etree().fromstring(self.zf.read(part))
+
+    def rels(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """{rId: (relationship type suffix, absolute target part)} for part."""
+        rels = self._rels.get(part)
+        if rels is None:
+            rels = {}
+            folder, name = posixpath.split(part)
+            rels_part = posixpath.join(folder, "_rels", name + ".rels")
+            if rels_part in self.zf.NameToInfo:
+                for rel in self._xml(rels_part).iterfind(_PKG_REL_NS + "Relationship"):
+                    if rel.get("TargetMode") == "External":
+                        continue
+                    target = posixpath.normpath(posixpath.join(folder, rel.get("Target", "")))
+                    rels[rel.get("Id")] = (rel.get("Type", "").rsplit("/", 1)[-1], target.lstrip("/"))
+            self._rels[part] = rels
+        return rels
+
+    def _related(self, part: str, rel_type: str) -> Optional[str]:
+        for typ, target in self.rels(part).values():
+            if typ == rel_type:
+                return target
+        return None
+
+    def slide_parts(self) -> List[str]:
+        """Slide part names in presentation order."""
+        prs = self._xml("ppt/presentation.xml")
+        rels = self.rels("ppt/presentation.xml")
+        lst = prs.find(_P_NS + "sldIdLst")
+        if lst is None:
+            return []
+        return [rels[s.get(_R_NS + "id")][1] for s in lst.iterfind(_P_NS + "sldId")]
+
+    def master(self, part: str) -> Dict[str, Optional[Offset]]:
+        """{placeholder type: offset} of a slide master (first placeholder of each type)."""
+        master = self._masters.get(part)
+        if master is None:
+            master = {}
+            tree = self._xml(part).find(f"{_P_NS}cSld/{_P_NS}spTree")
+            for el in tree if tree is not None else ():
+                ph = _placeholder(el) if el.tag in _SHAPE_TAGS else None
+                if ph is not None and ph[0] not in master:
+                    master[ph[0]] = _offset(el)
+            self._masters[part] = master
+        return master
+
+    def layout(self, part: str) -> Tuple[str, Dict[int, Tuple[str, Optional[Offset]]], Optional[str]]:
+        """(layout name, {placeholder idx: (type, own offset)}, master part) of a slide layout."""
+        layout = self._layouts.get(part)
+        if layout is None:
+            root = self._xml(part)
+            c_sld = root.find(_P_NS + "cSld")
+            placeholders: Dict[int, Tuple[str, Optional[Offset]]] = {}
+            tree = c_sld.find(_P_NS + "spTree") if c_sld is not None else None
+            for el in tree if tree is not None else ():
+                ph = _placeholder(el) if el.tag in _SHAPE_TAGS else None
+                if ph is not None and ph[1] not in placeholders:
+                    placeholders[ph[1]] = (ph[0], _offset(el))
+            name = c_sld.get("name", "") if c_sld is not None else ""
+            layout = (name, placeholders, self._related(part, "slideMaster"))
+            self._layouts[part] = layout
+        return layout
+
+    def inherited_offset(self, layout_part: Optional[str], idx: int) -> Optional[Offset]:
+        """Offset a slide placeholder inherits: layout placeholder by idx, else master by type."""
+        if layout_part is None:
+            return None
+        _, placeholders, master_part = self.layout(layout_part)
+        if idx not in placeholders:
+            return None
+        ph_type, off = placeholders[idx]
+        if off is not None or master_part is None:
+            return off
+        base = _MASTER_BASE_TYPE.get(ph_type)
+        return self.master(master_part).get(base) if base else None
+
+
+def _iter_top_shapes(stream: Any) -> Iterator[Any]:
+    """Stream the direct shape children of the slide's p:spTree, freeing each after use.
+
+    An mc:AlternateContent child yields the shapes of its mc:Choice branch (see _shape_elements).
+    """
+    sp_tree = _P_NS + "spTree"
+    for _, el in _etree().iterparse(stream, events=("end",), tag=_SHAPE_TAGS + (_MC_NS + "AlternateContent",)):
+        parent = el.getparent()
+        if parent is None or parent.tag != sp_tree:
+            continue  # 그룹 안의 도형은 그룹이 끝날 때 함께 처리
+        yield from _shape_elements((el,))
+        el.clear()
+        while el.getprevious() is not None:
+            del parent[0]
+
+
+def _group_transform(grp: Any):
+    """Map child-space offsets of a p:grpSp to slide coordinates."""
+    xfrm = _xfrm(grp)
+    if xfrm is None:
+        return lambda off: off
+
+    def pair(name: str, a: str, b: str) -> Tuple[int, int]:
+        e = xfrm.find(_A_NS + name)
+        return (int(e.get(a, 0)), int(e.get(b, 0))) if e is not None else (0, 0)
+
+    (y, x), (cy, cx) = pair("off", "y", "x"), pair("ext", "cy", "cx")
+    (ch_y, ch_x), (ch_cy, ch_cx) = pair("chOff", "y", "x"), pair("chExt", "cy", "cx")
+    sy = cy / ch_cy if ch_cy else 1.0
+    sx = cx / ch_cx if ch_cx else 1.0
+    return lambda off: (int(y + (off[0] - ch_y) * sy), int(x + (off[1] - ch_x) * sx))
+
+
+def _slide_to_ir(
+    pkg: _Package,
+    slide_part: str,
+    slide_idx: int,
+    slide_count: int,
+    table_format: str = "markdown",
+) -> ir.Slide:
+    layout_part = pkg._related(slide_part, "slideLayout")
+    layout_name = pkg.layout(layout_part)[0] if layout_part else None
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    # (top, left, 본문 텍스트 또는 None, 도형의 블록)
+    content: List[Tuple[int, int, Optional[str], List[ir.Block]]] = []
+
+    def visit(el: Any, transform=None) -> None:
+        nonlocal title, subtitle
+        tag = el.tag
+        if tag == _P_NS + "grpSp":
+            inner = _group_transform(el)
+            outer = transform or (lambda off: off)
+            for child in _shape_elements(el):
+                visit(child, lambda off, inner=inner: outer(inner(off)))
+            return
+        off = _offset(el)
+        ph = _placeholder(el)
+        if ph is not None:
+            ph_type, idx = ph
+            if ph_type in _TITLE_TYPES or ph_type == "subTitle":
+                text = "\n".join(t for t, _ in _shape_text(el)).strip() if tag == _P_NS + "sp" else ""
+                if text:
+                    if ph_type == "subTitle":
+                        subtitle = text
+                    else:
+                        title = text
+                return
+            if ph_type != "body":
+                return
+            if off is None:
+                off = pkg.inherited_offset(layout_part, idx)
+        elif off is not None and transform is not None:
+            off = transform(off)
+        top, left = off or (0, 0)
+
+        if tag == _P_NS + "graphicFrame":
+            tbl = el.find(f"{_A_NS}graphic/{_A_NS}graphicData[@uri='{_TABLE_URI}']/{_A_NS}tbl")
+            if tbl is not None:
+                with span("pptx.table"):
+                    content.append((top, left, None, [_table_block(tbl, table_format)]))
+            return
+        if tag != _P_NS + "sp":
+            return  # 그림(이미지 미포함 정책), 연결선, contentPart
+        paragraphs = _shape_text(el)
+        text = "\n".join(t for t, _ in paragraphs).strip()
+        if not text:
+            return
+        with span("pptx.text"):
+            blocks = _paragraph_blocks(paragraphs)
+        if slide_has_math:
+            with span("pptx.omml"):
+                blocks += [ir.Math(latex) for latex in _omml_latex(el)]
+        content.append((top, left, text, blocks))
+
+    data = pkg.zf.read(slide_part)
+    # 수식 네임스페이스가 없는 슬라이드는 도형마다 수식을 찾지 않음
+    slide_has_math = M_NS_URI.encode("ascii") in data
+    for el in _iter_top_shapes(io.BytesIO(data)):
+        visit(el)
+
+    content.sort(key=lambda c: (c[0], c[1]))
+    shapes = [
+        blocks
+        for _, _, text, blocks in content
+        if blocks and not (text is not None and (title and text == title or subtitle and text == subtitle))
+    ]
+    return _slide_ir(slide_idx, slide_count, layout_name, title, subtitle, shapes)
+
+
+def iter_slides(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    table_format: str = "markdown",
+) -> Iterator[Dict[str, Any]]:
+    """Like pptx_impl.iter_slides, reading the zip package directly (same chunk dicts)."""
+    return _slide_chunks(iter_units(pptx_path, slides, table_format), slides)
+
+
+def iter_units(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    table_format: str = "markdown",
+) -> Iterator[ir.Slide]:
+    """Like pptx_impl.iter_units, reading the zip package directly."""
+    path = Path(pptx_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PPTX not found: {path}")
+    if not path.suffix.lower() == ".pptx":
+        raise ValueError(f"Expected .pptx file, got: {path}")
+
+    with zipfile.ZipFile(path) as zf:
+        with span("pptx.open"):
+            pkg = _Package(zf)
+            parts = pkg.slide_parts()
+        for slide_idx in _select_indices(slides, len(parts)):
+            with span("pptx.slide"):
+                unit = _slide_to_ir(pkg, parts[slide_idx], slide_idx, len(parts), table_format)
+            yield unit
+
+
+def convert(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    table_format: str = "markdown",
+) -> str:
+    """Convert PowerPoint to structured Markdown without building the python-pptx object model.
+
+    Args:
+        pptx_path: Path to the PPTX file.
+        slides: Optional 0-based slide indices. None means all slides.
+        table_format: "markdown", "html" or "auto" (see pptx_impl.convert).
+
+    Returns:
+        UTF-8 Markdown string in the same format as pptx_impl.convert.
+    """
+    return ir.to_markdown(ir.Document(Path(pptx_path).name, iter_units(pptx_path, slides, table_format)))
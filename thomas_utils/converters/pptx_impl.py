@@ -1,41 +1,24 @@
 """PowerPoint (.pptx) -> Markdown conversion using python-pptx."""
 
 import base64
-import json
 import os
 import re
-import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import List, Optional, Union
-
-# #region agent log
-LOG_PATH = Path(__file__).resolve().parents[2] / ".cursor" / "debug.log"
-SESSION = "debug-session"
-RUN_ID = "pptx-import-check"
-try:
-    import importlib.util
-    spec = importlib.util.find_spec("pptx")
-    pptx_available = spec is not None
-    payload = {
-        "sessionId": SESSION,
-        "runId": RUN_ID,
-        "hypothesisId": "H1",
-        "location": "pptx_impl.py:import",
-        "message": "pptx module availability check",
-        "data": {"pptx_available": pptx_available, "sys_executable": sys.executable},
-        "timestamp": __import__("time").time() * 1000,
-    }
-    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(payload) + "\n")
-except Exception:
-    pass
-# #endregion
-
-# 마크다운 이미지 문법 줄 제거용 (슬라이드 텍스트에 포함된 경우 제외)
-_IMAGE_LINE_PATTERN = re.compile(r"^!\[.*\]\(.*\)\s*$", re.MULTILINE)
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from thomas_utils.converters import ir
+from thomas_utils.profiling import span
+
+if TYPE_CHECKING:
+    from thomas_utils.converters.cache import ConversionCache
+    from thomas_utils.converters.llm_cache import LLMCache
+    from thomas_utils.converters.pptx_incremental import SlideManifest
+    from thomas_utils.converters.slide_images import ImageOptions
+    from thomas_utils.converters.tables import Cell
+
+_IMAGE_LINE_PATTERN = ir.IMAGE_LINE_PATTERN
 
 # 코드블록 후보: 문단이 코드처럼 보이는 패턴
 _CODE_LINE_PATTERN = re.compile(
@@ -45,16 +28,21 @@ _CODE_LINE_PATTERN = re.compile(
 
 def _strip_image_lines(text: str) -> str:
     """Remove lines that are markdown image references (e.g. ![...](...))."""
+    if "![" not in text:
+        return text.strip()
     return _IMAGE_LINE_PATTERN.sub("", text).strip()
 
 
-try:
-    from pptx import Presentation
-    from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
-except ImportError as e:
-    raise ImportError(
-        "python-pptx is not installed. Please run: pip install python-pptx"
-    ) from e
+def _pptx():
+    """Import python-pptx on first use (keeps `import thomas_utils.converters` light)."""
+    try:
+        import pptx
+        import pptx.enum.shapes
+    except ImportError as e:
+        raise ImportError(
+            "python-pptx is not installed. Please run: pip install python-pptx"
+        ) from e
+    return pptx
 
 
 def _content_shape_sort_key(shape) -> tuple:
@@ -97,6 +85,8 @@ def _get_placeholder_type(shape) -> Optional[int]:
 
 def _is_content_shape(shape, title: Optional[str], subtitle: Optional[str]) -> bool:
     """True if shape contributes to Content (body, table, text, or picture slot for ordering)."""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+
     pph = _get_placeholder_type(shape)
     if pph is not None:
         if pph in (
@@ -120,84 +110,124 @@ def _is_content_shape(shape, title: Optional[str], subtitle: Optional[str]) -> b
     return False
 
 
-def _table_to_markdown(table) -> str:
-    """Convert python-pptx table to markdown table string. Uses Pandas if available, else fallback."""
-    rows: List[List[str]] = []
-    for row in table.rows:
-        cells = []
-        for cell in row.cells:
-            cells.append((cell.text or "").replace("|", "\\|").replace("\n", " ").strip())
-        rows.append(cells)
-    if not rows:
+_A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_M_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/math}"
+_P_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+# python-pptx slide.shapes가 도형으로 보는 spTree 자식 요소
+_SHAPE_TAGS = tuple(_P_NS + t for t in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart"))
+
+
+def _paragraph_text(p) -> str:
+    """Text of an a:p element, same as python-pptx paragraph.text (a:r, a:fld; a:br -> "\v")."""
+    parts: List[str] = []
+    for el in p:
+        tag = el.tag
+        if tag == _A_NS + "r" or tag == _A_NS + "fld":
+            t = el.find(_A_NS + "t")
+            parts.append((t.text or "") if t is not None else "")
+        elif tag == _A_NS + "br":
+            parts.append("\v")
+    return "".join(parts)
+
+
+def _tx_body_paragraphs(tx_body) -> List[Tuple[str, int]]:
+    """(text, level) of every a:p in an a:txBody / p:txBody element."""
+    out: List[Tuple[str, int]] = []
+    for p in tx_body.iterfind(_A_NS + "p"):
+        ppr = p.find(_A_NS + "pPr")
+        out.append((_paragraph_text(p), int(ppr.get("lvl", 0)) if ppr is not None else 0))
+    return out
+
+
+def _tc_text(tc) -> str:
+    """Text of an a:tc element, same as python-pptx cell.text (paragraphs "\n", line breaks "\v")."""
+    tx_body = tc.find(_A_NS + "txBody")
+    if tx_body is None:
         return ""
-    col_count = max(len(r) for r in rows)
-    for r in rows:
-        while len(r) < col_count:
-            r.append("")
-    try:
-        import pandas as pd
-        df = pd.DataFrame(rows)
-        return df.to_markdown(index=False, tablefmt="github")
-    except ImportError:
-        pass
-    lines = ["| " + " | ".join(rows[0]) + " |", "| " + " | ".join("---" for _ in range(col_count)) + " |"]
-    for r in rows[1:]:
-        lines.append("| " + " | ".join(r) + " |")
-    return "\n".join(lines)
+    return "\n".join(_paragraph_text(p) for p in tx_body.iterfind(_A_NS + "p"))
+
+
+def _table_grid(tbl) -> List[List[Optional["Cell"]]]:
+    """a:tbl element -> tables.Cell grid; slots covered by a merged cell are None.
+
+    Reads the a:tbl XML directly (gridSpan/rowSpan/hMerge/vMerge) instead of going
+    through python-pptx cell proxies, which dominate the cost on table-heavy decks.
+    """
+    from thomas_utils.converters.tables import Cell
+
+    grid: List[List[Optional[Cell]]] = []
+    for tr in tbl.iterfind(_A_NS + "tr"):
+        cells: List[Optional[Cell]] = []
+        for tc in tr.iterfind(_A_NS + "tc"):
+            if tc.get("hMerge") in ("1", "true") or tc.get("vMerge") in ("1", "true"):
+                cells.append(None)
+            else:
+                cells.append(Cell(_tc_text(tc), int(tc.get("gridSpan", 1)), int(tc.get("rowSpan", 1))))
+        grid.append(cells)
+    return grid
+
+
+def _table_to_markdown(table, table_format: str = "markdown") -> str:
+    """Convert python-pptx table to a Markdown (or HTML, see tables.render) table string."""
+    from thomas_utils.converters.tables import render
+
+    return render(_table_grid(table._tbl), table_format)
+
+
+def _table_block(tbl, table_format: str = "markdown") -> ir.Table:
+    """a:tbl element -> IR table (rendered text plus cell texts)."""
+    from thomas_utils.converters.tables import render
+
+    grid = _table_grid(tbl)
+    return ir.Table(render(grid, table_format), [[c.text if c is not None else None for c in row] for row in grid])
 
 
 def _extract_omml_from_shape(shape) -> List[str]:
-    """Extract OMML (Office Math) XML from shape for LaTeX conversion. Returns list of LaTeX strings (empty if no math or converter missing)."""
-    try:
-        el = getattr(shape, "_element", None)
-        if el is None:
-            return []
-        # python-pptx uses lxml; namespace for Office Math
-        ns = "http://schemas.openxmlformats.org/officeDocument/2006/math"
-        omaths = el.findall(f".//{{{ns}}}oMath") if hasattr(el, "findall") else []
-        if not omaths:
-            return []
-        out: List[str] = []
-        for omath in omaths:
-            latex = _omml_to_latex(omath)
-            if latex:
-                out.append(latex)
-        return out
-    except Exception:
+    """Extract OMML (Office Math) from a shape as a list of LaTeX strings (empty if the shape has no math)."""
+    return _omml_latex(getattr(shape, "_element", None))
+
+
+def _omml_latex(el) -> List[str]:
+    """LaTeX for every m:oMath under a shape's lxml element (see _extract_omml_from_shape)."""
+    if el is None or not hasattr(el, "iter"):
         return []
+    out: List[str] = []
+    for omath in el.iter(f"{_M_NS}oMath"):
+        latex = _omml_to_latex(omath)
+        if latex:
+            out.append(latex)
+    return out
 
 
 def _omml_to_latex(omml_element) -> str:
-    """Convert one OMML element to LaTeX. Requires optional [pptx-math] extra; otherwise returns empty string."""
+    """Convert one m:oMath element to LaTeX with the built-in converter (see omml.py); "" on malformed math."""
+    from thomas_utils.converters import omml
+
     try:
-        from officemath2latex import convert as omml_convert
-        return (omml_convert(omml_element) or "").strip()
-    except ImportError:
-        pass
+        return omml.to_latex(omml_element)
     except Exception:
-        pass
-    return ""
+        return ""
 
 
-def _text_frame_to_structured_content(text_frame) -> str:
-    """Convert text_frame paragraphs to markdown (lists by level, code blocks, plain)."""
-    parts: List[str] = []
+def _paragraph_blocks(paragraphs: Iterable[Tuple[str, int]]) -> List[ir.Block]:
+    """(text, level) paragraphs -> IR blocks (list items by level, code blocks, plain paragraphs)."""
+    parts: List[ir.Block] = []
     current_code_lines: List[str] = []
     code_indicators = ("from ", "import ", "def ", "class ")
 
     def flush_code():
         nonlocal current_code_lines
         if current_code_lines:
-            block = "\n".join(current_code_lines)
-            parts.append("```\n" + block + "\n```")
+            parts.append(ir.Code("\n".join(current_code_lines)))
             current_code_lines = []
 
-    for para in text_frame.paragraphs:
-        text = (para.text or "").strip()
+    for raw, level in paragraphs:
+        text = raw.strip()
         if not text:
             flush_code()
             continue
-        level = getattr(para, "level", 0) or 0
         # 코드 유사: 앞쪽 공백 2칸 이상 또는 from/import/def/class 로 시작
         looks_like_code = (
             text.startswith("  ") or
@@ -208,13 +238,9 @@ def _text_frame_to_structured_content(text_frame) -> str:
             current_code_lines.append(text)
             continue
         flush_code()
-        if level > 0:
-            indent = "   " * level
-            parts.append(indent + "- " + text)
-        else:
-            parts.append(text)
+        parts.append(ir.ListItem(text, level) if level > 0 else ir.Paragraph(text))
     flush_code()
-    return "\n\n".join(p for p in parts if p.strip())
+    return parts
 
 
 def _structure_body_content(
@@ -238,12 +264,226 @@ def _structure_body_content(
     return "\n\n".join(segments).strip()
 
 
+_SLIDE_SEPARATOR = ir.SLIDE_SEPARATOR
+
+
+def _select_indices(selection: Optional[List[int]], count: int, what: str = "Slide") -> List[int]:
+    """Validated, sorted unique 0-based indices of the selection (all when None)."""
+    if selection is None:
+        return list(range(count))
+    out = sorted(set(selection))
+    bad = [i for i in out if i < 0 or i >= count]
+    if bad:
+        raise ValueError(f"{what} index out of range: {bad[0]} (document has {count})")
+    return out
+
+
+def _shape_elements(parent) -> Iterator[Any]:
+    """Shape child elements of parent, taking the mc:Choice branch of each mc:AlternateContent.
+
+    PowerPoint wraps shapes that need a newer reader (e.g. a14 equations) in
+    mc:AlternateContent with an mc:Fallback picture; the fallback is skipped.
+    """
+    for child in parent:
+        if child.tag == _MC_NS + "AlternateContent":
+            choice = child.find(_MC_NS + "Choice")
+            if choice is not None:
+                yield from _shape_elements(choice)
+        elif child.tag in _SHAPE_TAGS:
+            yield child
+
+
+def _slide_shapes(slide) -> List[Any]:
+    """slide.shapes, plus the shapes python-pptx skips inside mc:AlternateContent (see _shape_elements)."""
+    from pptx.shapes.shapetree import SlideShapeFactory
+
+    shapes = slide.shapes
+    return [SlideShapeFactory(el, shapes) for el in _shape_elements(shapes._spTree)]
+
+
+def _slide_to_ir(slide, slide_idx: int, slide_count: int, table_format: str = "markdown") -> ir.Slide:
+    """One python-pptx slide as an IR slide (Type, Layout, Title, Subtitle, content shapes)."""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+
+    from thomas_utils.converters.omml import has_math
+
+    # 수식이 없는 슬라이드(대부분)는 도형마다 수식을 찾지 않음
+    slide_has_math = has_math(slide._element)
+    slide_layout = getattr(slide, "slide_layout", None)
+    layout_name = getattr(slide_layout, "name", None) if slide_layout else None
+
+    title = None
+    subtitle = None
+
+    slide_shapes = _slide_shapes(slide)
+
+    # 1) Title/Subtitle from placeholders only
+    for shape in slide_shapes:
+        pph = _get_placeholder_type(shape)
+        if pph is None:
+            continue
+        if pph in (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE, getattr(PP_PLACEHOLDER, "VERTICAL_TITLE", None)):
+            if hasattr(shape, "text") and shape.text.strip():
+                title = shape.text.strip()
+        elif pph == PP_PLACEHOLDER.SUBTITLE:
+            if hasattr(shape, "text") and shape.text.strip():
+                subtitle = shape.text.strip()
+
+    # 2) Content shapes in visual order (Top, then Left)
+    content_shapes = [s for s in slide_shapes if _is_content_shape(s, title, subtitle)]
+    content_shapes.sort(key=_content_shape_sort_key)
+    content: List[List[ir.Block]] = []
+
+    for shape in content_shapes:
+        # Shape decomposition: table, picture, text_frame (수식은 별도 단계에서 처리)
+        if getattr(shape, "has_table", False) and shape.table:
+            with span("pptx.table"):
+                content.append([_table_block(shape.table._tbl, table_format)])
+            continue
+        if getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.PICTURE:
+            # 이미지 미포함 정책; --include-images 시 여기서 분기 가능
+            continue
+        if hasattr(shape, "text_frame") and shape.text_frame:
+            text = (shape.text_frame.text or "").strip()
+            if not text:
+                continue
+            if title and text == title or subtitle and text == subtitle:
+                continue
+            with span("pptx.text"):
+                blocks = _paragraph_blocks(
+                    (para.text or "", getattr(para, "level", 0) or 0) for para in shape.text_frame.paragraphs
+                )
+            if slide_has_math:
+                with span("pptx.omml"):
+                    blocks += [ir.Math(latex) for latex in _extract_omml_from_shape(shape)]
+            if blocks:
+                content.append(blocks)
+            continue
+        if hasattr(shape, "text") and shape.text.strip():
+            text = _strip_image_lines(shape.text.strip())
+            if text and text != title and text != subtitle:
+                content.append([ir.Paragraph(text)])
+
+    return _slide_ir(slide_idx, slide_count, layout_name, title, subtitle, content)
+
+
+def _slide_ir(
+    slide_idx: int,
+    slide_count: int,
+    layout_name: Optional[str],
+    title: Optional[str],
+    subtitle: Optional[str],
+    content: List[List[ir.Block]],
+) -> ir.Slide:
+    """IR slide with the Type / Layout header shared by the PPTX engines."""
+    return ir.Slide(
+        slide_idx,
+        slide_count,
+        _slide_type_from_layout_name(layout_name),
+        layout=layout_name,
+        layout_hint=_layout_hint_from_layout_name(layout_name),
+        title=title,
+        subtitle=subtitle,
+        shapes=content,
+    )
+
+
+def iter_slides(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    table_format: str = "markdown",
+) -> Iterator[Dict[str, Any]]:
+    """Convert PowerPoint to Markdown one slide at a time (python-pptx engine).
+
+    Only the selected slides are walked. Yields a dict per slide as soon as it is
+    rendered: "slide" (0-based index), "slide_count" (slides in the deck),
+    "index"/"total" (position within the selection) and "text" (the ## Slide N
+    block). convert() joins these blocks with "---" separators.
+
+    Args:
+        pptx_path: Path to the PPTX file.
+        slides: Optional 0-based slide indices. None means all slides.
+        table_format: "markdown" (GFM), "html", or "auto" (HTML only for tables with merged cells).
+    """
+    return _slide_chunks(_iter_units(pptx_path, slides, table_format), slides)
+
+
+def _slide_chunks(units: Iterator[ir.Slide], slides: Optional[List[int]]) -> Iterator[Dict[str, Any]]:
+    """iter_slides() chunk dicts for a stream of IR slides."""
+    total = 0
+    for i, unit in enumerate(units):
+        if i == 0:
+            total = len(_select_indices(slides, unit.count))
+        yield {
+            "slide": unit.index,
+            "slide_count": unit.count,
+            "index": i,
+            "total": total,
+            "text": unit.markdown(),
+        }
+
+
+def iter_units(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    table_format: str = "markdown",
+    engine: str = "python-pptx",
+) -> Iterator[ir.Slide]:
+    """Convert PowerPoint to IR slides (see ir module), one at a time.
+
+    Args:
+        pptx_path: Path to the PPTX file.
+        slides: Optional 0-based slide indices. None means all slides.
+        table_format: Table rendering, as in convert().
+        engine: "python-pptx" (default), "fast" or "unstructured".
+    """
+    if engine == "fast":
+        from thomas_utils.converters.pptx_fast_impl import iter_units as _iter
+    elif engine == "unstructured":
+        from thomas_utils.converters.pptx_unstructured_impl import iter_units as _iter
+
+        return _iter(pptx_path, slides)
+    else:
+        _iter = _iter_units
+    return _iter(pptx_path, slides, table_format)
+
+
+def _iter_units(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    table_format: str = "markdown",
+) -> Iterator[ir.Slide]:
+    path = Path(pptx_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PPTX not found: {path}")
+    if not path.suffix.lower() == ".pptx":
+        raise ValueError(f"Expected .pptx file, got: {path}")
+
+    with span("pptx.import"):
+        pptx = _pptx()
+    with span("pptx.open"):
+        prs = pptx.Presentation(str(path))
+    all_slides = prs.slides
+    for slide_idx in _select_indices(slides, len(all_slides)):
+        with span("pptx.slide"):
+            unit = _slide_to_ir(all_slides[slide_idx], slide_idx, len(all_slides), table_format)
+        yield unit
+
+
 def convert(
     pptx_path: Union[str, Path],
     slides: Optional[List[int]] = None,
     use_llm: bool = False,
     engine: str = "python-pptx",
     use_llm_multimodal: bool = False,
+    cache: Optional["ConversionCache"] = None,
+    llm_concurrency: int = 4,
+    llm_rate: Optional[float] = None,
+    llm_cache: Optional["LLMCache"] = None,
+    image_options: Optional["ImageOptions"] = None,
+    table_format: str = "markdown",
+    manifest: Optional["SlideManifest"] = None,
+    pdf_cache_dir: Optional[Union[str, Path]] = None,
 ) -> str:
     """Convert PowerPoint to structured Markdown.
 
@@ -252,123 +492,115 @@ def convert(
 
     Args:
         pptx_path: Path to the PPTX file.
-        slides: Ignored (always converts all slides for now).
+        slides: Optional 0-based slide indices. None means all slides.
         use_llm: If True, run optional LLM polish on the result (requires pptx-llm extra).
-        engine: "python-pptx" (default) or "unstructured" (requires [unstructured] extra).
+        engine: "python-pptx" (default), "fast" (same output, reads the slide XML directly
+                from the zip; also includes text inside group shapes) or "unstructured"
+                (requires [unstructured] extra).
         use_llm_multimodal: If True, render each slide to image and convert via vision LLM (GPT-4o).
+        cache: Optional ConversionCache; a hit skips the conversion (and any LLM calls) entirely.
+        llm_concurrency: Maximum simultaneous LLM requests (lowered automatically on 429/5xx).
+        llm_rate: Optional cap on LLM requests per second.
+        llm_cache: Optional LLMCache for polish / vision responses (see llm_cache module).
+        image_options: Optional ImageOptions for the multimodal slide images
+                       (resolution, format, quality, grayscale, autocrop). None = PNG at 72 dpi.
+        table_format: python-pptx / fast engine tables as "markdown" (GFM, merged cells written
+                      once), "html" (colspan/rowspan), or "auto" (HTML only when merged).
+        manifest: Optional SlideManifest of an earlier version of this deck; only slides
+                  whose content changed are re-extracted, re-rendered and sent to the LLM
+                  (python-pptx / fast engines and multimodal; see pptx_incremental).
+        pdf_cache_dir: Optional directory in which the multimodal path keeps LibreOffice's PDF
+                       of the deck, keyed by content hash (soffice_pool.cached_pdf). None
+                       converts into a temporary directory every time.
 
     Returns:
         UTF-8 Markdown string.
     """
+    if cache is not None:
+        if not Path(pptx_path).exists():
+            raise FileNotFoundError(f"PPTX not found: {pptx_path}")
+        options: Dict[str, Any] = {"use_llm": use_llm}
+        if use_llm_multimodal and image_options is not None:
+            options["image_options"] = repr(image_options)
+        if table_format != "markdown":
+            options["table_format"] = table_format
+        key = cache.key(pptx_path, "multimodal" if use_llm_multimodal else engine, slides, options)
+        with span("cache.get"):
+            result = cache.get(key)
+        if result is None:
+            result = convert(
+                pptx_path,
+                slides,
+                use_llm,
+                engine,
+                use_llm_multimodal,
+                llm_concurrency=llm_concurrency,
+                llm_rate=llm_rate,
+                llm_cache=llm_cache,
+                image_options=image_options,
+                table_format=table_format,
+                manifest=manifest,
+                pdf_cache_dir=pdf_cache_dir,
+            )
+            cache.put(key, result)
+        return result
+    if manifest is not None:
+        from thomas_utils.converters.pptx_incremental import convert as convert_incremental
+
+        return convert_incremental(
+            pptx_path,
+            manifest,
+            slides=slides,
+            use_llm=use_llm,
+            engine=engine,
+            use_llm_multimodal=use_llm_multimodal,
+            llm_concurrency=llm_concurrency,
+            llm_rate=llm_rate,
+            llm_cache=llm_cache,
+            image_options=image_options,
+            table_format=table_format,
+            pdf_cache_dir=pdf_cache_dir,
+        )
     if use_llm_multimodal:
-        return _convert_pptx_multimodal(pptx_path, use_llm=use_llm)
+        return _convert_pptx_multimodal(
+            pptx_path,
+            use_llm=use_llm,
+            slides=slides,
+            llm_concurrency=llm_concurrency,
+            llm_rate=llm_rate,
+            llm_cache=llm_cache,
+            image_options=image_options,
+            pdf_cache_dir=pdf_cache_dir,
+        )
+    doc = ir.Document(Path(pptx_path).name, iter_units(pptx_path, slides, table_format, engine))
     if engine == "unstructured":
-        from thomas_utils.converters.pptx_unstructured_impl import convert_unstructured
-        result = convert_unstructured(pptx_path)
-        if use_llm:
-            result = _llm_polish(result)
-        return result
-    path = Path(pptx_path)
-    if not path.exists():
-        raise FileNotFoundError(f"PPTX not found: {path}")
-    if not path.suffix.lower() == ".pptx":
-        raise ValueError(f"Expected .pptx file, got: {path}")
-
-    prs = Presentation(str(path))
-    md_parts: List[str] = []
-
-    for slide_idx, slide in enumerate(prs.slides):
-        slide_layout = getattr(slide, "slide_layout", None)
-        layout_name = getattr(slide_layout, "name", None) if slide_layout else None
-        slide_type = _slide_type_from_layout_name(layout_name)
-        layout_hint = _layout_hint_from_layout_name(layout_name)
-
-        title = None
-        subtitle = None
-
-        # 1) Title/Subtitle from placeholders only
-        for shape in slide.shapes:
-            pph = _get_placeholder_type(shape)
-            if pph is None:
-                continue
-            if pph in (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE, getattr(PP_PLACEHOLDER, "VERTICAL_TITLE", None)):
-                if hasattr(shape, "text") and shape.text.strip():
-                    title = shape.text.strip()
-            elif pph == PP_PLACEHOLDER.SUBTITLE:
-                if hasattr(shape, "text") and shape.text.strip():
-                    subtitle = shape.text.strip()
-
-        # 2) Content shapes in visual order (Top, then Left)
-        content_shapes = [s for s in slide.shapes if _is_content_shape(s, title, subtitle)]
-        content_shapes.sort(key=_content_shape_sort_key)
-        content_segments: List[str] = []
-
-        for shape in content_shapes:
-            # Shape decomposition: table, picture, text_frame (수식은 별도 단계에서 처리)
-            if getattr(shape, "has_table", False) and shape.table:
-                content_segments.append(_table_to_markdown(shape.table))
-                continue
-            if getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.PICTURE:
-                # 이미지 미포함 정책; --include-images 시 여기서 분기 가능
-                continue
-            if hasattr(shape, "text_frame") and shape.text_frame:
-                text = (shape.text_frame.text or "").strip()
-                if not text:
-                    continue
-                if title and text == title or subtitle and text == subtitle:
-                    continue
-                structured = _text_frame_to_structured_content(shape.text_frame)
-                omml_latex = _extract_omml_from_shape(shape)
-                if omml_latex:
-                    structured = (structured or "") + "\n\n" + "\n\n".join(f"$${l}$$" for l in omml_latex)
-                if structured:
-                    content_segments.append(structured)
-                continue
-            if hasattr(shape, "text") and shape.text.strip():
-                text = _strip_image_lines(shape.text.strip())
-                if text and text != title and text != subtitle:
-                    content_segments.append(text)
-
-        content_block = "\n\n".join(
-            _strip_image_lines(s).strip() for s in content_segments if s.strip()
-        ).strip()
-
-        # Build slide block per plan template
-        block_lines = [
-            f"## Slide {slide_idx + 1}",
-            f"**Type**: {slide_type}",
-        ]
-        if layout_hint:
-            block_lines.append(f"**Layout**: {layout_hint}")
-        if title:
-            block_lines.append(f"**Title**: {title}")
-        if subtitle:
-            block_lines.append(f"**Subtitle**: {subtitle}")
-        block_lines.append("")
-        if content_block:
-            block_lines.append("### Content")
-            block_lines.append("")
-            block_lines.append(content_block)
-        else:
-            block_lines.append("### Content")
-            block_lines.append("")
-
-        md_parts.append("\n".join(block_lines))
-        if slide_idx < len(prs.slides) - 1:
-            md_parts.append("\n---\n\n")
-
-    result = "\n".join(md_parts)
-    result = _IMAGE_LINE_PATTERN.sub("", result)
-    result = re.sub(r"\n{3,}", "\n\n", result).strip()
-    result = result + "\n" if result else result
+        with span("pptx.unstructured"):
+            result = ir.to_markdown(doc)
+    else:
+        result = ir.to_markdown(doc)
 
     if use_llm:
-        result = _llm_polish(result)
+        with span("llm.polish"):
+            result = _llm_polish(result, llm_concurrency, llm_rate, llm_cache)
     return result
 
 
-def _render_pptx_slides_to_images(pptx_path: Union[str, Path]) -> List[bytes]:
-    """Render each PPTX slide to PNG image bytes. Tries Windows PowerPoint COM, then LibreOffice + PyMuPDF."""
+def _render_pptx_slides_to_images(
+    pptx_path: Union[str, Path],
+    image_options: Optional["ImageOptions"] = None,
+    slides: Optional[List[int]] = None,
+    pdf_cache_dir: Optional[Union[str, Path]] = None,
+) -> Dict[int, bytes]:
+    """Render PPTX slides to image bytes. Tries Windows PowerPoint COM, then LibreOffice + PyMuPDF.
+
+    Only the selected slides (all when slides is None) are rendered; the result maps
+    slide index to image bytes in selection order. Images are PNG at the default
+    resolution unless image_options says otherwise. With pdf_cache_dir the LibreOffice
+    PDF is cached there by the deck's content hash (soffice_pool.cached_pdf); its pages
+    are rendered in parallel.
+    """
+    from thomas_utils.converters.slide_images import reencode, render_pdf_pages
+
     path = Path(pptx_path).resolve()
     if not path.exists():
         raise FileNotFoundError(f"PPTX not found: {path}")
@@ -382,28 +614,31 @@ def _render_pptx_slides_to_images(pptx_path: Union[str, Path]) -> List[bytes]:
         app = win32com.client.Dispatch("PowerPoint.Application")
         path_str = os.path.normpath(str(path))
         prs = app.Presentations.Open(path_str, WithWindow=False)
-        n = prs.Slides.Count
-        out: List[bytes] = []
-        with tempfile.TemporaryDirectory() as tmp:
-            for i in range(1, n + 1):
-                png_path = Path(tmp) / f"slide_{i}.png"
-                prs.Slides(i).Export(str(png_path), "PNG")
-                out.append(png_path.read_bytes())
+        selected = _select_indices(slides, prs.Slides.Count)
+        out: Dict[int, bytes] = {}
+        with tempfile.TemporaryDirectory() as tmp, span("pptx.com_export"):
+            for i in selected:
+                png_path = Path(tmp) / f"slide_{i + 1}.png"
+                prs.Slides(i + 1).Export(str(png_path), "PNG")
+                out[i] = reencode(png_path.read_bytes(), image_options)
         prs.Close()
         app.Quit()
         return out
     except ModuleNotFoundError as _e:
-        raise RuntimeError(
-            "멀티모달(슬라이드 이미지)을 쓰려면 Windows에서 pywin32가 필요합니다: pip install pywin32. "
-            "PowerPoint가 설치되어 있어야 합니다."
-        ) from _e
+        if sys.platform == "win32":
+            raise RuntimeError(
+                "멀티모달(슬라이드 이미지)을 쓰려면 Windows에서 pywin32가 필요합니다: pip install pywin32. "
+                "PowerPoint가 설치되어 있어야 합니다."
+            ) from _e
+    except ValueError:
+        raise
     except Exception as _e:
         sys.stderr.write(
             f"PowerPoint COM 실패 ({type(_e).__name__}: {_e}), LibreOffice 경로로 시도합니다.\n"
         )
         pass
 
-    # 2) Fallback: LibreOffice -> PDF, then PyMuPDF -> PNG per page
+    # 2) Fallback: LibreOffice -> PDF (cached), then PyMuPDF -> image per selected page
     try:
         import fitz
     except ImportError:
@@ -413,58 +648,32 @@ def _render_pptx_slides_to_images(pptx_path: Union[str, Path]) -> List[bytes]:
             "Slide-to-image requires either: (1) Windows + PowerPoint + pywin32, or "
             "(2) LibreOffice (soffice) in PATH + PyMuPDF. Install: pip install pywin32 (Windows) or pymupdf, and ensure LibreOffice is installed."
         )
+    from thomas_utils.converters.soffice_pool import cached_pdf, get_pool
+
+    def render(pdf_path: Path) -> Dict[int, bytes]:
+        with fitz.open(pdf_path) as doc:
+            selected = _select_indices(slides, doc.page_count)
+        return render_pdf_pages(pdf_path, selected, image_options)
+
     with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to", "pdf",
-                    "--outdir", str(tmp_path),
-                    str(path),
-                ],
-                capture_output=True,
-                timeout=120,
-            )
-        except FileNotFoundError as _e2:
-            raise FileNotFoundError(
-                "soffice (LibreOffice)를 PATH에서 찾을 수 없습니다. "
-                "Windows에서는 PowerPoint를 쓰려면: pip install pywin32 를 설치하고 PowerPoint가 설치되어 있어야 합니다. "
-                "또는 LibreOffice를 설치한 뒤 'soffice'가 PATH에 있도록 하세요."
-            ) from _e2
-        except Exception as _e2:
-            raise
-        if result.returncode != 0:
-            raise RuntimeError(
-                "LibreOffice conversion failed. Install LibreOffice and ensure 'soffice' is in PATH."
-            )
-        pdf_path = tmp_path / (path.stem + ".pdf")
-        if not pdf_path.exists():
-            raise RuntimeError("LibreOffice did not produce PDF.")
-        doc = fitz.open(pdf_path)
-        out = []
-        for page in doc:
-            pix = page.get_pixmap(alpha=False)
-            out.append(pix.tobytes("png"))
-        doc.close()
-        return out
+        if pdf_cache_dir is not None:
+            # 공유 캐시의 PDF는 다른 프로세스가 내보낼 수 있으므로 tmp에 링크한 것을 렌더링
+            return render(cached_pdf(path, pdf_cache_dir, out_dir=tmp))
+        return render(get_pool().convert_to_pdf(path, tmp))
 
 
-def _llm_slide_image_to_md(image_bytes: bytes, slide_index: int) -> str:
-    """Convert a single slide image to markdown via multimodal LLM (GPT-4o). Uses OPENAI_API_KEY from .env."""
-    try:
-        import os
-        from dotenv import load_dotenv
-        load_dotenv()
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            return f"## Slide {slide_index + 1}\n**Type**: Content Slide\n\n### Content\n\n<!-- OPENAI_API_KEY not set -->\n\n"
-        import openai
-    except ImportError:
-        return f"## Slide {slide_index + 1}\n**Type**: Content Slide\n\n### Content\n\n<!-- openai or python-dotenv not installed -->\n\n"
-    b64 = base64.b64encode(image_bytes).decode("ascii")
-    prompt = (
+def _empty_slide_md(slide_index: int, note: str = "") -> str:
+    """Fallback slide block when the vision LLM cannot be used or fails."""
+    comment = f"<!-- {note} -->" if note else ""
+    return f"## Slide {slide_index + 1}\n**Type**: Content Slide\n\n### Content\n\n{comment}\n\n"
+
+
+_VISION_MODEL = "gpt-4o"
+_POLISH_MODEL = "gpt-4o-mini"
+
+
+def _slide_prompt(slide_index: int) -> str:
+    return (
         "이 슬라이드 이미지를 마크다운으로 변환해줘. 다음 형식만 사용하고 마크다운만 출력해.\n\n"
         f"## Slide {slide_index + 1}\n"
         "**Type**: (Title Slide | Content Slide | Section Divider 중 하나)\n"
@@ -473,78 +682,269 @@ def _llm_slide_image_to_md(image_bytes: bytes, slide_index: int) -> str:
         "### Content\n"
         "(본문: 표는 마크다운 테이블, 리스트는 -, 코드는 ``` 블록으로)"
     )
-    client = getattr(openai, "OpenAI", None)
-    if not client:
-        return f"## Slide {slide_index + 1}\n**Type**: Content Slide\n\n### Content\n\n\n\n"
-    try:
-        c = client(api_key=api_key)
-        r = c.chat.completions.create(
-            model="gpt-4o",
+
+
+def _slide_image_request(
+    client,
+    image_bytes: bytes,
+    slide_index: int,
+    llm_cache: Optional["LLMCache"] = None,
+) -> str:
+    """One vision LLM request for a slide image. Raises on API errors (callers retry).
+
+    Successful answers are stored in llm_cache; lookups happen before scheduling.
+    """
+    from thomas_utils.converters.slide_images import image_mime
+
+    b64 = base64.b64encode(image_bytes).decode("ascii")
+    prompt = _slide_prompt(slide_index)
+    with span("llm.vision_request"):
+        r = client.chat.completions.create(
+            model=_VISION_MODEL,
             messages=[
                 {
                     "role": "user",
                     "content": [
                         {"type": "text", "text": prompt},
-                        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}},
+                        {"type": "image_url", "image_url": {"url": f"data:{image_mime(image_bytes)};base64,{b64}"}},
                     ],
                 }
             ],
             max_tokens=4096,
         )
-        if r.choices and r.choices[0].message.content:
-            return r.choices[0].message.content.strip() + "\n"
+    if r.choices and r.choices[0].message.content:
+        md = r.choices[0].message.content.strip() + "\n"
+        if llm_cache is not None:
+            llm_cache.put(llm_cache.key(_VISION_MODEL, prompt, image_bytes), md)
+        return md
+    return _empty_slide_md(slide_index)
+
+
+def _llm_slide_image_to_md(
+    image_bytes: bytes,
+    slide_index: int,
+    llm_cache: Optional["LLMCache"] = None,
+) -> str:
+    """Convert a single slide image to markdown via multimodal LLM (GPT-4o). Uses OPENAI_API_KEY from .env."""
+    from thomas_utils.converters.llm_client import call_with_retry, openai_client
+
+    if llm_cache is not None:
+        hit = llm_cache.get(llm_cache.key(_VISION_MODEL, _slide_prompt(slide_index), image_bytes))
+        if hit is not None:
+            return hit
+    client, reason = openai_client()
+    if client is None:
+        return _empty_slide_md(slide_index, reason)
+    try:
+        return call_with_retry(lambda: _slide_image_request(client, image_bytes, slide_index, llm_cache))
     except Exception:
-        pass
-    return f"## Slide {slide_index + 1}\n**Type**: Content Slide\n\n### Content\n\n\n\n"
+        return _empty_slide_md(slide_index)
 
 
 def _convert_pptx_multimodal(
     pptx_path: Union[str, Path],
     use_llm: bool = False,
+    slides: Optional[List[int]] = None,
+    llm_concurrency: int = 4,
+    llm_rate: Optional[float] = None,
+    llm_cache: Optional["LLMCache"] = None,
+    image_options: Optional["ImageOptions"] = None,
+    pdf_cache_dir: Optional[Union[str, Path]] = None,
 ) -> str:
-    """Convert PPTX to Markdown by rendering each slide to image and calling vision LLM (GPT-4o)."""
-    images = _render_pptx_slides_to_images(pptx_path)
+    """Convert PPTX to Markdown by rendering each slide to image and calling vision LLM (GPT-4o).
+
+    Slide requests run concurrently (up to llm_concurrency, optionally capped at
+    llm_rate requests/s) and are stitched back together in slide order. Slides
+    answered from llm_cache make no request at all.
+    """
+    answers = _multimodal_slide_mds(
+        pptx_path, slides, llm_concurrency, llm_rate, llm_cache, image_options, pdf_cache_dir
+    )
+    result = _join_multimodal(list(answers.values()))
+    if use_llm:
+        with span("llm.polish"):
+            result = _llm_polish(result, llm_concurrency, llm_rate, llm_cache)
+    return result
+
+
+def _multimodal_slide_mds(
+    pptx_path: Union[str, Path],
+    slides: Optional[List[int]] = None,
+    llm_concurrency: int = 4,
+    llm_rate: Optional[float] = None,
+    llm_cache: Optional["LLMCache"] = None,
+    image_options: Optional["ImageOptions"] = None,
+    pdf_cache_dir: Optional[Union[str, Path]] = None,
+) -> Dict[int, str]:
+    """Vision LLM Markdown per selected slide, {slide index: answer} in selection order."""
+    from thomas_utils.converters.llm_client import map_concurrent, openai_client
+
+    with span("pptx.render_images"):
+        images = _render_pptx_slides_to_images(pptx_path, image_options, slides, pdf_cache_dir)
+    selected = list(images)
+    answers = {}
+    if llm_cache is not None:
+        for i in selected:
+            hit = llm_cache.get(llm_cache.key(_VISION_MODEL, _slide_prompt(i), images[i]))
+            if hit is not None:
+                answers[i] = hit
+    missing = [i for i in selected if i not in answers]
+    if missing:
+        client, reason = openai_client()
+        if client is None:
+            fresh = [_empty_slide_md(i, reason) for i in missing]
+        else:
+            fresh = map_concurrent(
+                lambda i: _slide_image_request(client, images[i], i, llm_cache),
+                missing,
+                concurrency=llm_concurrency,
+                rate=llm_rate,
+                on_error=lambda i, e: _empty_slide_md(i),
+            )
+        answers.update(zip(missing, fresh))
+    return {i: answers[i] for i in selected}
+
+
+def _join_multimodal(slide_mds: List[str]) -> str:
+    """Join per-slide vision answers with --- separators into the final document."""
     md_parts: List[str] = []
-    for i, img_bytes in enumerate(images):
-        md_parts.append(_llm_slide_image_to_md(img_bytes, i))
-        if i < len(images) - 1:
+    for n, slide_md in enumerate(slide_mds):
+        md_parts.append(slide_md)
+        if n < len(slide_mds) - 1:
             md_parts.append("\n---\n\n")
-    result = "\n".join(md_parts)
-    result = re.sub(r"\n{3,}", "\n\n", result).strip()
-    result = result + "\n" if result else result
-    if use_llm:
-        result = _llm_polish(result)
+    with span("pptx.finalize"):
+        result = "\n".join(md_parts)
+        result = re.sub(r"\n{3,}", "\n\n", result).strip()
+        result = result + "\n" if result else result
     return result
 
 
-def _llm_polish(md: str) -> str:
-    """Optional LLM polish: naturalize wording, add code block language, etc. Uses OPENAI_API_KEY from .env."""
-    try:
-        import os
-        from dotenv import load_dotenv
-        load_dotenv()
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            return md
-        import openai
-    except ImportError:
-        return md
-    client = getattr(openai, "OpenAI", None)
-    if not client:
-        return md
-    try:
-        c = client(api_key=api_key)
-        r = c.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": "아래는 PPT에서 추출한 마크다운이다. 슬라이드 재구성에 쓸 수 있도록, 형식(## Slide, Type, Layout, Title, Subtitle, Content)은 유지한 채로 문장만 자연스럽게 다듬고, 표 제목·코드블록 언어는 필요 시 보완해라. 마크다운만 출력해라.\n\n" + md,
-                }
-            ],
+# LLM 보정 요청 하나에 묶을 최대 문자 수 (슬라이드 경계에서만 자름)
+_POLISH_CHUNK_CHARS = 6000
+_SLIDE_HEADING_PATTERN = re.compile(r"^## Slide \d+", re.MULTILINE)
+_CODE_FENCE_PATTERN = re.compile(r"^```.*?^```[ \t]*$", re.MULTILINE | re.DOTALL)
+_POLISH_PROMPT = (
+    "아래는 PPT에서 추출한 마크다운이다. 슬라이드 재구성에 쓸 수 있도록, "
+    "형식(## Slide, Type, Layout, Title, Subtitle, Content)은 유지한 채로 문장만 자연스럽게 다듬고, "
+    "표 제목·코드블록 언어는 필요 시 보완해라. 마크다운만 출력해라.\n\n"
+)
+
+
+def _split_slide_blocks(md: str) -> List[str]:
+    """Split converted Markdown on ## Slide N headings, dropping the --- separators."""
+    starts = [m.start() for m in _SLIDE_HEADING_PATTERN.finditer(md)]
+    if not starts:
+        return [md.strip()] if md.strip() else []
+    bounds = ([0] if starts[0] > 0 else []) + starts + [len(md)]
+    blocks: List[str] = []
+    for a, b in zip(bounds, bounds[1:]):
+        block = md[a:b].strip()
+        if block.endswith("\n---"):
+            block = block[: -len("\n---")].rstrip()
+        elif block == "---":
+            continue
+        blocks.append(block)
+    return blocks
+
+
+def _needs_polish(block: str) -> bool:
+    """False for slides the LLM would not change: no content, or only tables / code blocks."""
+    if not _SLIDE_HEADING_PATTERN.match(block):
+        return False
+    _, sep, content = block.partition("### Content")
+    if not sep:
+        return False
+    content = _CODE_FENCE_PATTERN.sub("", content)
+    prose = [ln for ln in content.splitlines() if ln.strip() and not ln.lstrip().startswith("|")]
+    return bool(prose)
+
+
+def _polish_groups(blocks: List[str], max_chars: Optional[int] = None) -> List[List[int]]:
+    """Group indices of consecutive polishable blocks into chunks of at most max_chars."""
+    max_chars = max_chars or _POLISH_CHUNK_CHARS
+    groups: List[List[int]] = []
+    current: List[int] = []
+    size = 0
+    for i, block in enumerate(blocks):
+        if not _needs_polish(block):
+            if current:
+                groups.append(current)
+                current, size = [], 0
+            continue
+        if current and size + len(block) > max_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(i)
+        size += len(block)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _polish_request(client, md: str, llm_cache: Optional["LLMCache"] = None) -> str:
+    """One polish request. Raises on API errors (callers retry)."""
+    prompt = _POLISH_PROMPT + md
+    with span("llm.polish_request"):
+        r = client.chat.completions.create(
+            model=_POLISH_MODEL,
+            messages=[{"role": "user", "content": prompt}],
         )
-        if r.choices and r.choices[0].message.content:
-            return r.choices[0].message.content.strip() + "\n"
-    except Exception:
-        pass
-    return md
+    if r.choices and r.choices[0].message.content:
+        text = r.choices[0].message.content.strip()
+        if llm_cache is not None:
+            llm_cache.put(llm_cache.key(_POLISH_MODEL, prompt), text)
+        return text
+    raise ValueError("empty LLM response")
+
+
+def _llm_polish(
+    md: str,
+    llm_concurrency: int = 4,
+    llm_rate: Optional[float] = None,
+    llm_cache: Optional["LLMCache"] = None,
+) -> str:
+    """Optional LLM polish: naturalize wording, add code block language, etc. Uses OPENAI_API_KEY from .env.
+
+    The document is split on ## Slide N boundaries; slides without prose are left
+    as is, the rest are polished in size-capped chunks concurrently. A chunk whose
+    request fails (or whose answer does not keep its slide count) keeps its original text.
+    Chunks found in llm_cache are not sent.
+    """
+    from thomas_utils.converters.llm_client import map_concurrent, openai_client
+
+    blocks = _split_slide_blocks(md)
+    groups = _polish_groups(blocks)
+    if not groups:
+        return md
+    sep = _SLIDE_SEPARATOR
+    chunks = [sep.join(blocks[i] for i in g) for g in groups]
+    answers = {}
+    if llm_cache is not None:
+        for n, chunk in enumerate(chunks):
+            hit = llm_cache.get(llm_cache.key(_POLISH_MODEL, _POLISH_PROMPT + chunk))
+            if hit is not None:
+                answers[n] = hit
+    missing = [n for n in range(len(chunks)) if n not in answers]
+    if missing:
+        client, _ = openai_client()
+        if client is None and not answers:
+            return md
+        if client is not None:
+            fresh = map_concurrent(
+                lambda n: _polish_request(client, chunks[n], llm_cache),
+                missing,
+                concurrency=llm_concurrency,
+                rate=llm_rate,
+                on_error=lambda n, e: None,
+            )
+            answers.update(zip(missing, fresh))
+    polished = [answers.get(n) for n in range(len(groups))]
+    for group, text in zip(groups, polished):
+        if text is None:
+            continue
+        new_blocks = _split_slide_blocks(text)
+        if len(new_blocks) != len(group):
+            continue
+        for i, block in zip(group, new_blocks):
+            blocks[i] = block
+    return sep.join(blocks) + "\n"
@@ -0,0 +1,260 @@
+"""Incremental PowerPoint -> Markdown: re-convert only the slides that changed.
+
+Every slide is fingerprinted straight from the .pptx zip: its XML part plus every
+part it references (layout, master, theme, images, charts, embedded objects; not
+speaker notes), hashed together with the relationship ids that tie them to the
+slide. A per-deck SlideManifest maps fingerprints to rendered slide blocks, so a
+new version of the deck only extracts, renders or sends to the LLM the slides
+whose fingerprint is not in the manifest. Reused blocks are renumbered when
+slides moved, and the blocks are spliced back together in slide order.
+
+Without use_llm the result is identical to a full pptx_impl.convert(). With
+use_llm, changed slides are polished among themselves, so chunking (and hence
+the LLM's wording) can differ from a full run.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from thomas_utils.profiling import span
+
+if TYPE_CHECKING:
+    from thomas_utils.converters.llm_cache import LLMCache
+    from thomas_utils.converters.slide_images import ImageOptions
+
+_MANIFEST_VERSION = 1
+# 슬라이드 지문에 넣지 않는 관계: 노트, 다른 슬라이드로의 링크
+_SKIP_RELS = ("notesSlide", "slide")
+
+
+def _part_digest(zf: zipfile.ZipFile, part: str) -> bytes:
+    h = hashlib.sha256()
+    with zf.open(part) as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+
+def slide_fingerprints(pptx_path: Union[str, Path]) -> List[str]:
+    """SHA-256 fingerprint per slide (presentation order) of the slide and the parts it references.
+
+    A slide master's links to all of its layouts are not followed, so editing one
+    layout only changes the fingerprints of the slides that use it. Shared parts
+    (masters, themes, media) are read once.
+    """
+    from thomas_utils.converters.pptx_fast_impl import _Package
+
+    path = Path(pptx_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PPTX not found: {path}")
+    digests: Dict[str, bytes] = {}
+    with zipfile.ZipFile(path) as zf:
+        pkg = _Package(zf)
+
+        # 파트 이름(slide3.xml, image2.png 등)은 슬라이드를 끼워 넣으면 바뀌므로 내용만 해시
+        def add(h: Any, part: str, seen: set) -> None:
+            seen.add(part)
+            digest = digests.get(part)
+            if digest is None:
+                digest = digests[part] = _part_digest(zf, part)
+            h.update(digest)
+            for rid, (typ, target) in sorted(pkg.rels(part).items()):
+                if typ in _SKIP_RELS or (typ == "slideLayout" and "slideMasters/" in part):
+                    continue
+                h.update(f"{rid} {typ}\n".encode("utf-8"))
+                if target in seen:
+                    h.update(digests[target])
+                elif target in zf.NameToInfo:
+                    add(h, target, seen)
+
+        out = []
+        for part in pkg.slide_parts():
+            h = hashlib.sha256()
+            add(h, part, set())
+            out.append(h.hexdigest())
+    return out
+
+
+class SlideManifest:
+    """Per-deck JSON store of rendered slide blocks keyed by slide fingerprint.
+
+    Pass it to pptx_impl.convert(manifest=...). One manifest belongs to one deck
+    (and its successive versions); entries made with different conversion options
+    are discarded. After a conversion, `reused` and `converted` count the slides
+    taken from the manifest and the slides converted anew.
+
+    Args:
+        path: JSON file (created on first save).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.reused = 0
+        self.converted = 0
+
+    def load(self, variant: Dict[str, Any]) -> Dict[str, str]:
+        """Stored {fingerprint: block} for these conversion options ({} if none or unreadable)."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get("version") != _MANIFEST_VERSION or data.get("variant") != variant:
+            return {}
+        return dict(data.get("slides") or {})
+
+    def save(self, variant: Dict[str, Any], blocks: Dict[str, str]) -> None:
+        """Replace the manifest atomically with blocks for these options."""
+        data = json.dumps(
+            {"version": _MANIFEST_VERSION, "variant": variant, "slides": blocks},
+            ensure_ascii=False,
+            indent=1,
+        ).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _variant(
+    engine: str,
+    use_llm: bool,
+    use_llm_multimodal: bool,
+    image_options: Optional["ImageOptions"],
+    table_format: str,
+) -> Dict[str, Any]:
+    """Conversion options a stored block depends on."""
+    from thomas_utils import __version__
+    from thomas_utils.converters import pptx_impl
+
+    variant: Dict[str, Any] = {
+        "version": __version__,
+        "engine": "multimodal" if use_llm_multimodal else engine,
+        "table_format": table_format,
+    }
+    if use_llm_multimodal:
+        variant["model"] = pptx_impl._VISION_MODEL
+        variant["image_options"] = repr(image_options) if image_options is not None else None
+    if use_llm:
+        variant["polish_model"] = pptx_impl._POLISH_MODEL
+    return variant
+
+
+def _renumber(block: str, slide_idx: int) -> str:
+    from thomas_utils.converters.pptx_impl import _SLIDE_HEADING_PATTERN
+
+    return _SLIDE_HEADING_PATTERN.sub(f"## Slide {slide_idx + 1}", block, count=1)
+
+
+def convert(
+    pptx_path: Union[str, Path],
+    manifest: SlideManifest,
+    slides: Optional[List[int]] = None,
+    use_llm: bool = False,
+    engine: str = "python-pptx",
+    use_llm_multimodal: bool = False,
+    llm_concurrency: int = 4,
+    llm_rate: Optional[float] = None,
+    llm_cache: Optional["LLMCache"] = None,
+    image_options: Optional["ImageOptions"] = None,
+    table_format: str = "markdown",
+    pdf_cache_dir: Optional[Union[str, Path]] = None,
+) -> str:
+    """pptx_impl.convert() that reuses unchanged slides from manifest (see module docstring).
+
+    Supports the python-pptx and fast engines and the multimodal path. The manifest
+    is updated with the new blocks and pruned to the slides of the current deck.
+    """
+    from thomas_utils.converters import pptx_impl
+
+    path = Path(pptx_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PPTX not found: {path}")
+    if path.suffix.lower() != ".pptx":
+        raise ValueError(f"Expected .pptx file, got: {path}")
+    if not use_llm_multimodal and engine not in ("python-pptx", "fast"):
+        raise ValueError(f"Incremental conversion supports the python-pptx and fast engines, got: {engine!r}")
+
+    with span("pptx.fingerprint"):
+        prints = slide_fingerprints(path)
+    selected = pptx_impl._select_indices(slides, len(prints))
+    variant = _variant(engine, use_llm, use_llm_multimodal, image_options, table_format)
+    stored = manifest.load(variant)
+
+    # 같은 내용의 슬라이드가 여러 장이면 한 번만 변환
+    todo: Dict[str, int] = {}
+    for i in selected:
+        if prints[i] not in stored and prints[i] not in todo:
+            todo[prints[i]] = i
+    changed = list(todo.values())
+
+    fresh: Dict[int, str] = {}
+    if changed:
+        if use_llm_multimodal:
+            fresh = pptx_impl._multimodal_slide_mds(
+                path, changed, llm_concurrency, llm_rate, llm_cache, image_options, pdf_cache_dir
+            )
+        else:
+            if engine == "fast":
+                from thomas_utils.converters.pptx_fast_impl import iter_slides
+            else:
+                iter_slides = pptx_impl.iter_slides
+            fresh = {c["slide"]: c["text"] for c in iter_slides(path, slides=changed, table_format=table_format)}
+        if use_llm:
+            fresh = _polish(fresh, changed, use_llm_multimodal, llm_concurrency, llm_rate, llm_cache)
+
+    current = set(prints)
+    blocks = {p: b for p, b in stored.items() if p in current}
+    blocks.update((prints[i], fresh[i]) for i in changed)
+    manifest.reused = len(selected) - len(changed)
+    manifest.converted = len(changed)
+    manifest.save(variant, blocks)
+
+    with span("pptx.finalize"):
+        ordered = [_renumber(blocks[prints[i]], i) for i in selected]
+        if use_llm:
+            result = pptx_impl._SLIDE_SEPARATOR.join(ordered) + "\n"
+        elif use_llm_multimodal:
+            result = pptx_impl._join_multimodal(ordered)
+        else:
+            result = pptx_impl._SLIDE_SEPARATOR.join(ordered)
+            result = result + "\n" if result else result
+    return result
+
+
+def _polish(
+    fresh: Dict[int, str],
+    changed: List[int],
+    multimodal: bool,
+    llm_concurrency: int,
+    llm_rate: Optional[float],
+    llm_cache: Optional["LLMCache"],
+) -> Dict[int, str]:
+    """LLM-polish the new blocks together; keeps the unpolished text if slide boundaries are lost."""
+    from thomas_utils.converters import pptx_impl
+
+    texts = [fresh[i] for i in changed]
+    join: Callable[[List[str]], str] = (
+        pptx_impl._join_multimodal if multimodal else (lambda t: pptx_impl._SLIDE_SEPARATOR.join(t) + "\n")
+    )
+    with span("llm.polish"):
+        polished = pptx_impl._split_slide_blocks(
+            pptx_impl._llm_polish(join(texts), llm_concurrency, llm_rate, llm_cache)
+        )
+    if len(polished) != len(changed):
+        polished = pptx_impl._split_slide_blocks(join(texts))
+        if len(polished) != len(changed):
+            return {i: t.strip() for i, t in zip(changed, texts)}
+    return dict(zip(changed, polished))
@@ -1,11 +1,25 @@
 """PowerPoint -> Markdown via Unstructured (optional engine)."""
 
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, Iterator, List, Optional, Union
 
+from thomas_utils.converters import ir
 
-def convert_unstructured(pptx_path: Union[str, Path]) -> str:
-    """Convert PPTX to Markdown using Unstructured. Output follows ## Slide N, ### Content template."""
+
+def convert_unstructured(pptx_path: Union[str, Path], slides: Optional[List[int]] = None) -> str:
+    """Convert PPTX to Markdown using Unstructured. Output follows ## Slide N, ### Content template.
+
+    slides: optional 0-based slide indices to keep (None = all).
+    """
+    return ir.to_markdown(ir.Document(Path(pptx_path).name, iter_units(pptx_path, slides)))
+
+
+def iter_units(pptx_path: Union[str, Path], slides: Optional[List[int]] = None) -> Iterator[ir.Slide]:
+    """IR slides from Unstructured elements (one paragraph per element; slides = page numbers).
+
+    Raises:
+        ValueError: A selected slide index is out of range (as with the other engines).
+    """
     try:
         from unstructured.partition.pptx import partition_pptx
     except ImportError as e:
@@ -18,39 +32,21 @@ def convert_unstructured(pptx_path: Union[str, Path]) -> str:
     if path.suffix.lower() != ".pptx":
         raise ValueError(f"Expected .pptx file, got: {path}")
 
-    elements = partition_pptx(str(path))
-    # Group by page_number if present; otherwise treat as single slide
-    slides_content: List[List[str]] = []
-    current: List[str] = []
-    current_page: int = 0
+    from thomas_utils.converters.pptx_impl import _select_indices
 
+    elements = partition_pptx(str(path))
+    # page_number(1-based)로 슬라이드를 묶고, 번호가 없는 요소는 직전 슬라이드에 붙임
+    slides_content: Dict[int, List[str]] = {}
+    current = 0
     for el in elements:
         page = getattr(getattr(el, "metadata", None), "page_number", None) if el else None
+        if page:
+            current = page - 1
         text = (el.text or "").strip() if hasattr(el, "text") else ""
-        if not text:
-            continue
-        if page is not None and page != current_page and current:
-            slides_content.append(current)
-            current = []
-            current_page = page
-        current.append(text)
-    if current:
-        slides_content.append(current)
-
-    if not slides_content:
-        slides_content = [[""]]
-
-    md_parts: List[str] = []
-    for i, parts in enumerate(slides_content):
-        block_lines = [
-            f"## Slide {i + 1}",
-            "**Type**: Content Slide",
-            "",
-            "### Content",
-            "",
-            "\n\n".join(parts).strip() or "",
-        ]
-        md_parts.append("\n".join(block_lines))
-        if i < len(slides_content) - 1:
-            md_parts.append("\n---\n\n")
-    return "\n".join(md_parts)
+        if text:
+            slides_content.setdefault(current, []).append(text)
+
+    count = max(slides_content, default=0) + 1
+    for i in _select_indices(slides, count):
+        shapes = [[ir.Paragraph(t)] for t in slides_content.get(i, [])]
+        yield ir.Slide(i, count, "Content Slide", shapes=shapes)
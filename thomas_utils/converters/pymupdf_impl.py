@@ -1,20 +1,127 @@
 """PyMuPDF4LLM-backed PDF -> Markdown conversion."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-import pymupdf4llm
+from thomas_utils.profiling import span
+
+# 워커 하나가 맡는 청크 수 (작업 불균형 완화용으로 워커 수보다 잘게 나눔)
+_CHUNKS_PER_WORKER = 4
+
+
+def _page_list(path: Path, pages: Optional[List[int]]) -> List[int]:
+    """Pages to convert, in document order: the given selection or every page.
+
+    pymupdf4llm.to_markdown (the serial path) sorts and dedupes pages, so the
+    chunked path does the same to produce identical output.
+    """
+    if pages is not None:
+        return sorted(set(pages))
+    import pymupdf
+
+    with pymupdf.open(str(path)) as doc:
+        return list(range(doc.page_count))
+
+
+def _header_info(path: Path) -> Any:
+    """Header-level info shared by all chunks, so chunked output matches the serial path.
+
+    Only the legacy (non-layout) pymupdf4llm path derives headers from font sizes
+    across the whole document; the layout path classifies each page on its own.
+    """
+    import pymupdf4llm
+
+    identify = getattr(pymupdf4llm, "IdentifyHeaders", None)
+    if identify is None:
+        return None
+    import pymupdf
+
+    with pymupdf.open(str(path)) as doc:
+        return identify(doc)
+
+
+def _convert_chunk(path: str, pages: List[int], hdr_info: Any = None) -> str:
+    """Worker entry point: Markdown for one contiguous run of pages."""
+    import pymupdf4llm
+
+    kwargs = {"hdr_info": hdr_info} if hdr_info is not None else {}
+    md = pymupdf4llm.to_markdown(path, pages=pages, **kwargs)
+    return md if isinstance(md, str) else md.decode("utf-8")
+
+
+def _split(pages: List[int], n_chunks: int) -> List[List[int]]:
+    """Split pages into at most n_chunks contiguous, near-equal runs (order preserved)."""
+    n_chunks = max(1, min(n_chunks, len(pages)))
+    size, extra = divmod(len(pages), n_chunks)
+    out: List[List[int]] = []
+    start = 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        out.append(pages[start:end])
+        start = end
+    return out
+
+
+def iter_convert(
+    pdf_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Convert PDF to Markdown one page at a time.
+
+    Yields a dict per page as soon as it is converted: "page" (0-based index),
+    "page_count" (pages in the document), "index"/"total" (position within the
+    selection) and "text" (Markdown). Joining the texts gives the same result as
+    convert(pdf_path, pages).
+
+    Args:
+        pdf_path: Path to the PDF file.
+        pages: Optional 0-based page indices to convert, in any order (yielded once
+               each, in document order). None means all pages.
+    """
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    with span("pymupdf.import"):
+        import pymupdf
+        import pymupdf4llm
+
+    with span("pymupdf.open"):
+        doc = pymupdf.open(str(path))
+    try:
+        page_list = _page_list(path, pages) if pages is not None else list(range(doc.page_count))
+        identify = getattr(pymupdf4llm, "IdentifyHeaders", None)
+        with span("pymupdf.headers"):
+            kwargs = {"hdr_info": identify(doc)} if identify is not None else {}
+        for i, pno in enumerate(page_list):
+            with span("pymupdf.page"):
+                md = pymupdf4llm.to_markdown(doc, pages=[pno], **kwargs)
+            yield {
+                "page": pno,
+                "page_count": doc.page_count,
+                "index": i,
+                "total": len(page_list),
+                "text": md if isinstance(md, str) else md.decode("utf-8"),
+            }
+    finally:
+        doc.close()
 
 
 def convert(
     pdf_path: Union[str, Path],
     pages: Optional[List[int]] = None,
+    workers: Optional[int] = None,
 ) -> str:
     """Convert PDF to Markdown using PyMuPDF4LLM.
 
     Args:
         pdf_path: Path to the PDF file.
-        pages: Optional 0-based page indices to convert. None means all pages.
+        pages: Optional 0-based page indices to convert, in any order (converted once each,
+               in document order). None means all pages.
+        workers: Number of processes for page-parallel conversion. None or 1 converts
+                 serially; with N > 1 the page list is split into contiguous chunks,
+                 converted in separate processes and joined in page order. The output
+                 is identical to the serial path.
 
     Returns:
         UTF-8 Markdown string.
@@ -22,5 +129,20 @@ def convert(
     path = Path(pdf_path)
     if not path.exists():
         raise FileNotFoundError(f"PDF not found: {path}")
-    md = pymupdf4llm.to_markdown(str(path), pages=pages)
-    return md if isinstance(md, str) else md.decode("utf-8")
+    if not workers or workers <= 1:
+        with span("pymupdf.import"):
+            import pymupdf4llm
+
+        with span("pymupdf.to_markdown"):
+            md = pymupdf4llm.to_markdown(str(path), pages=pages)
+        return md if isinstance(md, str) else md.decode("utf-8")
+
+    page_list = _page_list(path, pages)
+    if len(page_list) < 2:
+        return _convert_chunk(str(path), page_list)
+    with span("pymupdf.headers"):
+        hdr_info = _header_info(path)
+    chunks = _split(page_list, workers * _CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool, span("pymupdf.pool"):
+        parts = pool.map(_convert_chunk, [str(path)] * len(chunks), chunks, [hdr_info] * len(chunks))
+        return "".join(parts)
@@ -1,14 +1,19 @@
 """Engine registry and unified convert() API."""
 
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
-_ENGINES = ("pymupdf", "marker")
+if TYPE_CHECKING:
+    from thomas_utils.converters.cache import ConversionCache
+
+_ENGINES = ("pymupdf", "marker", "hybrid")
+_ALIASES = {"auto": "hybrid"}
 
 
 def get_engine(name: str) -> str:
-    """Return engine name if supported, else raise ValueError."""
+    """Return engine name if supported ("auto" is an alias of "hybrid"), else raise ValueError."""
     n = name.lower().strip()
+    n = _ALIASES.get(n, n)
     if n not in _ENGINES:
         raise ValueError(f"Unknown engine: {name}. Choose from {_ENGINES}.")
     return n
@@ -18,25 +23,79 @@ def convert(
     pdf_path: Union[str, Path],
     pages: Optional[List[int]] = None,
     engine: str = "pymupdf",
+    cache: Optional["ConversionCache"] = None,
+    workers: Optional[int] = None,
 ) -> str:
     """Convert PDF to Markdown.
 
     Args:
         pdf_path: Path to the PDF file.
         pages: Optional 0-based page indices. None = all pages.
-               For engine "marker", pages may be ignored (full doc converted).
-        engine: "pymupdf" (fast, default) or "marker" (high-fidelity).
+               For engine "marker", only these pages are copied into a subset PDF
+               and converted; page separators keep the original page numbers.
+        engine: "pymupdf" (fast, default), "marker" (high-fidelity) or "hybrid"/"auto"
+                (per page: marker only for scanned or graphics-heavy pages, see hybrid_impl).
+        cache: Optional ConversionCache; a hit skips the conversion entirely.
+        workers: Page-parallel worker processes for pymupdf pages (None/1 = serial).
 
     Returns:
         UTF-8 Markdown string.
     """
     eng = get_engine(engine)
+    if cache is not None:
+        if not Path(pdf_path).exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+        key = cache.key(pdf_path, eng, pages)
+        from thomas_utils.profiling import span
+
+        with span("cache.get"):
+            md = cache.get(key)
+        if md is None:
+            md = convert(pdf_path, pages=pages, engine=eng, workers=workers)
+            cache.put(key, md)
+        return md
     if eng == "pymupdf":
         from thomas_utils.converters.pymupdf_impl import convert as _convert
 
-        return _convert(pdf_path, pages=pages)
+        return _convert(pdf_path, pages=pages, workers=workers)
     if eng == "marker":
         from thomas_utils.converters.marker_impl import convert as _convert
 
         return _convert(pdf_path, pages=pages)
+    if eng == "hybrid":
+        from thomas_utils.converters.hybrid_impl import convert as _convert
+
+        return _convert(pdf_path, pages=pages, workers=workers)
     raise ValueError(f"Unknown engine: {engine}")
+
+
+def iter_convert(
+    pdf_path: Union[str, Path],
+    pages: Optional[List[int]] = None,
+    engine: str = "pymupdf",
+) -> Iterator[Dict[str, Any]]:
+    """Convert PDF to Markdown incrementally, yielding one chunk per page.
+
+    Each chunk is a dict with "page", "page_count", "index", "total" and "text";
+    see pymupdf_impl.iter_convert. Engines without per-page output ("marker")
+    yield a single chunk for the whole selection with "page" set to None.
+    "hybrid" chunks also carry the "engine" used for that page.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        pages: Optional 0-based page indices. None = all pages.
+        engine: "pymupdf" (fast, default), "marker" (high-fidelity) or "hybrid"/"auto".
+    """
+    eng = get_engine(engine)
+    if eng == "pymupdf":
+        from thomas_utils.converters.pymupdf_impl import iter_convert as _iter
+
+        yield from _iter(pdf_path, pages=pages)
+        return
+    if eng == "hybrid":
+        from thomas_utils.converters.hybrid_impl import iter_convert as _iter
+
+        yield from _iter(pdf_path, pages=pages)
+        return
+    text = convert(pdf_path, pages=pages, engine=eng)
+    yield {"page": None, "page_count": None, "index": 0, "total": 1, "text": text}
@@ -0,0 +1,186 @@
+"""Rasterization and encoding of slide images for vision LLM requests.
+
+ImageOptions controls render resolution (DPI or maximum edge length), output
+format and quality, grayscale conversion and cropping of empty margins. With
+format="auto" every candidate encoding (PNG, JPEG, WebP) is produced at the
+target size and the smallest one is sent.
+
+PNG/JPEG at a given size only need PyMuPDF; autocrop, WebP and "auto" use Pillow.
+
+render_pdf_pages() rasterizes a selection of pages, spread over a process pool
+when there are enough of them to pay for the worker start-up.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from thomas_utils.profiling import span
+
+FORMATS = ("png", "jpeg", "webp", "auto")
+
+# 이보다 적은 페이지는 프로세스 풀 기동 비용이 더 커서 직렬로 렌더
+_PARALLEL_MIN_PAGES = 8
+
+
+@dataclass(frozen=True)
+class ImageOptions:
+    """How slide images are rendered and encoded.
+
+    Attributes:
+        dpi: Render resolution in dots per inch. None = PyMuPDF default (72).
+        max_edge: Upper bound for the longer image edge in pixels (the legibility
+                  target for format="auto"). None = no bound.
+        format: "png", "jpeg", "webp" or "auto" (smallest of the three).
+        quality: JPEG/WebP quality 1-100.
+        grayscale: Convert to 8-bit grayscale.
+        autocrop: Trim uniform margins (colour of the top-left pixel).
+    """
+
+    dpi: Optional[int] = None
+    max_edge: Optional[int] = None
+    format: str = "png"
+    quality: int = 80
+    grayscale: bool = False
+    autocrop: bool = False
+
+    def __post_init__(self) -> None:
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown image format: {self.format}. Choose from {FORMATS}.")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"Image quality must be 1-100, got {self.quality}")
+
+    @property
+    def is_default(self) -> bool:
+        return self == ImageOptions()
+
+    @property
+    def needs_pillow(self) -> bool:
+        return self.autocrop or self.format in ("webp", "auto")
+
+
+def image_mime(data: bytes) -> str:
+    """MIME type from the image's magic bytes (PNG if unknown)."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+def _pillow():
+    try:
+        from PIL import Image, ImageChops
+    except ImportError as e:
+        raise ImportError(
+            "Pillow is required for autocrop / webp / auto image encoding. Install with: pip install pillow"
+        ) from e
+    return Image, ImageChops
+
+
+def _zoom(width: float, height: float, opts: ImageOptions) -> float:
+    zoom = (opts.dpi / 72.0) if opts.dpi else 1.0
+    if opts.max_edge:
+        zoom = min(zoom, opts.max_edge / max(width, height)) if opts.dpi else opts.max_edge / max(width, height)
+    return zoom
+
+
+def _encode_pil(im, opts: ImageOptions) -> bytes:
+    """Apply grayscale / autocrop / max_edge to a Pillow image and encode it per opts."""
+    Image, ImageChops = _pillow()
+    if opts.grayscale and im.mode != "L":
+        im = im.convert("L")
+    elif im.mode not in ("RGB", "L"):
+        im = im.convert("RGB")
+    if opts.autocrop:
+        bg = Image.new(im.mode, im.size, im.getpixel((0, 0)))
+        bbox = ImageChops.difference(im, bg).getbbox()
+        if bbox:
+            im = im.crop(bbox)
+    if opts.max_edge and max(im.size) > opts.max_edge:
+        scale = opts.max_edge / max(im.size)
+        im = im.resize((max(1, round(im.width * scale)), max(1, round(im.height * scale))), Image.LANCZOS)
+
+    def save(fmt: str) -> bytes:
+        buf = io.BytesIO()
+        if fmt == "png":
+            im.save(buf, "PNG", optimize=True)
+        elif fmt == "jpeg":
+            im.save(buf, "JPEG", quality=opts.quality, optimize=True)
+        else:
+            im.save(buf, "WEBP", quality=opts.quality, method=4)
+        return buf.getvalue()
+
+    if opts.format == "auto":
+        return min((save(f) for f in ("png", "jpeg", "webp")), key=len)
+    return save(opts.format)
+
+
+def render_page(page, opts: Optional[ImageOptions] = None) -> bytes:
+    """Rasterize one PyMuPDF page and encode it per opts (default: PNG at 72 dpi)."""
+    import pymupdf
+
+    opts = opts or ImageOptions()
+    zoom = _zoom(page.rect.width, page.rect.height, opts)
+    matrix = pymupdf.Matrix(zoom, zoom)
+    colorspace = pymupdf.csGRAY if opts.grayscale else pymupdf.csRGB
+    pix = page.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False)
+    if not opts.needs_pillow:
+        if opts.format == "jpeg":
+            return pix.tobytes("jpeg", jpg_quality=opts.quality)
+        return pix.tobytes("png")
+    Image, _ = _pillow()
+    mode = "L" if pix.n == 1 else "RGB"
+    return _encode_pil(Image.frombytes(mode, (pix.width, pix.height), pix.samples), opts)
+
+
+def reencode(data: bytes, opts: Optional[ImageOptions] = None) -> bytes:
+    """Re-encode an already rendered image (e.g. a PowerPoint PNG export) per opts.
+
+    dpi is not applied here (the export resolution is fixed); max_edge is.
+    """
+    if opts is None or opts.is_default:
+        return data
+    Image, _ = _pillow()
+    with Image.open(io.BytesIO(data)) as im:
+        im.load()
+        return _encode_pil(im, opts)
+
+
+def _render_chunk(pdf_path: str, pages: List[int], opts: Optional[ImageOptions]) -> List[Tuple[int, bytes]]:
+    """Worker entry point: open the PDF once and render the given pages."""
+    import pymupdf
+
+    with pymupdf.open(pdf_path) as doc:
+        return [(p, render_page(doc[p], opts)) for p in pages]
+
+
+def render_pdf_pages(
+    pdf_path: Union[str, Path],
+    pages: List[int],
+    opts: Optional[ImageOptions] = None,
+    workers: Optional[int] = None,
+) -> Dict[int, bytes]:
+    """Render the given 0-based pages of a PDF; returns {page: image bytes} in pages order.
+
+    Args:
+        pdf_path: PDF to render.
+        pages: Page indices (must be valid for the document).
+        opts: ImageOptions for every page. None = PNG at 72 dpi.
+        workers: Maximum render processes. None = CPU count; 1 renders serially.
+    """
+    workers = workers or os.cpu_count() or 1
+    with span("slides.rasterize"):
+        if workers <= 1 or len(pages) < _PARALLEL_MIN_PAGES:
+            return dict(_render_chunk(str(pdf_path), pages, opts))
+        n = min(workers, len(pages))
+        # 페이지를 번갈아 배정해 앞뒤 페이지 난이도 차이를 고르게 분산
+        chunks = [pages[i::n] for i in range(n)]
+        rendered: Dict[int, bytes] = {}
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            for part in pool.map(_render_chunk, [str(pdf_path)] * n, chunks, [opts] * n):
+                rendered.update(part)
+        return {p: rendered[p] for p in pages}
@@ -0,0 +1,352 @@
+"""Pool of headless LibreOffice instances for PPTX -> PDF conversion.
+
+Every slot owns its own user-profile directory, so conversions can run in
+parallel without fighting over one profile, and the profile stays initialised
+("warm") between conversions. When the LibreOffice Python bridge (``uno``) is
+importable, each slot also keeps a long-lived ``soffice --accept`` listener and
+converts over UNO, so no office process is started per file. Otherwise each
+conversion runs ``soffice --convert-to pdf`` against the slot's warm profile.
+
+A conversion that exceeds the timeout kills the slot's office process and
+resets the slot; the next request starts a fresh instance.
+
+cached_pdf() keeps converted PDFs in a caller-chosen directory keyed by the
+source file's SHA-256, so converting an unchanged deck again skips LibreOffice
+entirely. Nothing is cached unless a directory is given.
+"""
+
+import atexit
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional, Union
+
+from thomas_utils.profiling import span
+
+DEFAULT_SIZE = 2
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_PDF_CACHE_MAX_SIZE = "500M"
+# 리스너가 UNO 연결을 받을 때까지 기다리는 최대 시간(초)
+_LISTENER_START_TIMEOUT = 30.0
+
+_SOFFICE_MISSING = (
+    "soffice (LibreOffice)를 PATH에서 찾을 수 없습니다. "
+    "Windows에서는 PowerPoint를 쓰려면: pip install pywin32 를 설치하고 PowerPoint가 설치되어 있어야 합니다. "
+    "또는 LibreOffice를 설치한 뒤 'soffice'가 PATH에 있도록 하세요."
+)
+
+
+def _uno_available() -> bool:
+    try:
+        import uno  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _Slot:
+    """One LibreOffice instance: a private profile and, in UNO mode, a listener process."""
+
+    def __init__(self, index: int, soffice: str, root: Path):
+        self.index = index
+        self.soffice = soffice
+        self.profile = root / f"profile_{index}"
+        self.pipe = f"thomas_utils_{os.getpid()}_{index}_{uuid.uuid4().hex[:8]}"
+        self.proc: Optional[subprocess.Popen] = None
+        self.desktop = None
+        self.conversions = 0
+
+    @property
+    def profile_url(self) -> str:
+        return self.profile.resolve().as_uri()
+
+    def _base_args(self) -> List[str]:
+        return [
+            self.soffice,
+            f"-env:UserInstallation={self.profile_url}",
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            "--nodefault",
+        ]
+
+    # --- subprocess mode -------------------------------------------------
+
+    def run_convert(self, src: Path, outdir: Path, timeout: float) -> None:
+        try:
+            proc = subprocess.Popen(
+                self._base_args() + ["--convert-to", "pdf", "--outdir", str(outdir), str(src)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            raise FileNotFoundError(_SOFFICE_MISSING) from e
+        self.proc = proc
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.reset()
+            raise RuntimeError(f"LibreOffice conversion timed out after {timeout:.0f}s; instance restarted.")
+        finally:
+            self.proc = None
+        if returncode != 0:
+            raise RuntimeError(
+                "LibreOffice conversion failed. Install LibreOffice and ensure 'soffice' is in PATH."
+            )
+
+    # --- UNO listener mode -----------------------------------------------
+
+    def _start_listener(self) -> None:
+        import uno
+
+        try:
+            self.proc = subprocess.Popen(
+                self._base_args() + [f"--accept=pipe,name={self.pipe};urp;StarOffice.ComponentContext"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            raise FileNotFoundError(_SOFFICE_MISSING) from e
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + _LISTENER_START_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:pipe,name={self.pipe};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if self.proc.poll() is not None or time.monotonic() > deadline:
+                    self.reset()
+                    raise RuntimeError("LibreOffice listener did not start.")
+                time.sleep(0.2)
+        self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+    def uno_convert(self, src: Path, outdir: Path, timeout: float) -> None:
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            p = PropertyValue()
+            p.Name, p.Value = name, value
+            return p
+
+        if self.desktop is None or self.proc is None or self.proc.poll() is not None:
+            self.reset()
+            self._start_listener()
+        out = outdir / (src.stem + ".pdf")
+        error: List[BaseException] = []
+
+        def work() -> None:
+            try:
+                doc = self.desktop.loadComponentFromURL(
+                    uno.systemPathToFileUrl(str(src.resolve())), "_blank", 0, (prop("Hidden", True),)
+                )
+                try:
+                    doc.storeToURL(
+                        uno.systemPathToFileUrl(str(out.resolve())),
+                        (prop("FilterName", "impress_pdf_Export"),),
+                    )
+                finally:
+                    doc.close(True)
+            except BaseException as e:
+                error.append(e)
+
+        t = threading.Thread(target=work, daemon=True)
+        t.start()
+        t.join(timeout)
+        if t.is_alive():
+            self.reset()
+            raise RuntimeError(f"LibreOffice conversion timed out after {timeout:.0f}s; instance restarted.")
+        if error:
+            # 브리지가 끊긴 경우 다음 요청에서 새로 띄우도록 정리
+            self.reset()
+            raise RuntimeError(f"LibreOffice conversion failed: {error[0]}")
+
+    def reset(self) -> None:
+        """Kill the office process (if any) and discard the profile so the next use starts clean."""
+        proc, self.proc, self.desktop = self.proc, None, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                pass
+        shutil.rmtree(self.profile, ignore_errors=True)
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is not None and proc.poll() is None:
+            if self.desktop is not None:
+                try:
+                    self.desktop.terminate()
+                    proc.wait(timeout=5)
+                except Exception:
+                    pass
+            if proc.poll() is None:
+                proc.kill()
+        self.desktop = None
+
+
+class SofficePool:
+    """Fixed-size pool of LibreOffice slots; convert_to_pdf() blocks until a slot is free.
+
+    Args:
+        size: Number of instances (parallel conversions).
+        timeout: Seconds before a conversion is considered hung and its instance restarted.
+        soffice: LibreOffice executable.
+        use_uno: Keep listener processes and convert over UNO. None = when ``uno`` is importable.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        soffice: str = "soffice",
+        use_uno: Optional[bool] = None,
+    ):
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self.use_uno = _uno_available() if use_uno is None else use_uno
+        self._root = Path(tempfile.mkdtemp(prefix="thomas_utils_soffice_"))
+        self._slots = [_Slot(i, soffice, self._root) for i in range(self.size)]
+        self._free: "queue.Queue[_Slot]" = queue.Queue()
+        for slot in self._slots:
+            self._free.put(slot)
+        self._closed = False
+
+    def convert_to_pdf(self, src: Union[str, Path], outdir: Union[str, Path]) -> Path:
+        """Convert src (PPTX etc.) to PDF in outdir on a free instance and return the PDF path."""
+        if self._closed:
+            raise RuntimeError("SofficePool is closed.")
+        src, outdir = Path(src), Path(outdir)
+        slot = self._free.get()
+        try:
+            with span("soffice.convert"):
+                if self.use_uno:
+                    slot.uno_convert(src, outdir, self.timeout)
+                else:
+                    slot.run_convert(src, outdir, self.timeout)
+            slot.conversions += 1
+        finally:
+            self._free.put(slot)
+        pdf = outdir / (src.stem + ".pdf")
+        if not pdf.exists():
+            raise RuntimeError("LibreOffice did not produce PDF.")
+        return pdf
+
+    def close(self) -> None:
+        """Stop all instances and remove their profiles."""
+        if self._closed:
+            return
+        self._closed = True
+        for slot in self._slots:
+            slot.close()
+        shutil.rmtree(self._root, ignore_errors=True)
+
+
+_pool: Optional[SofficePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> SofficePool:
+    """Process-wide pool, created on first use.
+
+    Size and timeout come from THOMAS_UTILS_SOFFICE_POOL / THOMAS_UTILS_SOFFICE_TIMEOUT.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = SofficePool(
+                size=int(os.environ.get("THOMAS_UTILS_SOFFICE_POOL", DEFAULT_SIZE)),
+                timeout=float(os.environ.get("THOMAS_UTILS_SOFFICE_TIMEOUT", DEFAULT_TIMEOUT)),
+            )
+            atexit.register(_pool.close)
+        return _pool
+
+
+def _evict_pdfs(cache_dir: Path, max_size: int, keep: Path) -> None:
+    """Delete the least recently used PDFs until the directory fits in max_size."""
+    entries = []
+    for p in cache_dir.glob("*.pdf"):
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= max_size:
+            break
+        if p == keep:
+            continue
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def cached_pdf(
+    src: Union[str, Path],
+    cache_dir: Union[str, Path],
+    max_size: Optional[Union[int, str]] = None,
+    pool: Optional[SofficePool] = None,
+    out_dir: Optional[Union[str, Path]] = None,
+) -> Path:
+    """PDF rendering of src, converted on the pool only when its content is not cached yet.
+
+    Args:
+        src: Document to convert (PPTX etc.).
+        cache_dir: Cache directory (created if missing).
+        max_size: Cache size bound (bytes or '500M' style string); least recently used
+                  PDFs are evicted. None = THOMAS_UTILS_PDF_CACHE_MAX_SIZE or 500M.
+        pool: Pool to convert with on a miss. None = get_pool().
+        out_dir: Directory owned by the caller. The PDF is hard-linked (or copied) into
+                 it, so another process evicting the cache entry cannot delete it.
+
+    Returns:
+        Path of the PDF in out_dir, or of the cached PDF when out_dir is None (valid
+        until evicted; do not modify it).
+    """
+    from thomas_utils.converters.cache import file_digest, parse_size
+
+    src = Path(src)
+    cache_dir = Path(cache_dir)
+    dest = cache_dir / (file_digest(src) + ".pdf")
+
+    def claim(pdf: Path) -> Path:
+        if out_dir is None:
+            return pdf
+        target = Path(out_dir) / dest.name
+        try:
+            os.link(pdf, target)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            # 다른 파일시스템 등 하드 링크를 만들 수 없으면 복사
+            shutil.copyfile(pdf, target)
+        return target
+
+    if dest.is_file():
+        try:
+            os.utime(dest)
+            return claim(dest)
+        except FileNotFoundError:
+            pass  # 그 사이 다른 프로세스가 내보냄: 다시 변환
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # 같은 파일시스템의 임시 폴더에서 변환 후 원자적으로 이동 (동시 실행 안전)
+    with tempfile.TemporaryDirectory(dir=cache_dir) as tmp:
+        pdf = (pool or get_pool()).convert_to_pdf(src, tmp)
+        # 캐시에 넣기 전에 호출자 몫을 확보 (넣은 뒤에는 곧바로 내보내질 수 있음)
+        out = claim(pdf)
+        os.replace(pdf, dest)
+    limit = max_size if max_size is not None else os.environ.get("THOMAS_UTILS_PDF_CACHE_MAX_SIZE", DEFAULT_PDF_CACHE_MAX_SIZE)
+    _evict_pdfs(cache_dir, parse_size(limit), dest)
+    return dest if out_dir is None else out
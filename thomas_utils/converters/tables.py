@@ -0,0 +1,95 @@
+"""Dependency-free table rendering to GitHub-flavoured Markdown or HTML.
+
+A table is a grid of rows; each slot is a Cell, or None where a merged cell
+covers it. Markdown cannot express spans, so a merged cell's text is written
+once in its top-left slot and the covered slots stay empty. HTML output keeps
+colspan/rowspan. Column widths are computed in a single pass over the grid.
+"""
+
+import html
+import unicodedata
+from typing import List, NamedTuple, Optional, Sequence
+
+TABLE_FORMATS = ("markdown", "html", "auto")
+
+# 구분선 최소 폭 (GFM은 대시 3개 이상 필요)
+_MIN_WIDTH = 3
+
+
+class Cell(NamedTuple):
+    text: str
+    colspan: int = 1
+    rowspan: int = 1
+
+
+Grid = Sequence[Sequence[Optional[Cell]]]
+
+
+def display_width(s: str) -> int:
+    """Monospace display width: East Asian wide/fullwidth characters count as 2."""
+    if s.isascii():
+        return len(s)
+    # 넓은 문자는 U+1100 이상에만 있으므로 그 아래는 조회 생략
+    return len(s) + sum(1 for ch in s if ch >= "\u1100" and unicodedata.east_asian_width(ch) in "WF")
+
+
+def has_spans(grid: Grid) -> bool:
+    return any(c is None or c.colspan > 1 or c.rowspan > 1 for row in grid for c in row)
+
+
+def _md_text(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ").strip()
+
+
+def render_markdown(grid: Grid) -> str:
+    """GFM table with the first row as header; columns padded to a common width."""
+    if not grid:
+        return ""
+    col_count = max(len(r) for r in grid)
+    rows: List[List[str]] = []
+    widths = [_MIN_WIDTH] * col_count
+    for r in grid:
+        texts = [_md_text(c.text) if c is not None else "" for c in r]
+        texts.extend([""] * (col_count - len(texts)))
+        for i, t in enumerate(texts):
+            w = display_width(t)
+            if w > widths[i]:
+                widths[i] = w
+        rows.append(texts)
+
+    def line(texts: List[str]) -> str:
+        return "| " + " | ".join(t + " " * (widths[i] - display_width(t)) for i, t in enumerate(texts)) + " |"
+
+    out = [line(rows[0]), "|" + "|".join("-" * (w + 2) for w in widths) + "|"]
+    out.extend(line(r) for r in rows[1:])
+    return "\n".join(out)
+
+
+def render_html(grid: Grid) -> str:
+    """HTML table (first row as <th>) with colspan/rowspan; covered slots are omitted."""
+    out = ["<table>"]
+    for n, r in enumerate(grid):
+        tag = "th" if n == 0 else "td"
+        cells = []
+        for c in r:
+            if c is None:
+                continue
+            attrs = ""
+            if c.colspan > 1:
+                attrs += f' colspan="{c.colspan}"'
+            if c.rowspan > 1:
+                attrs += f' rowspan="{c.rowspan}"'
+            text = html.escape(c.text.strip()).replace("\n", "<br>")
+            cells.append(f"<{tag}{attrs}>{text}</{tag}>")
+        out.append("<tr>" + "".join(cells) + "</tr>")
+    out.append("</table>")
+    return "\n".join(out)
+
+
+def render(grid: Grid, table_format: str = "markdown") -> str:
+    """Render grid as "markdown", "html", or "auto" (HTML only when the table has merged cells)."""
+    if table_format not in TABLE_FORMATS:
+        raise ValueError(f"Unknown table format: {table_format}. Choose from {TABLE_FORMATS}.")
+    if table_format == "html" or (table_format == "auto" and has_spans(grid)):
+        return render_html(grid)
+    return render_markdown(grid)
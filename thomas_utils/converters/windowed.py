@@ -0,0 +1,193 @@
+"""Memory-bounded PDF -> Markdown: convert in page windows.
+
+Very large documents (thousands of scanned pages) are converted a window of
+pages at a time. After each window the engine's page objects are dropped, the
+MuPDF object store is emptied, garbage is collected and (on glibc) freed heap is
+returned to the OS, so memory does not grow with document size. Callers write
+each window's Markdown before the next window starts (see iter_windows).
+
+With a soft RSS ceiling, the window size adapts: the memory cost per page of the
+last window is used to pick the largest next window that still fits under the
+ceiling (never larger than the configured window, never smaller than one page).
+
+Output per engine:
+- pymupdf: identical to registry.convert (header levels are computed once for the
+  whole document, as in page-parallel conversion).
+- hybrid: identical to the hybrid engine (pages are routed independently anyway).
+- marker: each window is a separate marker run, so cross-page context (e.g. a
+  table continuing on the next page) is limited to the window.
+"""
+
+import gc
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from thomas_utils.profiling import span
+
+DEFAULT_WINDOW = 50
+# RSS 상한의 이 비율까지만 채우도록 다음 창 크기를 정함 (측정 오차 여유)
+_HEADROOM = 0.9
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (Linux /proc, else psutil); None if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def _release() -> None:
+    """Drop cached page objects and return freed memory to the OS where possible."""
+    pymupdf = sys.modules.get("pymupdf")
+    if pymupdf is not None:
+        pymupdf.TOOLS.store_shrink(100)
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    if sys.platform.startswith("linux"):
+        try:
+            import ctypes
+
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):
+            pass
+
+
+def next_window_size(
+    window: int,
+    max_rss: Optional[int],
+    pages_done: int,
+    rss_before: Optional[int],
+    rss_high: Optional[int],
+    rss_now: Optional[int],
+) -> int:
+    """Window size for the next window given the memory seen in the last one.
+
+    Args:
+        window: Configured (maximum) window size.
+        max_rss: Soft RSS ceiling in bytes, or None for a fixed window.
+        pages_done: Pages in the window just converted.
+        rss_before / rss_high / rss_now: RSS before that window, right after it was
+            converted (before release), and after release.
+    """
+    if not max_rss or None in (rss_before, rss_high, rss_now) or pages_done <= 0:
+        return window
+    budget = max_rss * _HEADROOM - rss_now
+    per_page = max(rss_high - rss_before, 0) / pages_done
+    if budget <= 0:
+        return 1
+    if per_page == 0:
+        return window
+    return max(1, min(window, int(budget // per_page)))
+
+
+def _page_count(path: Path) -> int:
+    import pymupdf
+
+    with pymupdf.open(str(path)) as doc:
+        return doc.page_count
+
+
+def iter_windows(
+    pdf_path: Union[str, Path],
+    engine: str = "pymupdf",
+    window: int = DEFAULT_WINDOW,
+    max_rss: Optional[Union[int, str]] = None,
+    pages: Optional[List[int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Convert a PDF window by window, yielding each window's Markdown.
+
+    Memory is released after the caller has consumed a window (i.e. when the next
+    one is requested), so write or otherwise dispose of each "text" before asking
+    for the next window.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        engine: "pymupdf" (default), "marker" or "hybrid"/"auto".
+        window: Maximum pages per window.
+        max_rss: Optional soft RSS ceiling (bytes or '2G' style string); the window
+                 shrinks as the process approaches it. Needs Linux or psutil.
+        pages: Optional 0-based page indices, converted once each in document order. None = all pages.
+
+    Yields:
+        Dicts with "pages" (indices in the window), "page_count", "index" (window
+        number), "window" (its size), "rss" (bytes after conversion, or None) and "text".
+    """
+    from thomas_utils.converters.registry import get_engine
+
+    eng = get_engine(engine)
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+    if isinstance(max_rss, str):
+        from thomas_utils.converters.cache import parse_size
+
+        max_rss = parse_size(max_rss)
+
+    page_count = _page_count(path)
+    # convert()와 같이 선택한 페이지를 문서 순서로 한 번씩 변환
+    page_list = sorted(set(pages)) if pages is not None else list(range(page_count))
+    bad = [p for p in page_list if p < 0 or p >= page_count]
+    if bad:
+        raise ValueError(f"Page index out of range: {bad[0]} (document has {page_count})")
+
+    if eng == "pymupdf":
+        from thomas_utils.converters.pymupdf_impl import _convert_chunk, _header_info
+
+        with span("pymupdf.headers"):
+            hdr_info = _header_info(path)
+
+        def convert_window(batch: List[int]) -> str:
+            return _convert_chunk(str(path), batch, hdr_info)
+
+    elif eng == "hybrid":
+        from thomas_utils.converters.hybrid_impl import iter_convert
+
+        def convert_window(batch: List[int]) -> str:
+            return "".join(c["text"] for c in iter_convert(path, pages=batch))
+
+    else:
+        from thomas_utils.converters import marker_impl
+
+        # 모델 메모리는 창마다 드는 비용이 아니므로 먼저 올려 두고 측정 기준에서 뺀다
+        marker_impl.preload()
+
+        def convert_window(batch: List[int]) -> str:
+            texts = marker_impl.convert_pages(path, batch)
+            return "".join(texts[p] + "\n\n" for p in dict.fromkeys(batch) if texts.get(p))
+
+    size = window
+    pos = 0
+    index = 0
+    while pos < len(page_list):
+        batch = page_list[pos : pos + size]
+        rss_before = current_rss()
+        with span("windowed.window"):
+            text = convert_window(batch)
+        rss_high = current_rss()
+        yield {
+            "pages": batch,
+            "page_count": page_count,
+            "index": index,
+            "window": len(batch),
+            "rss": rss_high,
+            "text": text,
+        }
+        del text
+        with span("windowed.release"):
+            _release()
+        pos += len(batch)
+        index += 1
+        size = next_window_size(window, max_rss, len(batch), rss_before, rss_high, current_rss())
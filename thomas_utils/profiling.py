@@ -0,0 +1,227 @@
+"""Stage-level timing (and optional tracemalloc peaks) for conversions.
+
+Converters wrap their stages in span("stage.name"). Spans are recorded only while
+a Profiler is active in the current context (see profile()); otherwise span()
+returns a shared no-op context manager, so instrumentation costs one ContextVar
+lookup per stage.
+
+    from thomas_utils import profiling
+
+    with profiling.profile(callback=print) as prof:
+        with profiling.document("deck.pptx"):
+            convert_pptx("deck.pptx")
+    prof.write("profile.json")
+
+Stage times are inclusive (a stage's time includes spans nested in it) and are
+aggregated per document and stage: count, total and max seconds, and with
+memory=True the largest tracemalloc peak above the allocation level at span start.
+"""
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+_ACTIVE: ContextVar[Optional["Profiler"]] = ContextVar("thomas_utils_profiler", default=None)
+_DOCUMENT: ContextVar[Optional[str]] = ContextVar("thomas_utils_profile_document", default=None)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Frame:
+    """Open span on the tracemalloc stack: allocation level at start, highest level seen."""
+
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.peak = start
+
+
+class _Span:
+    __slots__ = ("prof", "stage", "t0", "frame")
+
+    def __init__(self, prof: "Profiler", stage: str):
+        self.prof = prof
+        self.stage = stage
+
+    def __enter__(self) -> "_Span":
+        self.frame = self.prof._mem_enter() if self.prof.memory else None
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        seconds = time.perf_counter() - self.t0
+        peak = self.prof._mem_exit(self.frame) if self.frame is not None else None
+        self.prof._record(_DOCUMENT.get(), self.stage, seconds, peak)
+        return False
+
+
+class Profiler:
+    """Collects span timings per document and stage. Thread-safe.
+
+    Args:
+        memory: Also record tracemalloc peaks (tracing is started by profile() if needed).
+        callback: Called after every span with {"document", "stage", "seconds", "peak_bytes"}.
+    """
+
+    def __init__(
+        self,
+        memory: bool = False,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.memory = memory
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._docs: Dict[Optional[str], Dict[str, Any]] = {}
+        self._local = threading.local()
+
+    def _doc(self, name: Optional[str]) -> Dict[str, Any]:
+        doc = self._docs.get(name)
+        if doc is None:
+            doc = self._docs[name] = {"document": name, "seconds": 0.0, "stages": {}}
+        return doc
+
+    def _record(self, document: Optional[str], stage: str, seconds: float, peak: Optional[int]) -> None:
+        with self._lock:
+            st = self._doc(document)["stages"].setdefault(stage, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            st["count"] += 1
+            st["seconds"] += seconds
+            st["max_seconds"] = max(st["max_seconds"], seconds)
+            if peak is not None:
+                st["peak_bytes"] = max(st.get("peak_bytes", 0), peak)
+        if self.callback is not None:
+            self.callback({"document": document, "stage": stage, "seconds": seconds, "peak_bytes": peak})
+
+    def _mem_enter(self) -> _Frame:
+        # tracemalloc의 최대값은 전역 하나뿐이므로, 열린 상위 구간에 지금까지의 최대값을 넘겨준 뒤 초기화
+        stack = self._local.__dict__.setdefault("stack", [])
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in stack:
+            frame.peak = max(frame.peak, peak)
+        tracemalloc.reset_peak()
+        frame = _Frame(current)
+        stack.append(frame)
+        return frame
+
+    def _mem_exit(self, frame: _Frame) -> int:
+        stack = self._local.stack
+        frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+        stack.remove(frame)
+        for parent in stack:
+            parent.peak = max(parent.peak, frame.peak)
+        return frame.peak - frame.start
+
+    def add_document_time(self, document: Optional[str], seconds: float) -> None:
+        with self._lock:
+            self._doc(document)["seconds"] += seconds
+
+    def merge(self, documents: List[Dict[str, Any]]) -> None:
+        """Fold documents from another Profiler's report() (e.g. a worker process) into this one."""
+        with self._lock:
+            for other in documents:
+                doc = self._doc(other["document"])
+                doc["seconds"] += other["seconds"]
+                for stage, o in other["stages"].items():
+                    st = doc["stages"].setdefault(stage, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+                    st["count"] += o["count"]
+                    st["seconds"] += o["seconds"]
+                    st["max_seconds"] = max(st["max_seconds"], o["max_seconds"])
+                    if "peak_bytes" in o:
+                        st["peak_bytes"] = max(st.get("peak_bytes", 0), o["peak_bytes"])
+
+    def report(self) -> Dict[str, Any]:
+        """{"memory": bool, "documents": [{"document", "seconds", "stages": {stage: stats}}]}.
+
+        Stages are listed slowest first; seconds are rounded to microseconds.
+        """
+        with self._lock:
+            documents = []
+            for doc in self._docs.values():
+                stages = sorted(doc["stages"].items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+                documents.append(
+                    {
+                        "document": doc["document"],
+                        "seconds": round(doc["seconds"], 6),
+                        "stages": {
+                            name: dict(st, seconds=round(st["seconds"], 6), max_seconds=round(st["max_seconds"], 6))
+                            for name, st in stages
+                        },
+                    }
+                )
+        return {"memory": self.memory, "documents": documents}
+
+    def write(self, path: Union[str, Path]) -> None:
+        """Write report() as JSON to path."""
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(self.report(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def active() -> Optional[Profiler]:
+    """The Profiler recording in the current context, or None."""
+    return _ACTIVE.get()
+
+
+def span(stage: str):
+    """Context manager timing one stage; a shared no-op when no profiler is active."""
+    prof = _ACTIVE.get()
+    if prof is None:
+        return _NOOP
+    return _Span(prof, stage)
+
+
+@contextmanager
+def profile(
+    memory: bool = False,
+    callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Iterator[Profiler]:
+    """Activate a new Profiler for the enclosed code (and threads started via llm_client).
+
+    Args:
+        memory: Record tracemalloc peaks per stage. Tracing slows Python code
+                down noticeably, so keep it off when only timings are needed.
+        callback: Optional hook called after every span (see Profiler).
+    """
+    prof = Profiler(memory=memory, callback=callback)
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    token = _ACTIVE.set(prof)
+    try:
+        yield prof
+    finally:
+        _ACTIVE.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def document(name: Union[str, Path]) -> Iterator[None]:
+    """Attribute spans in the enclosed code to document `name` and time it as a whole."""
+    prof = _ACTIVE.get()
+    if prof is None:
+        yield
+        return
+    token = _DOCUMENT.set(str(name))
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        prof.add_document_time(str(name), time.perf_counter() - t0)
+        _DOCUMENT.reset(token)
@@ -0,0 +1,638 @@
+"""Long-running conversion service: warm engines behind a local HTTP job API.
+
+Every CLI invocation pays for interpreter start-up, heavy imports and model /
+LibreOffice warm-up. `thomas-utils serve` pays them once: conversion jobs are put
+on a bounded queue and run by a fixed set of workers that stay alive between
+requests, so engines (pymupdf4llm, python-pptx, marker models, the LibreOffice
+pool) are loaded once and reused.
+
+With one worker, jobs run in the server process itself. With more, each worker
+thread hands its job to a long-lived process pool (forked from the warm server
+before any thread starts, where the platform supports it; pymupdf is not
+thread-safe, so conversions never share a process concurrently). A pool whose
+worker died is rebuilt with forkserver/spawn, never by forking the then
+multithreaded server.
+
+Path jobs ({"path": ...}) read files on the server, so they are refused unless
+the service has an input root, and then only files under it are converted.
+
+HTTP API (JSON responses; listen on TCP or a Unix socket):
+
+    POST   /convert         JSON {"path": ...} (under the input root) or the raw
+                            document bytes as body.
+                            Options: engine, pages, pptx_engine, slides,
+                            table_format, wait (query string or JSON).
+                            wait (default) -> 200 with "markdown";
+                            wait=0 -> 202 with the job id.
+    GET    /jobs/<id>       Job status (with "markdown" when done). ?wait=SECONDS
+                            blocks until the job finishes or the time runs out.
+    DELETE /jobs/<id>       Forget a finished job.
+    GET    /metrics         Queue depth, running jobs, counters, latency percentiles.
+    GET    /health          {"status": "ok"}.
+
+A full queue answers 503, so callers can back off instead of piling up work.
+A path outside the input root (or any path without one) answers 403.
+"""
+
+import gc
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_KEEP_JOBS = 256
+DEFAULT_MAX_UPLOAD = "1G"
+# /metrics 지연 시간 백분위수 계산에 쓰는 최근 작업 수
+_LATENCY_WINDOW = 1000
+WARM_ENGINES = ("pymupdf", "pptx", "marker")
+
+_PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+@dataclass
+class Job:
+    """One conversion request and its outcome."""
+
+    id: str
+    spec: Dict[str, Any]
+    status: str = "queued"  # queued -> running -> done | failed
+    submitted: float = field(default_factory=time.perf_counter)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    markdown: Optional[str] = None
+    error: Optional[str] = None
+    upload: Optional[Path] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+    def to_dict(self, markdown: bool = True) -> Dict[str, Any]:
+        now = time.perf_counter()
+        out: Dict[str, Any] = {
+            "id": self.id,
+            "status": self.status,
+            "input": self.spec.get("name") or self.spec["path"],
+            "kind": self.spec["kind"],
+            "queued_seconds": round((self.started or now) - self.submitted, 6),
+        }
+        if self.started is not None:
+            out["run_seconds"] = round((self.finished or now) - self.started, 6)
+        if self.error is not None:
+            out["error"] = self.error
+        if markdown and self.markdown is not None:
+            out["markdown"] = self.markdown
+        return out
+
+
+def _run_job(spec: Dict[str, Any]) -> str:
+    """Convert one job spec to Markdown (runs in the server or a pool worker)."""
+    cache = None
+    if spec.get("cache_dir"):
+        from thomas_utils.converters.cache import ConversionCache
+
+        cache = ConversionCache(spec["cache_dir"], max_size=spec.get("cache_max_size"))
+    if spec["kind"] == "pptx":
+        from thomas_utils.converters.pptx_impl import convert as convert_pptx
+
+        return convert_pptx(
+            spec["path"],
+            slides=spec.get("slides"),
+            engine=spec.get("pptx_engine", "python-pptx"),
+            cache=cache,
+            table_format=spec.get("table_format", "markdown"),
+        )
+    from thomas_utils.converters.registry import convert
+
+    return convert(spec["path"], pages=spec.get("pages"), engine=spec.get("engine", "pymupdf"), cache=cache)
+
+
+def warm(engines: Iterable[str]) -> None:
+    """Import (and for marker, load the models of) the given engines now."""
+    for name in engines:
+        if name == "pymupdf":
+            import pymupdf4llm  # noqa: F401
+        elif name == "pptx":
+            import pptx  # noqa: F401
+        elif name == "marker":
+            from thomas_utils.converters import marker_impl
+
+            marker_impl.preload()
+        else:
+            raise ValueError(f"Unknown engine to warm: {name!r} (expected one of {', '.join(WARM_ENGINES)})")
+
+
+def _init_pool_worker(engines: Tuple[str, ...]) -> None:
+    from thomas_utils.converters.batch import _init_forked_worker
+
+    _init_forked_worker()
+    warm(engines)
+
+
+def _noop() -> None:
+    pass
+
+
+def _percentiles(samples: Iterable[float]) -> Dict[str, float]:
+    values = sorted(samples)
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+
+    def rank(q: float) -> float:
+        return round(values[min(len(values) - 1, int(q * len(values)))], 6)
+
+    return {"p50": rank(0.5), "p95": rank(0.95), "max": round(values[-1], 6)}
+
+
+class ConversionService:
+    """Bounded job queue in front of a fixed set of warm conversion workers.
+
+    Args:
+        workers: Concurrent conversions. 1 = run jobs in this process; more = a
+                 persistent process pool of that size. None = os.cpu_count().
+        queue_size: Jobs that may wait for a worker; submit() raises queue.Full beyond it.
+        warm: Engines to load up front ("pymupdf", "pptx", "marker") in every worker.
+        cache_dir: Optional ConversionCache directory used for every job.
+        cache_max_size: LRU size bound for cache_dir (bytes or '500M' style string).
+        keep_jobs: Finished jobs remembered for GET /jobs/<id>; the oldest are forgotten first.
+        input_root: Directory that path jobs may read from (relative paths are resolved
+                    against it). None = only uploaded documents are accepted.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        warm: Iterable[str] = (),
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_max_size: Optional[Union[int, str]] = None,
+        keep_jobs: int = DEFAULT_KEEP_JOBS,
+        input_root: Optional[Union[str, Path]] = None,
+    ):
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.warm = tuple(warm)
+        for name in self.warm:
+            if name not in WARM_ENGINES:
+                raise ValueError(f"Unknown engine to warm: {name!r} (expected one of {', '.join(WARM_ENGINES)})")
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self.cache_max_size = cache_max_size
+        self.keep_jobs = keep_jobs
+        self.input_root = Path(input_root).resolve() if input_root else None
+        if self.input_root is not None and not self.input_root.is_dir():
+            raise ValueError(f"Input root is not a directory: {self.input_root}")
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._threads: List[threading.Thread] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # 풀 재시작은 오래 걸리므로 작업 목록 잠금과 분리
+        self._pool_lock = threading.Lock()
+        self._uploads = Path(tempfile.mkdtemp(prefix="thomas_utils_serve_"))
+        self._running = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._latency: Dict[str, deque] = {k: deque(maxlen=_LATENCY_WINDOW) for k in ("queue", "run", "total")}
+        self._started_at = time.perf_counter()
+        self._closed = False
+
+    # --- lifecycle -------------------------------------------------------
+
+    def _new_pool(self, fork: bool) -> ProcessPoolExecutor:
+        """Process pool of self.workers; fork only while this process has no other threads."""
+        methods = multiprocessing.get_all_start_methods()
+        if fork and "fork" in methods:
+            # 서버에서 이미 올린 엔진(특히 marker 모델)을 fork로 물려받는다
+            ctx = multiprocessing.get_context("fork")
+            if "marker" in self.warm:
+                # batch의 prefork와 같이 모델 객체를 GC 스캔에서 빼 copy-on-write 공유 유지
+                gc.collect()
+                gc.freeze()
+        else:
+            # 스레드가 잠금(logging, sqlite 등)을 쥔 채 fork되면 자식이 멈출 수 있으므로 새 인터프리터로 시작
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            fork = False
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=ctx,
+            initializer=_init_pool_worker,
+            initargs=(() if fork else self.warm,),
+        )
+        # 워커 프로세스를 지금 띄워 첫 요청이 기동 비용을 내지 않도록 함
+        pool.submit(_noop).result()
+        return pool
+
+    def start(self) -> "ConversionService":
+        """Warm the engines, start the workers and return self."""
+        warm(self.warm)
+        if self.workers > 1:
+            # 스레드를 띄우기 전에 fork
+            self._pool = self._new_pool(fork=True)
+        for i in range(self.workers):
+            t = threading.Thread(target=self._work, name=f"thomas-utils-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def close(self) -> None:
+        """Finish the queued jobs, stop the workers and remove uploaded files."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+        if self._pool is not None:
+            self._pool.shutdown()
+        shutil.rmtree(self._uploads, ignore_errors=True)
+
+    def __enter__(self) -> "ConversionService":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # --- jobs ------------------------------------------------------------
+
+    def submit(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        data: Optional[bytes] = None,
+        kind: Optional[str] = None,
+        name: Optional[str] = None,
+        engine: str = "pymupdf",
+        pages: Optional[List[int]] = None,
+        pptx_engine: str = "python-pptx",
+        slides: Optional[List[int]] = None,
+        table_format: str = "markdown",
+    ) -> Job:
+        """Queue a conversion of a file path or of uploaded document bytes.
+
+        Args:
+            path: Document on the server's file system, under input_root.
+            data: Document bytes (instead of path); kept in a temporary file until converted.
+            kind: "pdf" or "pptx". None = from the path suffix or the leading bytes.
+            name: Display name for uploads (reported as the job's input).
+            engine, pages: PDF options (see registry.convert).
+            pptx_engine, slides, table_format: PPTX options (see pptx_impl.convert).
+
+        Raises:
+            ValueError: Bad options or unknown document type.
+            PermissionError: path is outside input_root, or the service has none (HTTP 403).
+            FileNotFoundError: path does not exist.
+            queue.Full: The queue is full (HTTP 503).
+        """
+        from thomas_utils.converters.registry import get_engine
+
+        if self._closed:
+            raise RuntimeError("ConversionService is closed.")
+        if (path is None) == (data is None):
+            raise ValueError("Give exactly one of path or data")
+        if path is not None:
+            path = self._resolve_input(path)
+            if not path.is_file():
+                raise FileNotFoundError(f"Input not found: {path}")
+            kind = kind or path.suffix.lower().lstrip(".")
+        elif kind is None:
+            kind = "pdf" if data.startswith(b"%PDF") else "pptx" if data.startswith(b"PK") else None
+        if kind not in ("pdf", "pptx"):
+            raise ValueError(f"Unsupported document type: {kind!r} (expected pdf or pptx)")
+        if pptx_engine not in ("python-pptx", "fast", "unstructured"):
+            raise ValueError(f"Unknown pptx engine: {pptx_engine!r}")
+        if table_format not in ("markdown", "html", "auto"):
+            raise ValueError(f"Unknown table format: {table_format!r}")
+
+        job = Job(
+            id=uuid.uuid4().hex,
+            spec={
+                "kind": kind,
+                "path": str(path) if path is not None else None,
+                "name": name or (f"upload.{kind}" if data is not None else None),
+                "engine": get_engine(engine),
+                "pages": pages,
+                "pptx_engine": pptx_engine,
+                "slides": slides,
+                "table_format": table_format,
+                "cache_dir": self.cache_dir,
+                "cache_max_size": self.cache_max_size,
+            },
+        )
+        if data is not None:
+            job.upload = self._uploads / f"{job.id}.{kind}"
+            job.upload.write_bytes(data)
+            job.spec["path"] = str(job.upload)
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._counts["rejected"] += 1
+                if job.upload is not None:
+                    job.upload.unlink(missing_ok=True)
+                raise
+            self._counts["submitted"] += 1
+            self._jobs[job.id] = job
+        return job
+
+    def _resolve_input(self, path: Union[str, Path]) -> Path:
+        """path resolved against input_root; PermissionError if it lies outside (symlinks followed)."""
+        if self.input_root is None:
+            raise PermissionError("Path jobs are disabled; start the service with an input root (--input-root)")
+        resolved = (self.input_root / path).resolve()
+        if not resolved.is_relative_to(self.input_root):
+            raise PermissionError(f"Path is outside the input root: {path}")
+        return resolved
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def forget(self, job_id: str) -> bool:
+        """Drop a finished job (and its Markdown); False if unknown or still pending."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.done.is_set():
+                return False
+            del self._jobs[job_id]
+            return True
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                job.status = "running"
+                job.started = time.perf_counter()
+                self._running += 1
+            try:
+                job.markdown = self._execute(job.spec)
+                job.status = "done"
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+                job.status = "failed"
+            finally:
+                job.finished = time.perf_counter()
+                if job.upload is not None:
+                    job.upload.unlink(missing_ok=True)
+                with self._lock:
+                    self._running -= 1
+                    self._counts["completed" if job.status == "done" else "failed"] += 1
+                    self._latency["queue"].append(job.started - job.submitted)
+                    self._latency["run"].append(job.finished - job.started)
+                    self._latency["total"].append(job.finished - job.submitted)
+                    self._jobs.move_to_end(job.id)
+                    self._evict()
+                job.done.set()
+
+    def _execute(self, spec: Dict[str, Any]) -> str:
+        if self._pool is None:
+            return _run_job(spec)
+        pool = self._pool
+        try:
+            return pool.submit(_run_job, spec).result()
+        except BrokenProcessPool:
+            # 워커가 죽으면(메모리 부족 등) 풀을 새로 만들고 이 작업만 실패 처리
+            with self._pool_lock:
+                if self._pool is pool and not self._closed:
+                    self._pool = self._new_pool(fork=False)
+                    pool.shutdown(wait=False)
+            raise RuntimeError("Worker process died during conversion; the pool was restarted.")
+
+    def _evict(self) -> None:
+        # 끝난 작업은 완료 순으로 뒤에 붙으므로 앞쪽의 끝난 작업부터 버림
+        finished = [k for k, j in self._jobs.items() if j.finished is not None]
+        for job_id in finished[: max(0, len(finished) - self.keep_jobs)]:
+            del self._jobs[job_id]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, running jobs, counters and latency percentiles (recent jobs)."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "mode": "process" if self._pool is not None else "in-process",
+                "queue_depth": self._queue.qsize(),
+                "queue_size": self._queue.maxsize,
+                "running": self._running,
+                "jobs": dict(self._counts),
+                "latency_seconds": {k: _percentiles(v) for k, v in self._latency.items()},
+                "uptime_seconds": round(time.perf_counter() - self._started_at, 3),
+            }
+
+
+# --- HTTP ----------------------------------------------------------------
+
+
+def _int_list(value: Any) -> Optional[List[int]]:
+    """Page / slide selection from JSON (list of ints) or a query string ('0,1,2' / '0-5')."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, list):
+        return [int(v) for v in value]
+    from thomas_utils.cli import _parse_pages
+
+    return _parse_pages(str(value))
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() not in ("0", "false", "no", "off", "")
+    return bool(value)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: ConversionService
+    max_upload: int
+    server_version = "thomas-utils"
+    protocol_version = "HTTP/1.1"
+    quiet = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.quiet:
+            sys.stderr.write(f"{self.log_date_time_string()} {format % args}\n")
+
+    def _send(self, code: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _job_response(self, job: Job) -> None:
+        code = 200 if job.status in ("done", "failed") else 202
+        self._send(code, job.to_dict(), {"Location": f"/jobs/{job.id}"})
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif url.path == "/metrics":
+            self._send(200, self.service.metrics())
+        elif url.path.startswith("/jobs/"):
+            job = self.service.get(url.path[len("/jobs/") :])
+            if job is None:
+                self._send(404, {"error": "unknown job"})
+                return
+            wait = parse_qs(url.query).get("wait")
+            if wait:
+                try:
+                    job.done.wait(float(wait[0]))
+                except ValueError:
+                    self._send(400, {"error": f"bad wait: {wait[0]!r}"})
+                    return
+            self._job_response(job)
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_DELETE(self) -> None:
+        url = urlsplit(self.path)
+        if url.path.startswith("/jobs/") and self.service.forget(url.path[len("/jobs/") :]):
+            self._send(200, {"deleted": True})
+        else:
+            self._send(404, {"error": "unknown or unfinished job"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/convert":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # 본문 길이를 알 수 없으면 읽지 않고 연결을 닫음
+            self.close_connection = True
+            self._send(400, {"error": "bad Content-Length"})
+            return
+        if length > self.max_upload:
+            self.close_connection = True
+            self._send(413, {"error": f"body larger than {self.max_upload} bytes"})
+            return
+        body = self.rfile.read(length)
+        params: Dict[str, Any] = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        ctype = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        try:
+            if ctype == "application/json":
+                params.update(json.loads(body or b"{}"))
+                source: Dict[str, Any] = {"path": params.get("path")}
+                if not source["path"]:
+                    raise ValueError("JSON requests need a 'path'; send other documents as the raw body")
+            else:
+                kind = params.get("type") or {"application/pdf": "pdf", _PPTX_MIME: "pptx"}.get(ctype)
+                source = {"data": body, "kind": kind, "name": params.get("filename")}
+            wait = _truthy(params.get("wait", True))
+            job = self.service.submit(
+                engine=params.get("engine", "pymupdf"),
+                pages=_int_list(params.get("pages")),
+                pptx_engine=params.get("pptx_engine", "python-pptx"),
+                slides=_int_list(params.get("slides")),
+                table_format=params.get("table_format", "markdown"),
+                **source,
+            )
+        except queue.Full:
+            self._send(503, {"error": "queue full"}, {"Retry-After": "1"})
+            return
+        except PermissionError as e:
+            self._send(403, {"error": str(e)})
+            return
+        except FileNotFoundError as e:
+            self._send(404, {"error": str(e)})
+            return
+        except (ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        if wait:
+            job.done.wait()
+            self.service.forget(job.id)
+        self._job_response(job)
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        # 이전 실행이 남긴 소켓 파일 제거
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+class _UnixHandler(_Handler):
+    def address_string(self) -> str:
+        return "unix"
+
+
+def make_server(
+    service: ConversionService,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[Union[str, Path]] = None,
+    max_upload: Union[int, str] = DEFAULT_MAX_UPLOAD,
+    quiet: bool = True,
+) -> socketserver.BaseServer:
+    """HTTP server for service on host:port, or on a Unix socket when socket_path is set.
+
+    Call serve_forever() on the result (and shutdown()/server_close() to stop).
+    """
+    from thomas_utils.converters.cache import parse_size
+
+    attrs = {"service": service, "max_upload": parse_size(max_upload), "quiet": quiet}
+    if socket_path is not None:
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise ValueError("Unix sockets are not supported on this platform; use --host/--port")
+        return _UnixHTTPServer(str(socket_path), type("Handler", (_UnixHandler,), attrs))
+    return ThreadingHTTPServer((host, port), type("Handler", (_Handler,), attrs))
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[Union[str, Path]] = None,
+    max_upload: Union[int, str] = DEFAULT_MAX_UPLOAD,
+    quiet: bool = True,
+    **service_options: Any,
+) -> None:
+    """Run a ConversionService behind HTTP until interrupted (Ctrl-C / SIGTERM)."""
+    import signal
+
+    with ConversionService(**service_options) as service:
+        server = make_server(service, host, port, socket_path, max_upload, quiet)
+
+        def stop(*_: Any) -> None:
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, stop)
+        where = f"unix:{socket_path}" if socket_path is not None else f"http://{host}:{server.server_address[1]}"
+        print(f"Serving on {where} ({service.workers} workers)", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()